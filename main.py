@@ -1,3 +1,5 @@
+from heapq import heappush, heappop
+
 from tmp import tmp, tmp_bandwidth
 
 
@@ -90,9 +92,21 @@ class Environment(BandwidthObservable):
 
 class Event:
     def __init__(self, execution_time: float, environment: Environment):
-        self.execution_time = execution_time
+        # set by EventQueue.push, changing execution_time afterwards reschedules the event
+        self.queue = None
+        self._execution_time = execution_time
         self.environment = environment
 
+    @property
+    def execution_time(self) -> float:
+        return self._execution_time
+
+    @execution_time.setter
+    def execution_time(self, execution_time: float):
+        self._execution_time = execution_time
+        if self.queue is not None:
+            self.queue.reschedule(self)
+
     def execute_event(self) -> []:
         if self.execution_time < self.environment.simulation_time:
             raise RuntimeError("Event is happening in the past")
@@ -143,18 +157,52 @@ class DownloadEvent(Event, BandwidthObserver):
             raise RuntimeError("Download already finished")
 
 
+class EventQueue:
+    # priority queue of events by execution time, equal times in the order the events were pushed
+    # rescheduled events are pushed again, their old heap entries are skipped when they come up (lazy invalidation)
+    def __init__(self):
+        self.heap = []
+        # event -> (sequence number, version of the valid heap entry)
+        self.entries = {}
+        self.sequence = 0
+
+    def __len__(self):
+        return self.entries.__len__()
+
+    def push(self, event: Event):
+        self.entries[event] = (self.sequence, 0)
+        heappush(self.heap, (event.execution_time, self.sequence, 0, event))
+        self.sequence += 1
+        event.queue = self
+
+    def reschedule(self, event: Event):
+        # keeps the sequence number, a rescheduled event is not moved behind events pushed after it
+        sequence, version = self.entries[event]
+        self.entries[event] = (sequence, version + 1)
+        heappush(self.heap, (event.execution_time, sequence, version + 1, event))
+
+    def pop(self) -> Event:
+        while True:
+            execution_time, sequence, version, event = heappop(self.heap)
+            if self.entries.get(event) == (sequence, version):
+                del self.entries[event]
+                event.queue = None
+                return event
+
+
 env = Environment(0, 0)
 env.tile_matrix = tmp
 env.segment_deadlines = [5.3 for _ in env.tile_matrix]
 env.bandwidth_trace = tmp_bandwidth
 env.bandwidth = tmp_bandwidth[0][1]
 segment = env.get_next_segment()
-event_list = [DownloadEvent(segment.__len__() / env.bandwidth, env, segment)]
+event_queue = EventQueue()
+event_queue.push(DownloadEvent(segment.__len__() / env.bandwidth, env, segment))
 count = 1
-while event_list.__len__() > 0:
-    event = sorted(event_list, key=lambda event: event.execution_time)[0]
-    event_list.remove(event)
-    event_list.extend(event.execute_event())
+while event_queue.__len__() > 0:
+    event = event_queue.pop()
+    for next_event in event.execute_event():
+        event_queue.push(next_event)
     count += 1
 print(count)
 print(env.simulation_time)
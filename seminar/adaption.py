@@ -2,16 +2,20 @@ from numpy import linspace
 
 from seminar.bandwidth import BandwidthManager
 from seminar.buffer import Buffer
+from seminar.throughput import ThroughputEstimator
 
 
 class DualAdaption:
     # representation_byte_rates, b_min, b_low, b_high
-    def __init__(self, bandwidth_manager: BandwidthManager, buffer, short_factor, short_param, long_param):
+    # throughput_estimator: measured throughput instead of the bandwidth trace averages (oracle) if given
+    def __init__(self, bandwidth_manager: BandwidthManager, buffer, short_factor, short_param, long_param,
+                 throughput_estimator: ThroughputEstimator = None):
         self.a = [0.85, 0.85, 0.85, 0.75, 0.9]
         self.delta_beta = 1
         self.delta_t = 5
 
         self.bandwidth_manager = bandwidth_manager
+        self.throughput_estimator = throughput_estimator
 
         self.short_factor = short_factor
         self.short_param = short_param
@@ -61,8 +65,12 @@ class DualAdaption:
         r_next = segment.representation
 
         r_n = segment.representation
-        average_throughput = self.bandwidth_manager.get_average_bandwidth(t - self.delta_t, t) * bandwidth_factor
-        segment_throughput = self.bandwidth_manager.get_average_bandwidth(t - segment.duration, t) * bandwidth_factor
+        if self.throughput_estimator is not None and self.throughput_estimator.__len__() > 0:
+            average_throughput = self.throughput_estimator.estimate() * bandwidth_factor
+            segment_throughput = self.throughput_estimator.last * bandwidth_factor
+        else:
+            average_throughput = self.bandwidth_manager.get_average_bandwidth(t - self.delta_t, t) * bandwidth_factor
+            segment_throughput = self.bandwidth_manager.get_average_bandwidth(t - segment.duration, t) * bandwidth_factor
 
         if running_fast_start \
                 and r_n != r_max \
@@ -100,9 +108,10 @@ class DualAdaption:
         # print(buffer_level, b_delay)
         return r_next, b_delay if b_delay == 0 else max(buffer_level - b_delay, 0), running_fast_start
 
+    # a few scalar queries are cheaper than one buffer_level_short_many call, that pays off for long time arrays
     def monoton_short(self, time):
         steps = 5
-        tmp = [self.buffer.buffer_level_short(i) for i in linspace(0, time, steps, endpoint=True)]
+        tmp = [self.buffer.buffer_level_short(i) for i in linspace(0, time, steps, endpoint=True).tolist()]
         for i in range(0, steps - 1):
             if tmp[i] > tmp[i + 1]:
                 return False
@@ -110,7 +119,7 @@ class DualAdaption:
 
     def monoton_long(self, time):
         steps = 5
-        tmp = [self.buffer.buffer_level(i) for i in linspace(0, time, steps, endpoint=True)]
+        tmp = [self.buffer.buffer_level(i) for i in linspace(0, time, steps, endpoint=True).tolist()]
         for i in range(0, steps - 1):
             if tmp[i] > tmp[i + 1]:
                 return False
@@ -118,7 +127,9 @@ class DualAdaption:
 
 
 class Name:
-    def __init__(self, buffer: Buffer, representation_byte_rates, b_min, b_low, b_high):
+    # throughput_estimator: fed with the downloaded segments of buffer and used instead of rescanning them
+    def __init__(self, buffer: Buffer, representation_byte_rates, b_min, b_low, b_high,
+                 throughput_estimator: ThroughputEstimator = None):
         # safety margins, values used by the paper
         self.a = [0.75, 0.33, 0.5, 0.75, 0.9, 1]
         self.delta_beta = 1
@@ -136,6 +147,9 @@ class Name:
         self.running_fast_start = True
 
         self.buffer = buffer
+        self.throughput_estimator = throughput_estimator
+        # downloaded segments already added to throughput_estimator
+        self.estimated_segments = 0
 
     def get(self):
         start, t, segment = self.buffer.downloaded_segments[-1]
@@ -144,7 +158,11 @@ class Name:
 
         r_n = segment.representation
         buffer_level = self.buffer_level(t)
-        average_throughput = self.average_throughput(t - self.delta_t, t)
+        if self.throughput_estimator is not None:
+            self.update_throughput_estimator()
+            average_throughput = self.throughput_estimator.estimate()
+        else:
+            average_throughput = self.average_throughput(t - self.delta_t, t)
 
         if self.running_fast_start \
                 and r_n != self.r_max \
@@ -166,7 +184,7 @@ class Name:
             if buffer_level < self.b_min:
                 r_next = self.r_min
             elif buffer_level < self.b_low:
-                if r_n != self.r_min and self.r[r_n] >= self.segment_throughput(segment.segment_index) * self.a[5]:
+                if r_n != self.r_min and self.r[r_n] >= self.last_segment_throughput(segment) * self.a[5]:
                     r_next = r_n - 1
             elif buffer_level < self.b_high:
                 if r_n == self.r_max or self.r[r_n + 1] >= self.a[4] * average_throughput:
@@ -182,12 +200,24 @@ class Name:
 
     def monoton(self, time):
         steps = 10
-        tmp = [self.buffer_level(i) for i in linspace(0, time, steps, endpoint=True)]
+        tmp = [self.buffer_level(i) for i in linspace(0, time, steps, endpoint=True).tolist()]
         for i in range(0, steps - 1):
             if tmp[i] > tmp[i + 1]:
                 return False
         return True
 
+    def update_throughput_estimator(self):
+        segments = self.buffer.downloaded_segments
+        while self.estimated_segments < segments.__len__():
+            start, end, segment = segments[self.estimated_segments]
+            self.throughput_estimator.add(segment.__len__(), end - start)
+            self.estimated_segments += 1
+
+    def last_segment_throughput(self, segment):
+        if self.throughput_estimator is not None:
+            return self.throughput_estimator.last
+        return self.segment_throughput(segment.segment_index)
+
     def segment_throughput(self, index):
         start, end, segment = self.buffer.downloaded_segments[index]
         return (segment.__len__()) / (end - start)
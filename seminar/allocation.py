@@ -0,0 +1,62 @@
+import numpy
+
+
+# indices of the qualities on the upper concave hull of the points (size, value), by increasing size
+# qualities with at least the size of a cheaper one but not more value are dominated and left out
+def upper_hull(sizes, values) -> list:
+    order = sorted(range(0, sizes.__len__()), key=lambda q: (sizes[q], -values[q]))
+    hull = []
+    for q in order:
+        if hull.__len__() > 0 and values[q] <= values[hull[-1]]:
+            continue
+        while hull.__len__() >= 2:
+            a, b = hull[-2], hull[-1]
+            # b on or below the line from a to q
+            if (values[b] - values[a]) * (sizes[q] - sizes[a]) <= (values[q] - values[a]) * (sizes[b] - sizes[a]):
+                hull.pop()
+            else:
+                break
+        hull.append(q)
+    return hull
+
+
+# quality per tile that maximizes sum(weights[t] * quality[t]) with sum(tile_sizes[quality[t]]) <= budget,
+# every tile has the same quality ladder tile_sizes (byte size of one tile per quality)
+# multiple-choice knapsack, solved greedily: starting from the cheapest quality, the steps along the concave hull
+# of the ladder are taken in order of weighted quality per byte. A step that does not fit is skipped together with
+# the later steps of its tile, the budget left is still used by less efficient steps of other tiles.
+# If even the cheapest quality does not fit, every tile gets it.
+def knapsack_allocation(weights, tile_sizes, budget: float) -> numpy.ndarray:
+    weights = numpy.asarray(weights, dtype=float)
+    tile_sizes = numpy.asarray(tile_sizes, dtype=float)
+    hull = numpy.array(upper_hull(tile_sizes, numpy.arange(0, tile_sizes.__len__())))
+    # hull steps taken per tile
+    steps_taken = numpy.zeros(weights.__len__(), dtype=int)
+    if hull.__len__() > 1:
+        hull_sizes = tile_sizes[hull]
+        step_costs = numpy.diff(hull_sizes)
+        step_efficiencies = numpy.diff(hull) / step_costs
+        remaining = budget - weights.__len__() * hull_sizes[0]
+
+        tile_index, step_index = numpy.meshgrid(numpy.arange(0, weights.__len__()),
+                                                numpy.arange(0, step_costs.__len__()), indexing="ij")
+        efficiencies = numpy.outer(weights, step_efficiencies)
+        useful = efficiencies > 0
+        tile_index, step_index, efficiencies = tile_index[useful], step_index[useful], efficiencies[useful]
+        # most efficient first, the steps of one tile in order
+        order = numpy.lexsort((step_index, tile_index, -efficiencies))
+        tile_index, step_index = tile_index[order], step_index[order]
+        costs = step_costs[step_index]
+
+        # the longest prefix that fits at once, then the remaining steps one by one
+        cumulative_costs = numpy.cumsum(costs)
+        prefix = numpy.searchsorted(cumulative_costs, remaining, side="right") if remaining > 0 else 0
+        steps_taken += numpy.bincount(tile_index[:prefix], minlength=weights.__len__())
+        if prefix > 0:
+            remaining -= cumulative_costs[prefix - 1]
+        for tile, step, cost in zip(tile_index[prefix:].tolist(), step_index[prefix:].tolist(),
+                                    costs[prefix:].tolist()):
+            if step == steps_taken[tile] and cost <= remaining:
+                steps_taken[tile] += 1
+                remaining -= cost
+    return hull[steps_taken]
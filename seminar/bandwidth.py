@@ -1,4 +1,5 @@
-import simpy
+from array import array
+from bisect import bisect_left, bisect_right
 
 
 class BandwidthManager:
@@ -6,6 +7,10 @@ class BandwidthManager:
     def __init__(self, bandwidth_trace: list):
         # list of tupel (start time[s], end time[s], bandwidth[B/s]), sorted by time
         self.bandwidth_trace = self.create_bandwidth_trace(bandwidth_trace)
+        # index over the piecewise constant trace:
+        # starts[i] = start time[s] of interval i, rates[i] = bandwidth[B/s] of interval i,
+        # cumulative_bytes[i] = bytes deliverable between starts[0] and starts[i]
+        self.starts, self.rates, self.cumulative_bytes = self.create_index(self.bandwidth_trace)
 
     @staticmethod
     def create_bandwidth_trace(bandwidth_trace: list):
@@ -15,37 +20,86 @@ class BandwidthManager:
         bandwidth.append((bandwidth_trace[-1][0], -1, bandwidth_trace[-1][1]))
         return bandwidth
 
+    @staticmethod
+    def create_index(bandwidth_trace: list):
+        starts = []
+        rates = []
+        cumulative_bytes = []
+        byte_sum = 0
+        for (start, end, bandwidth) in bandwidth_trace:
+            starts.append(start)
+            rates.append(bandwidth)
+            cumulative_bytes.append(byte_sum)
+            if end != -1:
+                byte_sum += bandwidth * (end - start)
+        return starts, rates, cumulative_bytes
+
+    # bytes deliverable between starts[0] and time
+    def cumulative_bytes_at(self, time: float) -> float:
+        i = bisect_right(self.starts, time) - 1
+        if i < 0:
+            return 0
+        return self.cumulative_bytes[i] + self.rates[i] * (time - self.starts[i])
+
     def get_download_time(self, time: float, byte_size: float):
-        download_time = time
-        for (start, end, bandwidth) in self.bandwidth_trace:
-            if start <= download_time and end == -1:
-                download_time += byte_size / bandwidth
-                break
-            elif start <= download_time <= end:
-                max_interval_download = bandwidth * (end - download_time)
-                if byte_size > max_interval_download:
-                    byte_size -= max_interval_download
-                    download_time = end
-                else:
-                    download_time += byte_size / bandwidth
-                    break
-        return download_time - time
+        # like the linear scan: a download requested before the trace starts takes no time
+        if time < self.starts[0]:
+            return 0
+        # an interval boundary belongs to the earlier interval
+        i = max(bisect_left(self.starts, time) - 1, 0)
+        last = self.starts.__len__() - 1
+        if i == last:
+            return byte_size / self.rates[i]
+        max_interval_download = self.rates[i] * (self.starts[i + 1] - time)
+        if byte_size <= max_interval_download:
+            return byte_size / self.rates[i]
+        # first interval after the download is finished, zero bandwidth intervals are skipped
+        target = self.cumulative_bytes[i + 1] + (byte_size - max_interval_download)
+        j = bisect_left(self.cumulative_bytes, target, i + 1) - 1
+        return self.starts[j] + (target - self.cumulative_bytes[j]) / self.rates[j] - time
 
     def get_average_bandwidth(self, start_time: float, end_time: float):
-        average_bandwidth = 0
-        sum_interval_len = 0
-        for (start, end, bandwidth) in self.bandwidth_trace:
-            if start < end_time and end == -1:
-                average_bandwidth += bandwidth * (end_time - max(start, start_time))
-                sum_interval_len += (end_time - max(start, start_time))
-                break
-            else:
-                interval_len = self.interval_len(start, end, start_time, end_time)
-                sum_interval_len += interval_len
-                average_bandwidth += bandwidth * interval_len
-        return average_bandwidth / sum_interval_len
+        start_time = max(start_time, self.starts[0])
+        i = bisect_right(self.starts, start_time) - 1
+        # within one interval the average is its bandwidth, also for an empty interval (end_time <= start_time)
+        if end_time <= start_time or i == bisect_right(self.starts, end_time) - 1:
+            return self.rates[i]
+        return (self.cumulative_bytes_at(end_time) - self.cumulative_bytes_at(start_time)) / (end_time - start_time)
+
+
+class StreamedBandwidthManager(BandwidthManager):
+    # BandwidthManager of a trace given as an iterable of (time[s], bandwidth[B/s]) sorted by time, e.g. a reader of
+    # seminar.trace_files: the index is built in one pass into arrays of doubles, the trace itself is never held
+    # merge: a sample with the bandwidth of the one before does not start a new interval, the results only differ
+    # in rounding, but per millisecond traces shrink to their changes
+    def __init__(self, samples, merge: bool = True):
+        self.bandwidth_trace = None
+        self.starts, self.rates, self.cumulative_bytes = self.create_streamed_index(samples, merge)
 
     @staticmethod
-    def interval_len(i1_b, i1_e, i2_b, i2_e):
-        interval_len = min((i1_e, i2_e)) - max((i1_b, i2_b))
-        return interval_len if interval_len > 0 else 0
+    def create_streamed_index(samples, merge: bool):
+        starts = array("d")
+        rates = array("d")
+        cumulative_bytes = array("d")
+        byte_sum = 0
+        for (start, bandwidth) in samples:
+            if rates.__len__() > 0:
+                if merge and bandwidth == rates[-1]:
+                    continue
+                byte_sum += rates[-1] * (start - starts[-1])
+            starts.append(start)
+            rates.append(bandwidth)
+            cumulative_bytes.append(byte_sum)
+        if starts.__len__() == 0:
+            raise ValueError("empty bandwidth trace")
+        return starts, rates, cumulative_bytes
+
+
+class IndexedBandwidthManager(BandwidthManager):
+    # BandwidthManager over an index built elsewhere, e.g. float memoryviews of shared memory (seminar.shared)
+    # starts, rates, cumulative_bytes: sequences like the ones create_index returns, used as they are
+    def __init__(self, starts, rates, cumulative_bytes):
+        self.bandwidth_trace = None
+        self.starts = starts
+        self.rates = rates
+        self.cumulative_bytes = cumulative_bytes
@@ -0,0 +1,559 @@
+import numpy
+
+from seminar.bandwidth import BandwidthManager
+from seminar.fluid import FluidSim
+
+infinity = float("inf")
+
+
+# index of the first entry in table[rows, lo:hi] that is > value (right) or >= value (left), per row,
+# rows of table are sorted, a binary search in lockstep over all rows
+def row_search(table: numpy.ndarray, rows, values, lo, hi, right: bool = False) -> numpy.ndarray:
+    lo = numpy.array(lo, dtype=numpy.int64)
+    hi = numpy.array(hi, dtype=numpy.int64)
+    last = table.shape[1] - 1
+    while True:
+        active = lo < hi
+        if not active.any():
+            return lo
+        mid = (lo + hi) // 2
+        mid_values = table[rows, numpy.minimum(mid, last)]
+        higher = (mid_values <= values) if right else (mid_values < values)
+        lo = numpy.where(active & higher, mid + 1, lo)
+        hi = numpy.where(active & ~higher, mid, hi)
+
+
+class BatchBandwidth:
+    # the BandwidthManager indexes of all sessions as rows, padded to the longest trace with infinite starts and
+    # cumulative bytes, same arithmetic as BandwidthManager, so the results are the same to the last bit
+    def __init__(self, bandwidth_traces: list):
+        managers = [trace if isinstance(trace, BandwidthManager) else BandwidthManager(trace)
+                    for trace in bandwidth_traces]
+        length = max(manager.starts.__len__() for manager in managers)
+        self.starts = numpy.full((managers.__len__(), length), infinity)
+        self.rates = numpy.ones((managers.__len__(), length))
+        self.cumulative_bytes = numpy.full((managers.__len__(), length), infinity)
+        self.last = numpy.empty(managers.__len__(), dtype=numpy.int64)
+        for session, manager in enumerate(managers):
+            count = manager.starts.__len__()
+            self.starts[session, :count] = manager.starts
+            self.rates[session, :count] = manager.rates
+            self.cumulative_bytes[session, :count] = manager.cumulative_bytes
+            self.last[session] = count - 1
+        # all sample times and the interval of every session that contains them, so the bisect of a time in the
+        # starts of a session is one searchsorted in times: interval[s][k] = last k' with starts[s][k'] <= times[k]
+        self.times = numpy.unique(self.starts[numpy.isfinite(self.starts)])
+        self.interval = numpy.empty((managers.__len__(), self.times.__len__()), dtype=numpy.int32)
+        for session, manager in enumerate(managers):
+            self.interval[session] = numpy.searchsorted(manager.starts, self.times, side="right") - 1
+
+    # bisect_right(starts of each session, time) - 1, or bisect_left - 1 if not right
+    def interval_of(self, rows, time, right: bool = True):
+        k = numpy.searchsorted(self.times, time, side="right" if right else "left") - 1
+        return numpy.where(k < 0, -1, self.interval[rows, numpy.maximum(k, 0)])
+
+    # BandwidthManager.cumulative_bytes_at of the sessions rows, time not before the traces start
+    def cumulative_bytes_at(self, rows, time):
+        i = self.interval_of(rows, time)
+        return self.cumulative_bytes[rows, i] + self.rates[rows, i] * (time - self.starts[rows, i]), i
+
+    # BandwidthManager.get_download_time of the sessions rows
+    def download_time(self, rows, time, byte_size) -> numpy.ndarray:
+        byte_size = numpy.broadcast_to(byte_size, rows.shape)
+        last = self.last[rows]
+        i = numpy.maximum(self.interval_of(rows, time, False), 0)
+        rate = self.rates[rows, i]
+        next_i = numpy.minimum(i + 1, last)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            max_interval_download = rate * (self.starts[rows, next_i] - time)
+            within = (i == last) | (byte_size <= max_interval_download)
+            download_time = byte_size / rate
+            spanning = numpy.flatnonzero(~within)
+            if spanning.__len__() > 0:
+                span_rows = rows[spanning]
+                target = self.cumulative_bytes[span_rows, next_i[spanning]] + (
+                        byte_size[spanning] - max_interval_download[spanning])
+                j = row_search(self.cumulative_bytes, span_rows, target, next_i[spanning], last[spanning] + 1) - 1
+                download_time[spanning] = self.starts[span_rows, j] + (
+                        target - self.cumulative_bytes[span_rows, j]) / self.rates[span_rows, j] - time[spanning]
+        return numpy.where(time < self.starts[rows, 0], 0, download_time)
+
+    # BandwidthManager.get_average_bandwidth of the sessions rows
+    def average_bandwidth(self, rows, start_time, end_time) -> numpy.ndarray:
+        start_time = numpy.maximum(start_time, self.starts[rows, 0])
+        start_bytes, i = self.cumulative_bytes_at(rows, start_time)
+        end_bytes, j = self.cumulative_bytes_at(rows, end_time)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            return numpy.where((end_time <= start_time) | (i == j), self.rates[rows, i],
+                               (end_bytes - start_bytes) / (end_time - start_time))
+
+
+class BatchSim:
+    # FluidSim of many sessions in lockstep: one player configuration, one bandwidth trace per session
+    # Every state of FluidSim is an array over the sessions, every step each session handles its next event,
+    # the event handlers and DualAdaption.get work on the masks of the sessions whose event they are.
+    # Sessions are independent, a session has the same results as FluidSim with its trace.
+    # Only the oracle throughput of DualAdaption (averages of the bandwidth trace) is supported.
+    # Measured on one core with 77 segments and 2000 sessions whose traces are a fifth outages: 1.1-1.7k sessions/s
+    # with traces of 300 samples, about 0.5k with 2000 samples, then building the BandwidthManager of every trace
+    # takes most of the time.
+    def __init__(self, short_factor, threshold, start_representation, foo,
+                 bandwidth_traces: list, segment_count, segment_sizes, deadlines, accum_viewport, viewport,
+                 allocation: str = "greedy"):
+        fluid = FluidSim(short_factor, threshold, start_representation, foo, bandwidth_traces[0], segment_count,
+                         segment_sizes, deadlines, accum_viewport, viewport, allocation)
+        tables = fluid.tables
+        self.short_factor = short_factor
+        self.threshold = threshold
+        self.start_representation = start_representation
+        self.segment_count = segment_count
+        self.session_count = bandwidth_traces.__len__()
+        self.adaption = fluid.adaption
+        self.tile_count = tables.tile_count
+        self.viewport_tiles = tables.viewport_tiles[:segment_count]
+
+        # tables of the segments, mode 0 = viewport segments (short and the first long one), 1 = long segments:
+        # [mode, representation, index]
+        modes = ("viewport", fluid.long_mode)
+        representations = range(0, tables.byte_rates.__len__())
+        for mode in modes:
+            for representation in representations:
+                fluid.table(mode, representation)
+        self.tile_qualities = numpy.array([[fluid.qualities[(mode, representation)]
+                                            for representation in representations] for mode in modes],
+                                          dtype=numpy.int8)
+        self.sizes = numpy.array([[fluid.sizes[(mode, representation)] for representation in representations]
+                                  for mode in modes])
+        self.viewport_qualities = numpy.array([[fluid.viewport_qualities[(mode, representation)]
+                                                for representation in representations] for mode in modes])
+        self.durations = numpy.array(fluid.durations, dtype=float)
+        self.first_long_index = fluid.long_index
+
+        self.bandwidth = BatchBandwidth(bandwidth_traces)
+
+        n = self.session_count
+        shape = (n, segment_count)
+        self.now = numpy.zeros(n)
+
+        # playback
+        self.playback_position = numpy.zeros(n, dtype=numpy.int64)
+        self.playback_start = numpy.zeros(n)
+        self.playback_end = numpy.full(n, infinity)
+        self.played_before = numpy.zeros(n)
+        self.stall_start = numpy.full(n, numpy.nan)
+        self.stalled_before = numpy.zeros(n, dtype=bool)
+        self.startup_delay = numpy.zeros(n)
+        self.stall_count = numpy.zeros(n, dtype=numpy.int64)
+        self.stall_duration = numpy.zeros(n)
+        # played segments: mode and representation of the played segment and the other finished one (mode -1 if
+        # there is none), played from a short download
+        self.watched_mode = numpy.zeros(shape, dtype=numpy.int8)
+        self.watched_representation = numpy.zeros(shape, dtype=numpy.int8)
+        self.other_mode = numpy.full(shape, -1, dtype=numpy.int8)
+        self.other_representation = numpy.zeros(shape, dtype=numpy.int8)
+        self.watched_short = numpy.zeros(shape, dtype=bool)
+
+        # buffers: short_kind 0 = no segment, 1 = short download, 2 = long segment moved or played there
+        # long_state 0 = no segment, 1 = queued or running, 2 = finished
+        self.short_kind = numpy.zeros(shape, dtype=numpy.int8)
+        self.short_finished = numpy.zeros(shape, dtype=bool)
+        self.short_representation = numpy.zeros(shape, dtype=numpy.int8)
+        self.long_state = numpy.zeros(shape, dtype=numpy.int8)
+        self.long_representation = numpy.zeros(shape, dtype=numpy.int8)
+        self.short_seconds = numpy.zeros(n)
+        self.long_seconds = numpy.zeros(n)
+
+        # running short download, running and queued long download
+        self.short_running = numpy.zeros(n, dtype=bool)
+        self.short_download_index = numpy.zeros(n, dtype=numpy.int64)
+        self.short_download_start = numpy.zeros(n)
+        self.short_download_end = numpy.full(n, infinity)
+        self.long_running = numpy.zeros(n, dtype=bool)
+        self.long_download_index = numpy.zeros(n, dtype=numpy.int64)
+        self.long_download_start = numpy.zeros(n)
+        self.long_download_end = numpy.full(n, infinity)
+        self.long_short_member = numpy.zeros(n, dtype=bool)
+        self.long_queued = numpy.zeros(n, dtype=bool)
+        self.long_queued_index = numpy.zeros(n, dtype=numpy.int64)
+        self.long_queued_short_member = numpy.zeros(n, dtype=bool)
+
+        # pipelines
+        self.short_index = numpy.zeros(n, dtype=numpy.int64)
+        self.short_action = numpy.full(n, infinity)
+        self.short_move = numpy.zeros(n, dtype=bool)
+        self.short_next = numpy.zeros(n, dtype=numpy.int64)
+        self.short_last = numpy.zeros(n, dtype=numpy.int64)
+        self.fast_start_short = numpy.ones(n, dtype=bool)
+        self.long_index = numpy.full(n, self.first_long_index, dtype=numpy.int64)
+        self.long_action = numpy.full(n, infinity)
+        self.long_next = numpy.zeros(n, dtype=numpy.int64)
+        self.long_last = numpy.zeros(n, dtype=numpy.int64)
+        self.fast_start_long = numpy.ones(n, dtype=bool)
+
+        # buffer levels at the event times while a fast start runs, history_count entries per session
+        self.history_times = numpy.zeros((n, 64))
+        self.history_short = numpy.zeros((n, 64))
+        self.history_long = numpy.zeros((n, 64))
+        self.history_count = numpy.zeros(n, dtype=numpy.int64)
+
+        self.steps = 0
+
+    def long_mode(self, index):
+        return numpy.where(index == self.first_long_index, 0, 1)
+
+    def played(self, rows, time):
+        playing = self.playback_end[rows] < infinity
+        return numpy.where(playing, self.played_before[rows] + numpy.minimum(time, self.playback_end[rows]) -
+                           self.playback_start[rows], self.played_before[rows])
+
+    def download_seconds(self, running, index, start, end, time):
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            progress = numpy.where(time >= end, 1, (time - start) / (end - start))
+        return numpy.where(running & (time > start), self.durations[index] * progress, 0)
+
+    def buffer_level_short(self, rows, time):
+        level = self.short_seconds[rows] - self.played(rows, time)
+        level += self.download_seconds(self.short_running[rows], self.short_download_index[rows],
+                                       self.short_download_start[rows], self.short_download_end[rows], time)
+        level += self.download_seconds(self.long_running[rows] & self.long_short_member[rows],
+                                       self.long_download_index[rows], self.long_download_start[rows],
+                                       self.long_download_end[rows], time)
+        return level
+
+    def buffer_level(self, rows, time):
+        level = self.long_seconds[rows] - self.played(rows, time) + numpy.where(self.long_state[rows, 0] != 0, 0, 6)
+        level += self.download_seconds(self.long_running[rows], self.long_download_index[rows],
+                                       self.long_download_start[rows], self.long_download_end[rows], time)
+        return level
+
+    def record_history(self, rows):
+        if rows.__len__() == 0:
+            return
+        now = self.now[rows]
+        count = self.history_count[rows]
+        same = (count > 0) & (self.history_times[rows, numpy.maximum(count - 1, 0)] == now)
+        position = numpy.where(same, count - 1, count)
+        if position.max() >= self.history_times.shape[1]:
+            for name in ("history_times", "history_short", "history_long"):
+                history = getattr(self, name)
+                setattr(self, name, numpy.concatenate((history, numpy.zeros_like(history)), axis=1))
+        self.history_times[rows, position] = now
+        self.history_short[rows, position] = self.buffer_level_short(rows, now)
+        self.history_long[rows, position] = self.buffer_level(rows, now)
+        self.history_count[rows] = position + 1
+
+    # FluidSim.monoton of the sessions rows
+    def monoton(self, rows, history, level_now):
+        n = rows.__len__()
+        times = (numpy.outer(self.now[rows], numpy.arange(0, 4)) / 4).ravel()
+        sessions = numpy.repeat(rows, 4)
+        count = numpy.repeat(self.history_count[rows], 4)
+        i = row_search(self.history_times, sessions, times, numpy.zeros(n * 4, dtype=numpy.int64), count, True)
+        before = numpy.maximum(i - 1, 0)
+        after = numpy.minimum(i, count - 1)
+        t_0 = self.history_times[sessions, before]
+        t_1 = self.history_times[sessions, after]
+        level_0 = history[sessions, before]
+        level_1 = history[sessions, after]
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            levels = numpy.where(i == 0, level_1, numpy.where(i == count, level_0, level_0 + (level_1 - level_0) * (
+                    (times - t_0) / (t_1 - t_0))))
+        levels = numpy.column_stack((levels.reshape(n, 4), level_now))
+        return ~numpy.any(levels[:, :-1] > levels[:, 1:], axis=1)
+
+    # DualAdaption.get of the sessions rows as masks
+    def adapt(self, rows, short: bool):
+        a = self.adaption.a
+        if short:
+            param = self.adaption.short_param
+            factor = self.short_factor
+            last = self.short_last[rows]
+            representation = self.short_representation[rows, last].astype(numpy.int64)
+            duration = self.durations[last]
+            time = self.now[rows]
+            buffer_level = self.buffer_level_short(rows, time)
+            running_fast_start = self.fast_start_short[rows]
+            history = self.history_short
+        else:
+            param = self.adaption.long_param
+            factor = 1 - self.short_factor
+            last = self.long_last[rows]
+            representation = self.long_representation[rows, last].astype(numpy.int64)
+            duration = self.durations[last]
+            time = self.now[rows]
+            buffer_level = self.buffer_level(rows, time)
+            running_fast_start = self.fast_start_long[rows]
+            history = self.history_long
+        r = numpy.asarray(param["r"], dtype=float)
+        r_max, r_min = param["r_max"], param["r_min"]
+        b_min, b_low, b_high = param["b_min"], param["b_low"], param["b_high"]
+        b_opt = (b_low + b_high) * 0.5
+
+        monoton = numpy.zeros(rows.__len__(), dtype=bool)
+        fast = numpy.flatnonzero(running_fast_start)
+        if fast.__len__() > 0:
+            monoton[fast] = self.monoton(rows[fast], history, buffer_level[fast])
+
+        average_throughput = self.bandwidth.average_bandwidth(rows, time - self.adaption.delta_t, time) * factor
+        segment_throughput = self.bandwidth.average_bandwidth(rows, time - duration, time) * factor
+        rate = r[representation]
+        rate_up = r[numpy.minimum(representation + 1, r_max)]
+
+        r_next = representation.copy()
+        b_delay = numpy.zeros(rows.__len__())
+        fast_start = running_fast_start & (representation != r_max) & monoton & (rate <= a[0] * average_throughput)
+        # fast start
+        up = numpy.where(buffer_level < b_min, rate_up <= a[1] * average_throughput,
+                         numpy.where(buffer_level < b_low, rate_up <= a[2] * average_throughput,
+                                     rate_up <= a[3] * average_throughput))
+        r_next = numpy.where(fast_start & up, representation + 1, r_next)
+        b_delay = numpy.where(fast_start & (buffer_level >= b_min) & (buffer_level >= b_low) & (buffer_level > b_high),
+                              b_high - duration, b_delay)
+        # steady state
+        steady = ~fast_start
+        low = steady & (buffer_level < b_min)
+        falling = steady & ~low & (buffer_level < b_low)
+        keep = (representation == r_max) | (rate_up >= a[4] * average_throughput)
+        high = steady & ~low & ~falling
+        rising = high & (buffer_level >= b_high) & ~keep
+        r_next = numpy.where(low, r_min, r_next)
+        r_next = numpy.where(falling & (representation != r_min) & (rate >= segment_throughput), representation - 1,
+                             r_next)
+        # the while loop of DualAdaption.get: highest representation up to a[4] * average_throughput, r is sorted
+        r_next = numpy.where(rising, numpy.minimum(numpy.searchsorted(r, a[4] * average_throughput, side="right") - 1,
+                                                   r_max), r_next)
+        b_delay = numpy.where((high & keep) | rising, numpy.maximum(buffer_level - duration, b_opt), b_delay)
+        delay = numpy.where(b_delay == 0, 0, numpy.maximum(buffer_level - b_delay, 0))
+
+        if short:
+            self.fast_start_short[rows] = fast_start
+        else:
+            self.fast_start_long[rows] = fast_start
+        return r_next, delay
+
+    # FluidSim.decide_short
+    def decide_short(self, rows):
+        rows = rows[self.short_index[rows] < self.segment_count - 1]
+        if rows.__len__() == 0:
+            return
+        representation, delay = self.adapt(rows, True)
+        position = self.playback_position[rows]
+        index = numpy.maximum(self.short_index[rows] + 1, position)
+        # played segments are skipped, the one at playback_position only if it is queued already
+        at_position = numpy.minimum(position, self.segment_count - 1)
+        queued = (self.short_kind[rows, at_position] != 0) | (self.long_state[rows, at_position] != 0)
+        index += (index == position) & (position < self.segment_count) & queued
+        self.short_index[rows] = index
+        # the playback passed the last segment the short pipeline could download
+        rows, representation, delay, index = (x[index < self.segment_count]
+                                              for x in (rows, representation, delay, index))
+        long_representation = self.long_representation[rows, index]
+        self.short_move[rows] = (self.long_state[rows, index] != 0) & (
+                (representation == 0) |
+                (representation - self.viewport_qualities[self.long_mode(index), long_representation, index] <
+                 self.threshold))
+        self.short_next[rows] = representation
+        self.short_action[rows] = self.now[rows] + delay
+
+    # FluidSim.decide_long
+    def decide_long(self, rows):
+        rows = rows[self.long_index[rows] < self.segment_count - 1]
+        if rows.__len__() == 0:
+            return
+        representation, delay = self.adapt(rows, False)
+        behind = self.long_index[rows] <= self.short_index[rows]
+        index = numpy.where(behind, self.short_index[rows] + 1, self.long_index[rows] + 1)
+        self.long_index[rows] = index
+        rows, representation, delay = (x[index < self.segment_count] for x in (rows, representation, delay))
+        self.long_next[rows] = representation
+        self.long_action[rows] = self.now[rows] + delay
+
+    def queue_short(self, rows, index, representation):
+        self.short_kind[rows, index] = 1
+        self.short_finished[rows, index] = False
+        self.short_representation[rows, index] = representation
+        now = self.now[rows]
+        self.short_running[rows] = True
+        self.short_download_index[rows] = index
+        self.short_download_start[rows] = now
+        self.short_download_end[rows] = now + self.bandwidth.download_time(rows, now,
+                                                                            self.sizes[0, representation, index])
+
+    def queue_long(self, rows, index, representation):
+        self.long_state[rows, index] = 1
+        self.long_representation[rows, index] = representation
+        self.long_queued[rows] = True
+        self.long_queued_index[rows] = index
+        self.long_queued_short_member[rows] = False
+
+    # FluidSim.start_long
+    def start_long(self):
+        rows = numpy.flatnonzero(self.long_queued & ~self.short_running & (self.short_action != self.now))
+        if rows.__len__() == 0:
+            return
+        index = self.long_queued_index[rows]
+        now = self.now[rows]
+        size = self.sizes[self.long_mode(index), self.long_representation[rows, index], index]
+        self.long_queued[rows] = False
+        self.long_running[rows] = True
+        self.long_download_index[rows] = index
+        self.long_short_member[rows] = self.long_queued_short_member[rows]
+        self.long_download_start[rows] = now
+        self.long_download_end[rows] = now + self.bandwidth.download_time(rows, now, size)
+
+    # FluidSim.add_short_member of the long segment index
+    def add_short_member(self, rows, index):
+        self.short_kind[rows, index] = 2
+        self.short_representation[rows, index] = self.long_representation[rows, index]
+        finished = self.long_state[rows, index] == 2
+        self.short_seconds[rows] += numpy.where(finished, self.durations[index], 0)
+        running = ~finished & self.long_running[rows] & (self.long_download_index[rows] == index)
+        self.long_short_member[rows[running]] = True
+        queued = ~finished & self.long_queued[rows] & (self.long_queued_index[rows] == index)
+        self.long_queued_short_member[rows[queued]] = True
+
+    def short_available(self, rows, index):
+        kind = self.short_kind[rows, index]
+        return ((kind == 1) & self.short_finished[rows, index]) | ((kind == 2) & (self.long_state[rows, index] == 2))
+
+    # FluidSim.playback_next of the sessions rows, all with playback_position < segment_count
+    def playback_next(self, rows):
+        index = self.playback_position[rows]
+        short = self.short_available(rows, index)
+        long = self.long_state[rows, index] == 2
+        available = short | long
+        stalling = rows[~available & numpy.isnan(self.stall_start[rows])]
+        self.stall_start[stalling] = self.now[stalling]
+
+        rows, index, short, long = (x[available] for x in (rows, index, short, long))
+        if rows.__len__() == 0:
+            return
+        now = self.now[rows]
+        stall_start = self.stall_start[rows]
+        # stalls of no time are left out like in SimEnv.metrics, the first one at time 0 is the startup delay
+        stalled = ~numpy.isnan(stall_start) & (now > stall_start)
+        startup = stalled & ~self.stalled_before[rows] & (stall_start == 0)
+        self.startup_delay[rows] += numpy.where(startup, now, 0)
+        later = stalled & ~startup
+        self.stall_count[rows] += later
+        self.stall_duration[rows] += numpy.where(later, now - stall_start, 0)
+        self.stalled_before[rows] |= stalled
+        self.stall_start[rows] = numpy.nan
+
+        short_kind = self.short_kind[rows, index]
+        long_mode = self.long_mode(index)
+        short_mode = numpy.where(short_kind == 2, long_mode, 0)
+        self.watched_mode[rows, index] = numpy.where(short, short_mode, long_mode)
+        self.watched_representation[rows, index] = numpy.where(short, self.short_representation[rows, index],
+                                                               self.long_representation[rows, index])
+        self.watched_short[rows, index] = short & (short_kind == 1)
+        other = numpy.where(short, long, short)
+        self.other_mode[rows, index] = numpy.where(other, numpy.where(short, long_mode, short_mode), -1)
+        self.other_representation[rows, index] = numpy.where(short, self.long_representation[rows, index],
+                                                             self.short_representation[rows, index])
+        # played from the long buffer without a short segment
+        played_long = ~short & (short_kind == 0)
+        self.add_short_member(rows[played_long], index[played_long])
+
+        self.playback_start[rows] = now
+        self.playback_end[rows] = now + self.durations[index]
+
+    def run(self):
+        rows = numpy.arange(0, self.session_count)
+        if self.short_factor > 0:
+            self.queue_short(rows, 0, self.start_representation)
+        if self.short_factor < 1:
+            self.queue_long(rows, self.first_long_index, self.start_representation)
+        self.playback_next(rows)
+        self.record_history(rows)
+        while True:
+            self.start_long()
+            now = numpy.minimum.reduce([self.short_download_end, self.long_download_end, self.playback_end,
+                                        self.short_action, self.long_action])
+            active = now < infinity
+            if not active.any():
+                break
+            self.steps += 1
+            self.now = numpy.where(active, now, self.now)
+            short_downloaded = active & (self.short_download_end == now)
+            rest = active & ~short_downloaded
+            long_downloaded = rest & (self.long_download_end == now)
+            rest &= ~long_downloaded
+            played = rest & (self.playback_end == now)
+            rest &= ~played
+            short_action = rest & (self.short_action == now)
+            long_action = rest & ~short_action
+
+            decide_short = []
+            rows = numpy.flatnonzero(short_downloaded)
+            if rows.__len__() > 0:
+                index = self.short_download_index[rows]
+                self.short_running[rows] = False
+                self.short_download_end[rows] = infinity
+                self.short_finished[rows, index] = True
+                self.short_seconds[rows] += self.durations[index]
+                self.short_last[rows] = index
+                decide_short.append(rows)
+
+            rows = numpy.flatnonzero(long_downloaded)
+            if rows.__len__() > 0:
+                index = self.long_download_index[rows]
+                self.long_running[rows] = False
+                self.long_download_end[rows] = infinity
+                self.long_state[rows, index] = 2
+                self.long_seconds[rows] += self.durations[index]
+                self.short_seconds[rows] += numpy.where(self.long_short_member[rows], self.durations[index], 0)
+                self.long_last[rows] = index
+                self.decide_long(rows)
+
+            rows = numpy.flatnonzero(played)
+            if rows.__len__() > 0:
+                self.played_before[rows] += self.playback_end[rows] - self.playback_start[rows]
+                self.playback_end[rows] = infinity
+                self.playback_position[rows] += 1
+
+            rows = numpy.flatnonzero(short_action)
+            if rows.__len__() > 0:
+                self.short_action[rows] = infinity
+                move = self.short_move[rows]
+                moved = rows[move]
+                self.add_short_member(moved, self.short_index[moved])
+                decide_short.append(moved)
+                queued = rows[~move]
+                self.queue_short(queued, self.short_index[queued], self.short_next[queued])
+
+            rows = numpy.flatnonzero(long_action)
+            if rows.__len__() > 0:
+                self.long_action[rows] = infinity
+                self.queue_long(rows, self.long_index[rows], self.long_next[rows])
+
+            if decide_short.__len__() > 0:
+                self.decide_short(numpy.concatenate(decide_short))
+            rows = numpy.flatnonzero(active & (self.playback_end == infinity) &
+                                     (self.playback_position < self.segment_count))
+            if rows.__len__() > 0:
+                self.playback_next(rows)
+            self.record_history(numpy.flatnonzero(active & (self.fast_start_short | self.fast_start_long)))
+
+    # SimEnv.metrics of every session, arrays over the sessions
+    def metrics(self, chunk_size: int = 256) -> dict:
+        switches = (self.watched_representation[:, 1:] != self.watched_representation[:, :-1]).sum(axis=1)
+        quality_sum = numpy.zeros(self.session_count)
+        viewport_quality_sum = numpy.zeros(self.session_count)
+        segments = numpy.arange(0, self.segment_count)
+        for start in range(0, self.session_count, chunk_size):
+            chunk = slice(start, start + chunk_size)
+            qualities = self.tile_qualities[self.watched_mode[chunk], self.watched_representation[chunk], segments]
+            other_mode = self.other_mode[chunk]
+            other = self.tile_qualities[numpy.maximum(other_mode, 0), self.other_representation[chunk], segments]
+            qualities = numpy.where((other_mode >= 0)[:, :, None], numpy.maximum(qualities, other), qualities)
+            quality_sum[chunk] = qualities.sum(axis=(1, 2))
+            viewport_quality_sum[chunk] = (qualities * self.viewport_tiles).sum(axis=(1, 2))
+        return {"duration": self.now.copy(),
+                "startup_delay": self.startup_delay.copy(),
+                "stall_count": self.stall_count.copy(),
+                "stall_duration": self.stall_duration.copy(),
+                "average_tile_quality": quality_sum / (self.segment_count * self.tile_count),
+                "viewport_quality": viewport_quality_sum / self.viewport_tiles.sum(),
+                "switches": switches,
+                "short_segments": self.watched_short.sum(axis=1)}
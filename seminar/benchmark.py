@@ -0,0 +1,244 @@
+import argparse
+import json
+import platform
+import random
+import subprocess
+import time
+import timeit
+
+import numpy
+import simpy
+
+import seminar.simulation
+import seminar.values
+from seminar.bandwidth import BandwidthManager
+from seminar.batch import BatchSim
+from seminar.link import SharedLink, LinkClient
+from seminar.segment import Segment
+from seminar.simulation import SimEnv, DualBuffer, DownloadManager
+
+# 781250 B/s = 6 MBit/s
+bandwidth = 781250
+
+datasets = {"sizes2": (77, seminar.values.segment_sizes2, seminar.values.deadlines2),
+            "sizes": (77, seminar.values.segment_sizes, seminar.values.deadlines)}
+
+
+def random_trace(length: int, seed: int = 0) -> list:
+    # one sample per second, about every tenth second an outage
+    generator = random.Random(seed)
+    return [(i, 0 if generator.random() < 0.1 else generator.uniform(0.2, 2) * bandwidth) for i in range(0, length)]
+
+
+# seconds per call, best of repeat runs of number calls
+def measure(function, repeat: int = 5) -> (float, int):
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number, number
+
+
+def result(name: str, parameter, seconds: float, number: int) -> dict:
+    return {"name": name, "parameter": parameter, "seconds": seconds, "number": number}
+
+
+def bench_bandwidth(trace_lengths) -> list:
+    results = []
+    for length in trace_lengths:
+        bandwidth_manager = BandwidthManager(random_trace(length))
+        generator = random.Random(1)
+        queries = [(generator.uniform(0, length), generator.uniform(0.1, 10) * bandwidth) for _ in range(0, 100)]
+
+        def download_time():
+            for (t, byte_size) in queries:
+                bandwidth_manager.get_download_time(t, byte_size)
+
+        def average_bandwidth():
+            for (t, _) in queries:
+                bandwidth_manager.get_average_bandwidth(t - 5, t)
+
+        seconds, number = measure(download_time)
+        results.append(result("bandwidth.get_download_time", length, seconds / queries.__len__(), number))
+        seconds, number = measure(average_bandwidth)
+        results.append(result("bandwidth.get_average_bandwidth", length, seconds / queries.__len__(), number))
+    return results
+
+
+# a DualBuffer after segment_count downloads (short and long alternating) and playback of half of them
+def filled_buffer(segment_count: int) -> (DualBuffer, float):
+    env = simpy.Environment()
+    buffer = DualBuffer()
+    bandwidth_manager = BandwidthManager(random_trace(segment_count * 4))
+    download_manager = DownloadManager(env, bandwidth_manager, buffer)
+    sizes = seminar.values.segment_sizes2
+    for i in range(0, segment_count):
+        sizes_i = sizes[i % sizes.__len__()]
+        segment = Segment(i, 2, 2, [sizes_i[2] / 64] * 64, [2] * 64)
+        download_manager.queue_download(segment, i % 2 == 0)
+    env.run()
+    for i in range(0, segment_count // 2):
+        buffer.playback_start_next(i * 2, i)
+    return buffer, env.now
+
+
+def bench_buffer(segment_counts) -> list:
+    results = []
+    for segment_count in segment_counts:
+        buffer, now = filled_buffer(segment_count)
+        times = numpy.linspace(0, now, 100)
+
+        def buffer_level_now():
+            buffer.buffer_level(now)
+            buffer.buffer_level_short(now)
+
+        def buffer_level_past():
+            for t in times:
+                buffer.buffer_level(t)
+
+        def buffer_level_many():
+            buffer.buffer_level_many(times)
+
+        seconds, number = measure(buffer_level_now)
+        results.append(result("buffer.buffer_level_now", segment_count, seconds / 2, number))
+        seconds, number = measure(buffer_level_past)
+        results.append(result("buffer.buffer_level_past", segment_count, seconds / times.__len__(), number))
+        seconds, number = measure(buffer_level_many)
+        results.append(result("buffer.buffer_level_many_100", segment_count, seconds, number))
+    return results
+
+
+def dataset_sim(dataset: str, bandwidth_trace: list, short_factor: float = 0.5, foo: bool = True) -> SimEnv:
+    segment_count, segment_sizes, deadlines = datasets[dataset]
+    return SimEnv(short_factor, 1.5, 0, foo, bandwidth_trace, segment_count, segment_sizes, deadlines,
+                  seminar.values.accum_viewport, seminar.values.example_viewport)
+
+
+def bench_segments() -> list:
+    sim = dataset_sim("sizes2", [(0, bandwidth)])
+    representations = range(0, sim.byte_rates.__len__())
+    indices = range(0, sim.segment_count)
+
+    def accum_viewport_segment():
+        for index in indices:
+            for representation in representations:
+                sim.get_accum_viewport_segment(representation, index)
+
+    seconds, number = measure(accum_viewport_segment)
+    calls = representations.__len__() * indices.__len__()
+    return [result("simulation.get_accum_viewport_segment", calls, seconds / calls, number)]
+
+
+def bench_sessions(repeat: int) -> list:
+    traces = {"outage": [(0, bandwidth), (70, 0), (85, bandwidth / 2)],
+              "constant": [(0, bandwidth)],
+              "random": random_trace(500)}
+    results = []
+    for dataset in datasets:
+        for trace_name, trace in traces.items():
+            for short_factor in (0, 0.5, 1):
+                def session():
+                    dataset_sim(dataset, trace, short_factor).run()
+
+                seconds = min(timeit.repeat(session, number=1, repeat=repeat))
+                results.append(result("simulation.run", "%s/%s/%s" % (dataset, trace_name, short_factor),
+                                      seconds, 1))
+    return results
+
+
+# seconds per session of BatchSim with session_count random traces
+def bench_batch(session_count: int) -> list:
+    traces = [random_trace(200, seed) for seed in range(0, session_count)]
+    results = []
+    for dataset, (segment_count, segment_sizes, deadlines) in datasets.items():
+        for short_factor in (0, 0.5, 1):
+            def sessions():
+                sim = BatchSim(short_factor, 1.5, 0, True, traces, segment_count, segment_sizes, deadlines,
+                               seminar.values.accum_viewport, seminar.values.example_viewport)
+                sim.run()
+                sim.metrics()
+
+            seconds = min(timeit.repeat(sessions, number=1, repeat=1))
+            parameter = "%s/%s/%s" % (dataset, short_factor, session_count)
+            results.append(result("batch.run", parameter, seconds / session_count, 1))
+    return results
+
+
+# seconds per client of client_count LinkClient sessions on one SharedLink, a third of bandwidth per client,
+# with access rates of 0.5 to 3.5 times bandwidth
+def bench_link(client_count: int) -> list:
+    results = []
+    for dataset, (segment_count, segment_sizes, deadlines) in datasets.items():
+        def sessions():
+            link = SharedLink([(0, bandwidth * client_count / 3)])
+            clients = [LinkClient(link, bandwidth * (0.5 + i % 4), (i % 3) / 2, 1.5, 0, True, segment_count,
+                                  segment_sizes, deadlines, seminar.values.accum_viewport,
+                                  seminar.values.example_viewport) for i in range(0, client_count)]
+            link.run()
+            for client in clients:
+                client.metrics()
+
+        seconds = min(timeit.repeat(sessions, number=1, repeat=1))
+        results.append(result("link.run", "%s/%s" % (dataset, client_count), seconds / client_count, 1))
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ""
+
+
+def run(quick: bool = False) -> dict:
+    seminar.simulation.verbose = False
+    trace_lengths = [10, 100, 1000] if quick else [10, 100, 1000, 10000, 100000]
+    segment_counts = [10, 100] if quick else [10, 100, 1000, 10000]
+    results = []
+    results += bench_bandwidth(trace_lengths)
+    results += bench_buffer(segment_counts)
+    results += bench_segments()
+    results += bench_sessions(1 if quick else 3)
+    results += bench_batch(200 if quick else 2000)
+    results += bench_link(50 if quick else 500)
+    return {"commit": git_commit(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": numpy.__version__,
+            "simpy": simpy.__version__,
+            "results": results}
+
+
+# list of (name, parameter, old seconds, new seconds) that got slower by more than factor
+def compare(old: dict, new: dict, factor: float = 1.2) -> list:
+    old_results = {(r["name"], r["parameter"]): r["seconds"] for r in old["results"]}
+    regressions = []
+    for r in new["results"]:
+        key = (r["name"], r["parameter"])
+        if key in old_results and r["seconds"] > old_results[key] * factor:
+            regressions.append((r["name"], r["parameter"], old_results[key], r["seconds"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark bandwidth, buffer and simulation hot paths")
+    parser.add_argument("output", help="json file for the results")
+    parser.add_argument("--quick", action="store_true", help="smaller sizes, one repetition of the sessions")
+    parser.add_argument("--compare", help="json file of an earlier run, lists regressions against it")
+    parser.add_argument("--factor", type=float, default=1.2, help="slowdown that counts as regression")
+    args = parser.parse_args()
+
+    results = run(args.quick)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=1)
+    for r in results["results"]:
+        print("%-40s %-24s %12.3f us" % (r["name"], r["parameter"], r["seconds"] * 1e6))
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results, args.factor)
+        for (name, parameter, old_seconds, new_seconds) in regressions:
+            print("regression: %s %s %.3f us -> %.3f us" % (name, parameter, old_seconds * 1e6, new_seconds * 1e6))
+        if regressions.__len__() > 0:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
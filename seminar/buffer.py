@@ -1,5 +1,8 @@
+from bisect import bisect_left
 from collections import defaultdict
 
+import numpy
+
 from seminar.segment import Segment
 
 
@@ -29,6 +32,14 @@ class Buffer:
                     sum_playback_time += segment_duration * ((time - playback_start) / (playback_finish - playback_start))
         return sum_buffer_level - sum_playback_time
 
+    # buffer_level for an array of times
+    def buffer_level_many(self, times) -> numpy.ndarray:
+        times = numpy.asarray(times, dtype=float)
+        downloaded = numpy.array([(start, end, segment.duration) for (start, end, segment) in self.downloaded_segments],
+                                 dtype=float).reshape(-1, 3)
+        playback = numpy.array(self.playback, dtype=float).reshape(-1, 3)
+        return ramp_levels(times, *downloaded.T) - ramp_levels(times, *playback.T)
+
     def get_last_segment(self) -> Segment:
         return self.downloaded_segments[-1][2]
 
@@ -52,3 +63,241 @@ class Buffer:
         else:
             self.downloaded_segments.append(tmp)
 
+
+
+def ramp_levels(times: numpy.ndarray, starts, ends, weights, max_ends=None, prefix_sums=None) -> numpy.ndarray:
+    # sum of weight * progress(time) over records, progress grows linearly from 0 at start to 1 at end
+    # records are sorted by start, max_ends[i] = max(ends[0..i]),
+    # prefix_sums(counts) = sum of the first counts weights
+    if max_ends is None:
+        max_ends = numpy.maximum.accumulate(ends) if ends.__len__() > 0 else ends
+    if prefix_sums is None:
+        cumulative_weights = numpy.concatenate(([0], numpy.cumsum(weights)))
+        prefix_sums = cumulative_weights.__getitem__
+    # records started before time
+    counts = numpy.searchsorted(starts, times, side="left")
+    levels = numpy.array(prefix_sums(counts), dtype=float)
+    # walk back over the records that can still be in flight at time, usually only the last one
+    index = counts - 1
+    active = index >= 0
+    active[active] = max_ends[index[active]] > times[active]
+    while active.any():
+        i = index[active]
+        t = times[active]
+        in_flight = ends[i] > t
+        duration = numpy.where(in_flight, ends[i] - starts[i], 1)
+        levels[active] += numpy.where(in_flight, weights[i] * ((t - starts[i]) / duration) - weights[i], 0)
+        i -= 1
+        running = i >= 0
+        running[running] = max_ends[i[running]] > t[running]
+        index[active] = i
+        active[active] = running
+    return levels
+
+
+class ArrayBuffer:
+    # float array with amortized O(1) append
+    def __init__(self, capacity: int = 64):
+        self.data = numpy.zeros(capacity)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    # an element as Python float, numpy scalars would leak into the trace, the metrics and the decisions
+    def __getitem__(self, index):
+        return self.data.item(index)
+
+    def __setitem__(self, index, value):
+        self.data[index] = value
+
+    def append(self, value: float):
+        if self.size == self.data.__len__():
+            self.data = numpy.concatenate((self.data, numpy.zeros(self.size)))
+        self.data[self.size] = value
+        self.size += 1
+
+    def view(self) -> numpy.ndarray:
+        return self.data[:self.size]
+
+
+class FenwickTree:
+    # prefix sums with O(log n) append, point update and query
+    def __init__(self):
+        # 1-based, tree[i] holds the sum of the values (i - lowbit(i), i]
+        self.tree = ArrayBuffer()
+        self.tree.append(0)
+
+    def __len__(self):
+        return self.tree.__len__() - 1
+
+    def append(self, value: float):
+        n = self.tree.__len__()
+        i = n - 1
+        stop = n - (n & -n)
+        while i > stop:
+            value += self.tree[i]
+            i -= i & -i
+        self.tree.append(value)
+
+    def add(self, index: int, delta: float):
+        i = index + 1
+        while i < self.tree.__len__():
+            self.tree[i] += delta
+            i += i & -i
+
+    # sum of the first count values
+    def prefix_sum(self, count: int) -> float:
+        prefix_sum = 0
+        while count > 0:
+            prefix_sum += self.tree[count]
+            count -= count & -count
+        return prefix_sum
+
+    # prefix_sum for an array of counts
+    def prefix_sums(self, counts: numpy.ndarray) -> numpy.ndarray:
+        counts = numpy.array(counts, dtype=numpy.int64)
+        prefix_sums = numpy.zeros(counts.__len__())
+        tree = self.tree.view()
+        running = counts > 0
+        while running.any():
+            prefix_sums[running] += tree[counts[running]]
+            counts[running] -= counts[running] & -counts[running]
+            running = counts > 0
+        return prefix_sums
+
+
+class DownloadHistory:
+    # every transfer record (bytes, start, end) of a download manager, in the order they were started
+    def __init__(self):
+        self.starts = ArrayBuffer()
+        self.ends = ArrayBuffer()
+        # max_ends[i] = max(ends[0..i]), records before a query time can only be in flight up to there
+        self.max_ends = ArrayBuffer()
+        self.byte_sizes = ArrayBuffer()
+        # seconds of video the record adds to the buffer
+        self.seconds = ArrayBuffer()
+        self.downloads = []
+
+        self.tracks = []
+        # called with the download when a download is finished
+        self.listeners = []
+
+    def __len__(self):
+        return self.starts.__len__()
+
+    def record(self, download, byte_size: float, start: float, end: float) -> int:
+        index = self.starts.__len__()
+        self.starts.append(start)
+        self.ends.append(end)
+        self.max_ends.append(max(end, self.max_ends[index - 1]) if index > 0 else end)
+        self.byte_sizes.append(byte_size)
+        self.seconds.append(download.segment.duration * (byte_size / download.segment.__len__()))
+        self.downloads.append(download)
+        for track in self.tracks:
+            track.record_added(index, download)
+        return index
+
+    # a paused transfer ends early with fewer bytes
+    def update(self, index: int, byte_size: float, end: float):
+        download = self.downloads[index]
+        self.byte_sizes[index] = byte_size
+        self.ends[index] = end
+        self.seconds[index] = download.segment.duration * (byte_size / download.segment.__len__())
+        for i in range(index, self.max_ends.__len__()):
+            max_end = max(self.ends[i], self.max_ends[i - 1]) if i > 0 else self.ends[i]
+            if max_end == self.max_ends[i]:
+                break
+            self.max_ends[i] = max_end
+        for track in self.tracks:
+            track.record_changed(index)
+
+    def download_finished(self, download):
+        for listener in self.listeners:
+            listener(download)
+
+
+class BufferTrack(dict):
+    # segment_index -> (segment, download), keeps the buffered seconds of its downloads as prefix sums
+    # over the records of a DownloadHistory
+    def __init__(self, history: DownloadHistory):
+        super(BufferTrack, self).__init__()
+        self.history = history
+        # record_seconds[i] = history.seconds[i] if the record belongs to a download of this track, else 0
+        self.record_seconds = ArrayBuffer()
+        self.seconds = FenwickTree()
+        self.total_seconds = 0
+        # download -> number of keys referencing it
+        self.members = {}
+
+        for _ in range(0, history.__len__()):
+            self.record_seconds.append(0)
+            self.seconds.append(0)
+        history.tracks.append(self)
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self.leave(self[key][1])
+        super(BufferTrack, self).__setitem__(key, value)
+        self.join(value[1])
+
+    def __delitem__(self, key):
+        self.leave(self[key][1])
+        super(BufferTrack, self).__delitem__(key)
+
+    def join(self, download):
+        count = self.members.get(download, 0)
+        self.members[download] = count + 1
+        if count == 0:
+            for index in download.records:
+                self.set_seconds(index, self.history.seconds[index])
+
+    def leave(self, download):
+        count = self.members[download] - 1
+        if count > 0:
+            self.members[download] = count
+        else:
+            del self.members[download]
+            for index in download.records:
+                self.set_seconds(index, 0)
+
+    def set_seconds(self, index: int, seconds: float):
+        delta = seconds - self.record_seconds[index]
+        self.record_seconds[index] = seconds
+        self.seconds.add(index, delta)
+        self.total_seconds += delta
+
+    def record_added(self, index: int, download):
+        seconds = self.history.seconds[index] if download in self.members else 0
+        self.record_seconds.append(seconds)
+        self.seconds.append(seconds)
+        self.total_seconds += seconds
+
+    def record_changed(self, index: int):
+        if self.history.downloads[index] in self.members:
+            self.set_seconds(index, self.history.seconds[index])
+
+    # downloaded seconds of video at time, transfers in flight are interpolated
+    def level(self, time: float) -> float:
+        history = self.history
+        # records started before time
+        count = bisect_left(history.starts.data, time, 0, history.__len__())
+        if count == history.__len__():
+            level = self.total_seconds
+        else:
+            level = self.seconds.prefix_sum(count)
+        partial = 0
+        i = count - 1
+        while i >= 0 and history.max_ends[i] > time:
+            seconds = self.record_seconds[i]
+            if history.ends[i] > time and seconds > 0:
+                level -= seconds
+                partial += seconds * ((time - history.starts[i]) / (history.ends[i] - history.starts[i]))
+            i -= 1
+        return level + partial
+
+    # level for an array of times
+    def level_many(self, times: numpy.ndarray) -> numpy.ndarray:
+        history = self.history
+        return ramp_levels(times, history.starts.view(), history.ends.view(), self.record_seconds.view(),
+                           history.max_ends.view(), self.seconds.prefix_sums)
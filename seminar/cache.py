@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+
+import numpy
+
+from seminar.bandwidth import BandwidthManager
+
+# on disk cache of the metrics of simulation runs, keyed by a hash of everything a run depends on:
+# its configuration (the SimEnv arguments, with the contents of traces and datasets, not their identity in memory)
+# and the source code of the seminar package
+#
+# one json file per run, written to a temporary file and renamed, so processes that share the directory never read a
+# partial entry, reads refresh the modification time and evict removes the least recently used entries
+
+code_version_hash = None
+
+
+# hash of the source files of the seminar package, computed once per process
+def code_version() -> str:
+    global code_version_hash
+    if code_version_hash is None:
+        directory = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha256()
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                digest.update(name.encode())
+                with open(os.path.join(directory, name), "rb") as f:
+                    digest.update(f.read())
+        code_version_hash = digest.hexdigest()
+    return code_version_hash
+
+
+# adds value to digest, numbers, lists and arrays of the same values hash the same
+def update_hash(digest, value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        digest.update(("%s:%r;" % (type(value).__name__, value)).encode())
+    elif isinstance(value, dict):
+        digest.update(b"dict{")
+        for key in sorted(value):
+            update_hash(digest, key)
+            update_hash(digest, value[key])
+        digest.update(b"}")
+    elif isinstance(value, BandwidthManager):
+        digest.update(b"bandwidth")
+        update_hash(digest, numpy.asarray(value.starts, dtype=float))
+        update_hash(digest, numpy.asarray(value.rates, dtype=float))
+    elif isinstance(value, (list, tuple, numpy.ndarray)):
+        try:
+            array = numpy.asarray(value)
+        except (ValueError, OverflowError):
+            # ragged lists
+            array = None
+        if array is not None and array.dtype.kind in "biuf":
+            # integers of any width hash the same, e.g. the int8 viewport of a seminar.dataset and the list
+            array = numpy.ascontiguousarray(array, dtype=numpy.float64 if array.dtype.kind == "f" else numpy.int64)
+            digest.update(("array:%s:%s;" % (array.dtype.str, array.shape)).encode())
+            digest.update(array.data)
+        else:
+            digest.update(b"list[")
+            for item in value:
+                update_hash(digest, item)
+            digest.update(b"]")
+    elif isinstance(value, numpy.generic):
+        update_hash(digest, value.item())
+    else:
+        raise TypeError("configuration value of type %s can not be hashed" % type(value).__name__)
+
+
+class ResultCache:
+    # directory: created if missing, max_bytes: size evict keeps the entries below
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(config: dict) -> str:
+        digest = hashlib.sha256()
+        update_hash(digest, code_version())
+        update_hash(digest, config)
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    # metrics of the run with key, None if not cached
+    def get(self, key: str):
+        path = self.path(key)
+        try:
+            with open(path) as f:
+                metrics = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return metrics
+
+    def put(self, key: str, metrics: dict):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = "%s.%d.tmp" % (path, os.getpid())
+        with open(temporary, "w") as f:
+            json.dump(metrics, f, default=lambda value: value.item())
+        try:
+            os.replace(temporary, path)
+        except FileNotFoundError:
+            # evict of another process removed the temporary file, the run is not cached
+            pass
+
+    # removes the temporary files left by writers that did not finish and the least recently used entries until the
+    # cache is not larger than max_bytes
+    def evict(self):
+        entries = []
+        total = 0
+        for sub_directory in os.scandir(self.directory):
+            if not sub_directory.is_dir():
+                continue
+            for entry in os.scandir(sub_directory.path):
+                if entry.name.endswith(".tmp"):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+                    continue
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    status = entry.stat()
+                except OSError:
+                    continue
+                entries.append((status.st_mtime, status.st_size, entry.path))
+                total += status.st_size
+        entries.sort()
+        for (mtime, size, path) in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # removed by another process in the meantime
+                pass
+            total -= size
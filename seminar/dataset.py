@@ -0,0 +1,70 @@
+import os
+import sys
+
+import numpy
+
+import seminar.values
+
+# datasets as a directory of .npy files, one per SimEnv argument, loaded memory mapped: loading one only maps the
+# files instead of building the Python lists of seminar.values, and all processes that load the same directory
+# share its pages through the page cache
+#
+#   python -m seminar.dataset DIRECTORY    writes the bundled datasets of seminar.values to DIRECTORY/sizes and
+#                                          DIRECTORY/sizes2
+
+# SimEnv argument -> dtype of its file, None keeps the dtype of the values (ints or floats)
+fields = {"segment_sizes": None,
+          "deadlines": None,
+          "accum_viewport": None,
+          "viewport": numpy.int8}
+
+
+class Dataset:
+    # segment_sizes[i][q] = byte size of segment i in quality q, deadlines[i] = start of segment i in seconds,
+    # accum_viewport[i][t] = accumulated viewport of tile t in segment i, viewport[i][t] = 1 if tile t of segment i
+    # is watched, numpy arrays or the lists of seminar.values
+    def __init__(self, segment_sizes, deadlines, accum_viewport, viewport):
+        self.segment_sizes = segment_sizes
+        self.deadlines = deadlines
+        self.accum_viewport = accum_viewport
+        self.viewport = viewport
+        self.segment_count = segment_sizes.__len__()
+
+    # segment_count, segment_sizes, deadlines, accum_viewport, viewport in the order of the SimEnv arguments
+    def arguments(self) -> tuple:
+        return self.segment_count, self.segment_sizes, self.deadlines, self.accum_viewport, self.viewport
+
+
+def save_dataset(directory: str, dataset: Dataset):
+    os.makedirs(directory, exist_ok=True)
+    for name, dtype in fields.items():
+        values = numpy.asarray(getattr(dataset, name), dtype=dtype)
+        numpy.save(os.path.join(directory, name + ".npy"), values, allow_pickle=False)
+
+
+# mmap: read only memory maps of the files, otherwise private copies
+def load_dataset(directory: str, mmap: bool = True) -> Dataset:
+    arrays = {name: numpy.load(os.path.join(directory, name + ".npy"), mmap_mode="r" if mmap else None,
+                               allow_pickle=False)
+              for name in fields}
+    return Dataset(**arrays)
+
+
+# the bundled datasets: name -> Dataset of the lists in seminar.values
+def bundled_datasets() -> dict:
+    return {"sizes": Dataset(seminar.values.segment_sizes, seminar.values.deadlines, seminar.values.accum_viewport,
+                             seminar.values.example_viewport),
+            "sizes2": Dataset(seminar.values.segment_sizes2, seminar.values.deadlines2,
+                              seminar.values.accum_viewport, seminar.values.example_viewport)}
+
+
+def convert_values(directory: str):
+    for name, dataset in bundled_datasets().items():
+        save_dataset(os.path.join(directory, name), dataset)
+
+
+if __name__ == "__main__":
+    if sys.argv.__len__() != 2:
+        print("usage: python -m seminar.dataset DIRECTORY")
+        sys.exit(1)
+    convert_values(sys.argv[1])
@@ -0,0 +1,376 @@
+from bisect import bisect_right
+from heapq import heappop, heappush
+
+import simpy
+from simpy.core import NORMAL
+
+from seminar.bandwidth import BandwidthManager
+from seminar.simulation import SimEnv, Download, DownloadManager
+from seminar.trace import DownloadStarted, DownloadPaused
+
+infinity = float("inf")
+
+
+# one bottleneck link shared by the transfers of many clients in one SimPy environment
+#
+# The capacity of the link is split with max-min fairness: every flow gets the same fair share, except flows whose
+# max_rate (the access link of their client) is below it, they get their max_rate and the capacity they leave is
+# shared by the others. Rates only change when a flow starts or finishes or the capacity changes, and then not flow
+# by flow: every flow at the fair share receives the same bytes, so they all advance with one counter, service (bytes
+# a flow at the fair share received since the link started). Such a flow finishes when service reaches its target,
+# a flow at its max_rate at a fixed time. Both are kept in heaps, and the flows in heaps by max_rate, so a start or
+# a finish costs O(log n) plus the flows that cross the fair share. Heap entries of flows that moved or finished are
+# skipped when they come to the top.
+
+class Flow:
+    def __init__(self, byte_size: float, max_rate: float, event: simpy.Event):
+        self.byte_size = byte_size
+        self.max_rate = max_rate
+        # succeeds with the flow when the last byte is transferred
+        self.event = event
+        self.active = True
+        # at its max_rate instead of the fair share
+        self.capped = False
+        # fair share: service of the link when the flow is finished, capped: time when the flow is finished
+        self.target = 0
+        self.finish_time = 0
+        # heap entries of an older version are stale
+        self.version = 0
+
+
+class SharedLink:
+    # capacity: list of (time[s], bandwidth[B/s]) or a BandwidthManager of the bottleneck
+    def __init__(self, capacity, env: simpy.Environment = None):
+        self.env = env if env is not None else simpy.Environment()
+        self.capacity = capacity if isinstance(capacity, BandwidthManager) else BandwidthManager(capacity)
+        self.capacity_now = self.capacity_at(self.env.now)
+
+        self.service = 0
+        self.service_time = self.env.now
+        self.fair_share = infinity
+
+        # entries (key, sequence, version, flow), the sequence keeps equal keys in start order
+        # flows at the fair share by target and by max_rate, capped flows by finish time and by -max_rate
+        self.targets = []
+        self.uncapped_rates = []
+        self.finish_times = []
+        self.capped_rates = []
+        self.sequence = 0
+        self.uncapped_count = 0
+        self.capped_count = 0
+        # sum of the max_rate of the capped flows
+        self.capped_rate = 0
+
+        # the pending wake up: its time and version, older versions are ignored
+        self.timer_time = infinity
+        self.timer_version = 0
+
+        # statistics: flows started, flows that crossed the fair share
+        self.flow_count = 0
+        self.move_count = 0
+
+    def capacity_at(self, time: float) -> float:
+        i = bisect_right(self.capacity.starts, time) - 1
+        return self.capacity.rates[i] if i >= 0 else 0
+
+    def next_capacity_change(self, time: float) -> float:
+        i = bisect_right(self.capacity.starts, time)
+        return self.capacity.starts[i] if i < self.capacity.starts.__len__() else infinity
+
+    def run(self, until=None):
+        self.env.run(until)
+
+    # the flow of byte_size bytes, event succeeds when it is transferred (an event of the link env if None)
+    def start(self, byte_size: float, max_rate: float = infinity, event: simpy.Event = None) -> Flow:
+        if max_rate <= 0:
+            raise ValueError("max_rate of a flow must be positive: %s" % max_rate)
+        flow = Flow(byte_size, max_rate, event if event is not None else self.env.event())
+        self.flow_count += 1
+        if byte_size <= 0:
+            flow.active = False
+            flow.event.succeed(flow)
+            return flow
+        self.advance()
+        flow.target = self.service + byte_size
+        self.push_uncapped(flow)
+        self.rebalance()
+        self.schedule()
+        return flow
+
+    # stops flow before it is finished, returns its remaining bytes
+    def stop(self, flow: Flow) -> float:
+        if not flow.active:
+            return 0
+        self.advance()
+        remaining = self.remove(flow)
+        flow.active = False
+        self.rebalance()
+        self.schedule()
+        return remaining
+
+    # current rate[B/s] of flow
+    def rate(self, flow: Flow) -> float:
+        if not flow.active:
+            return 0
+        return flow.max_rate if flow.capped else self.fair_share
+
+    # remaining bytes of flow now
+    def remaining(self, flow: Flow) -> float:
+        if not flow.active:
+            return 0
+        if flow.capped:
+            return max((flow.finish_time - self.env.now) * flow.max_rate, 0)
+        service = self.service
+        if self.uncapped_count > 0:
+            service += self.fair_share * (self.env.now - self.service_time)
+        return max(flow.target - service, 0)
+
+    # accrues the service since the last change, the capacity can only have changed now, wake ups are scheduled at
+    # its changes while flows are active
+    def advance(self):
+        now = self.env.now
+        if self.uncapped_count > 0 and now > self.service_time:
+            self.service += self.fair_share * (now - self.service_time)
+        self.service_time = now
+        self.capacity_now = self.capacity_at(now)
+
+    def push_uncapped(self, flow: Flow):
+        flow.capped = False
+        flow.version += 1
+        heappush(self.targets, (flow.target, self.sequence, flow.version, flow))
+        heappush(self.uncapped_rates, (flow.max_rate, self.sequence, flow.version, flow))
+        self.sequence += 1
+        self.uncapped_count += 1
+
+    def push_capped(self, flow: Flow):
+        flow.capped = True
+        flow.version += 1
+        heappush(self.finish_times, (flow.finish_time, self.sequence, flow.version, flow))
+        heappush(self.capped_rates, (-flow.max_rate, self.sequence, flow.version, flow))
+        self.sequence += 1
+        self.capped_count += 1
+        self.capped_rate += flow.max_rate
+
+    # flow of the first valid entry of heap, None if there is none
+    @staticmethod
+    def top(heap: list):
+        while heap.__len__() > 0:
+            key, sequence, version, flow = heap[0]
+            if flow.active and flow.version == version:
+                return flow
+            heappop(heap)
+        return None
+
+    # takes flow out of its set, returns its remaining bytes, the link must be advanced to now
+    def remove(self, flow: Flow) -> float:
+        if flow.capped:
+            remaining = (flow.finish_time - self.env.now) * flow.max_rate
+            self.capped_count -= 1
+            self.capped_rate = self.capped_rate - flow.max_rate if self.capped_count > 0 else 0
+        else:
+            remaining = flow.target - self.service
+            self.uncapped_count -= 1
+            if self.uncapped_count == 0:
+                # restarts the counter, the targets of later flows are then their byte sizes exactly
+                self.service = 0
+        flow.version += 1
+        return max(remaining, 0)
+
+    def cap(self, flow: Flow):
+        remaining = self.remove(flow)
+        flow.finish_time = self.env.now + remaining / flow.max_rate
+        self.push_capped(flow)
+        self.move_count += 1
+
+    def uncap(self, flow: Flow):
+        remaining = self.remove(flow)
+        flow.target = self.service + remaining
+        self.push_uncapped(flow)
+        self.move_count += 1
+
+    def level(self) -> float:
+        if self.uncapped_count > 0:
+            return (self.capacity_now - self.capped_rate) / self.uncapped_count
+        # nobody at the fair share: unlimited if the capped flows fit, otherwise the largest is uncapped
+        return infinity if self.capped_rate <= self.capacity_now else -infinity
+
+    # water filling from the last allocation: the fair share only falls while capped flows above it are uncapped,
+    # then only rises while flows below it are capped, so no flow moves back and forth
+    def rebalance(self):
+        while True:
+            flow = self.top(self.capped_rates)
+            if flow is None or flow.max_rate <= self.level():
+                break
+            self.uncap(flow)
+        while True:
+            flow = self.top(self.uncapped_rates)
+            if flow is None or flow.max_rate >= self.level():
+                break
+            self.cap(flow)
+        self.fair_share = max(self.level(), 0)
+
+    # time when the next flow finishes at the current rates
+    def next_finish_time(self) -> float:
+        time = infinity
+        flow = self.top(self.targets)
+        if flow is not None and 0 < self.fair_share < infinity:
+            time = self.service_time + (flow.target - self.service) / self.fair_share
+        flow = self.top(self.finish_times)
+        if flow is not None:
+            time = min(time, flow.finish_time)
+        return time
+
+    # one pending wake up at the next finish or capacity change, replaced whenever the rates change,
+    # an idle link does not wake up
+    def schedule(self):
+        time = self.next_finish_time()
+        if self.uncapped_count + self.capped_count > 0:
+            time = min(time, self.next_capacity_change(self.env.now))
+        self.timer_version += 1
+        self.timer_time = time
+        if time < infinity:
+            version = self.timer_version
+            timeout = self.env.timeout(max(time - self.env.now, 0))
+            timeout.callbacks.append(lambda event: self.wake(version))
+
+    def wake(self, version: int):
+        if version != self.timer_version:
+            return
+        # due is what schedule computed, the clock may differ from it by rounding
+        due = self.timer_time
+        fair_share = self.fair_share
+        service, service_time = self.service, self.service_time
+        self.advance()
+        finished = []
+        while True:
+            flow = self.top(self.targets)
+            if flow is None or not 0 < fair_share < infinity or \
+                    service_time + (flow.target - service) / fair_share > due:
+                break
+            self.service = max(self.service, flow.target)
+            self.remove(flow)
+            finished.append(flow)
+        while True:
+            flow = self.top(self.finish_times)
+            if flow is None or flow.finish_time > due:
+                break
+            self.remove(flow)
+            finished.append(flow)
+        self.rebalance()
+        self.schedule()
+        for flow in finished:
+            flow.active = False
+            flow.event.succeed(flow)
+
+
+class LinkDownload(Download):
+    # transfers its segment as a flow of the SharedLink of its client (env), the end of a transfer is only known when
+    # it finishes: it is recorded with the end at the rate it starts with and corrected then
+    def create_process(self):
+        self.flow = None
+        # the transfer was started once, a resumed transfer is not queued again
+        self.started = False
+        return super(LinkDownload, self).create_process()
+
+    def download(self):
+        done = False
+        while not done:
+            try:
+                if self.running:
+                    yield self.flow.event
+                    done = True
+                else:
+                    yield self.sleep_event
+            except simpy.Interrupt:
+                pass
+        self.complete()
+
+    def complete(self):
+        self.download_time = self.env.now - self.download_start
+        self.correct_record(self.hist[-1][0])
+        super(LinkDownload, self).complete()
+
+    # bytes left to transfer now
+    def remaining(self) -> float:
+        return self.env.link.remaining(self.flow) if self.running else self.remaining_bytes
+
+    # running and can be paused, its last byte did not arrive in this instant
+    def preemptible(self) -> bool:
+        return self.running and self.flow.active
+
+    # the last transfer record ends now with byte_size bytes
+    def correct_record(self, byte_size: float):
+        self.hist[-1] = (byte_size, self.hist[-1][1], self.env.now)
+        if self.history is not None:
+            self.history.update(self.records[-1], byte_size, self.env.now)
+
+    def start(self):
+        if not self.running and self.remaining_bytes > 0:
+            link = self.env.link
+            self.download_start = self.env.now
+            self.flow = link.start(self.remaining_bytes, self.env.max_rate, self.env.event())
+            rate = link.rate(self.flow)
+            self.download_time = self.remaining_bytes / rate if rate > 0 else infinity
+            self.hist.append((self.remaining_bytes, self.download_start, self.download_start + self.download_time))
+            if self.history is not None:
+                self.records.append(self.history.record(self, *self.hist[-1]))
+            if self.tracer.download:
+                self.tracer.emit(DownloadStarted(self.env.now, self.segment.segment_index, self.short,
+                                                 self.remaining_bytes, self.download_start + self.download_time))
+            self.running = True
+            self.process.interrupt("wake up")
+
+    def pause(self):
+        if self.running:
+            remaining_bytes = self.env.link.stop(self.flow)
+            self.correct_record(self.remaining_bytes - remaining_bytes)
+            self.remaining_bytes = remaining_bytes
+            if self.tracer.download:
+                self.tracer.emit(DownloadPaused(self.env.now, self.segment.segment_index, self.short,
+                                                self.remaining_bytes))
+            self.running = False
+            self.running_time += self.env.now - self.download_start
+            self.process.interrupt("sleep")
+
+
+class LinkDownloadManager(DownloadManager):
+    download_class = LinkDownload
+
+
+class LinkClient(SimEnv):
+    # a SimEnv session whose downloads share link with the other clients of link.env, all clients run together with
+    # link.run(), the arguments are the ones of SimEnv without bandwidth_trace
+    # max_rate: access rate[B/s] of the client, its flows never get more
+    # the client measures its throughput, the oracle of SimEnv would average the capacity of the whole link
+    download_manager_class = LinkDownloadManager
+
+    def __init__(self, link: SharedLink, max_rate: float, short_factor, threshold, start_representation, foo,
+                 segment_count, segment_sizes, deadlines, accum_viewport, viewport, tracer=None, profiler=None,
+                 allocation: str = "greedy", throughput: str = "mean"):
+        if throughput == "oracle":
+            raise ValueError("a client of a shared link measures its throughput, oracle is not available")
+        self.link = link
+        self.max_rate = max_rate
+        # time of the last event of the client, the end of its session
+        self.last_event_time = link.env.now
+        super(LinkClient, self).__init__(short_factor, threshold, start_representation, foo, link.capacity,
+                                         segment_count, segment_sizes, deadlines, accum_viewport, viewport, tracer,
+                                         profiler, allocation, throughput)
+
+    # the clock and the event queue are the ones of link.env
+
+    @property
+    def now(self):
+        return self.link.env.now
+
+    def schedule(self, event, priority=NORMAL, delay=0):
+        self.last_event_time = max(self.last_event_time, self.link.env.now + delay)
+        self.link.env.schedule(event, priority, delay)
+
+    def run(self, until=None):
+        raise ValueError("the clients of a shared link run together with SharedLink.run")
+
+    def metrics(self) -> dict:
+        metrics = super(LinkClient, self).metrics()
+        metrics["duration"] = self.last_event_time
+        return metrics
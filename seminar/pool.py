@@ -0,0 +1,308 @@
+from collections import deque
+
+import numpy
+import simpy
+
+from seminar.bandwidth import BandwidthManager
+from seminar.link import LinkDownload, SharedLink
+from seminar.simulation import Download, DownloadManager
+from seminar.trace import DownloadStarted, DownloadPaused, ManagerStarted, ManagerTerminated
+
+infinity = float("inf")
+
+
+# download manager with a pool of connections: up to connections downloads are transferred at once and share the
+# bandwidth of the session as flows of a SharedLink (SimEnv(..., connections=N))
+#
+# A connection is opened when it is used the first time, which takes connection_overhead seconds (handshakes), and
+# is kept open. Each connection transfers at most connection_rate, e.g. the limit of its congestion window.
+# multiplex: the downloads are streams of a single connection, it is opened once and connection_rate limits all of
+# them together. Queued short downloads always get the next free connection before long ones.
+#
+# preemption: whether a short download that finds every connection busy takes the connection of a long transfer,
+# "never" waits for a free one, "always" preempts, "deadline" only preempts if the short segment would not be there
+# before the playback reaches it otherwise (checked when a download is queued or a transfer ends). A preempted long
+# download is paused with its remaining bytes and resumed first when a connection is free again, no byte is
+# transferred twice.
+preemption_policies = ("never", "always", "deadline")
+
+
+class Connection:
+    def __init__(self):
+        # the opening of the connection, None while it was never used
+        self.opened = None
+
+
+# trace of bandwidth_manager with every bandwidth limited to rate
+def limited_bandwidth(bandwidth_manager: BandwidthManager, rate: float) -> BandwidthManager:
+    return BandwidthManager([(start, min(bandwidth, rate)) for start, bandwidth in
+                             zip(bandwidth_manager.starts, bandwidth_manager.rates)])
+
+
+class TileDownload(LinkDownload):
+    # transfers its segment as a sequence of requests for groups of tiles over its connection, the viewport tiles
+    # first, then the others by their share of the accumulated viewport (SimEnv(..., tile_requests=n))
+    # The first byte of a request arrives request_delay after it was sent, and pipelining requests are sent at once:
+    # a request is sent when the one pipelining places before it is finished, its first byte arrives when the one
+    # before it is finished. A paused download sends its unfinished requests again when it is resumed.
+    # The segment is ready for playback once its viewport tiles arrived, the others may still be in flight.
+    def create_process(self):
+        env = self.env
+        manager = env.download_manager
+        index = self.segment.segment_index
+        tile_count = self.segment.tiles.__len__()
+        # segments past the viewport tables have neither viewport nor accumulated viewport
+        in_viewport = numpy.zeros(tile_count, dtype=bool)
+        if index < env.viewport_tiles.shape[0]:
+            in_viewport = env.viewport_tiles[index]
+        if manager.tile_requests is None:
+            # one request for the whole segment
+            orders = [numpy.arange(0, tile_count)]
+        else:
+            shares = numpy.nan_to_num(env.normalized_accum_viewport[index]) if \
+                index < env.normalized_accum_viewport.shape[0] else numpy.zeros(tile_count)
+            viewport = numpy.flatnonzero(in_viewport)
+            others = numpy.flatnonzero(~in_viewport)
+            others = others[numpy.argsort(-shares[others], kind="stable")]
+            orders = [order[i:i + manager.tile_requests] for order in (viewport, others)
+                      for i in range(0, order.__len__(), manager.tile_requests)]
+        tiles = numpy.frombuffer(self.segment.tiles, dtype=numpy.float64)
+        # (bitmask of the tiles, bytes) per request, in request order
+        self.requests = [(sum(1 << tile for tile in order.tolist()), float(tiles[order].sum())) for order in orders]
+        self.viewport_mask = sum(1 << tile for tile in numpy.flatnonzero(in_viewport).tolist())
+        self.full_mask = (1 << tile_count) - 1
+        # bitmask of the tiles that arrived
+        self.tile_mask = 0
+        self.request_index = 0
+        # a request of flow is transferred
+        self.in_flight = False
+        self.request_remaining = self.requests[0][1] if self.requests.__len__() > 0 else 0
+        # send times of the next requests
+        self.sends = deque()
+        return super(TileDownload, self).create_process()
+
+    def download(self):
+        manager = self.env.download_manager
+        while self.request_index < self.requests.__len__():
+            try:
+                if not self.running:
+                    yield self.sleep_event
+                    continue
+                first_byte = self.sends[0] + manager.request_delay
+                if first_byte > self.env.now:
+                    yield self.env.timeout(first_byte - self.env.now)
+                self.sends.popleft()
+                self.start_request()
+                yield self.flow.event
+                self.finish_request()
+            except simpy.Interrupt:
+                pass
+        self.complete()
+
+    def start_request(self):
+        link = self.env.link
+        self.flow = link.start(self.request_remaining, self.env.max_rate, self.env.event())
+        self.in_flight = True
+        rate = link.rate(self.flow)
+        end = self.env.now + (self.request_remaining / rate if rate > 0 else infinity)
+        self.hist.append((self.request_remaining, self.env.now, end))
+        if self.history is not None:
+            self.records.append(self.history.record(self, *self.hist[-1]))
+
+    def finish_request(self):
+        was_ready = self.ready()
+        self.in_flight = False
+        self.correct_record(self.request_remaining)
+        self.remaining_bytes -= self.request_remaining
+        self.tile_mask |= self.requests[self.request_index][0]
+        self.request_index += 1
+        if self.request_index < self.requests.__len__():
+            self.request_remaining = self.requests[self.request_index][1]
+        pipelined = self.request_index + self.env.download_manager.pipelining - 1
+        if pipelined < self.requests.__len__():
+            self.sends.append(self.env.now)
+        if not was_ready and self.ready():
+            self.env.wake_playback()
+
+    def complete(self):
+        self.download_time = self.env.now - self.download_start
+        Download.complete(self)
+
+    def ready(self) -> bool:
+        if self.viewport_mask == 0:
+            return self.finished()
+        return self.tile_mask & self.viewport_mask == self.viewport_mask
+
+    def arrived_tiles(self) -> int:
+        return self.tile_mask if self.remaining_bytes > 0 else self.full_mask
+
+    # bytes left to transfer now
+    def remaining(self) -> float:
+        if self.in_flight:
+            return self.remaining_bytes - self.request_remaining + self.env.link.remaining(self.flow)
+        return self.remaining_bytes
+
+    # also while it waits for the first byte of a request, not if its last request finished in this instant
+    def preemptible(self) -> bool:
+        return self.running and not (self.in_flight and not self.flow.active and
+                                     self.request_index == self.requests.__len__() - 1)
+
+    def start(self):
+        if not self.running and self.remaining_bytes > 0:
+            now = self.env.now
+            self.download_start = now
+            # the unfinished requests are sent again
+            pipelined = min(self.env.download_manager.pipelining, self.requests.__len__() - self.request_index)
+            self.sends = deque(now for _ in range(0, pipelined))
+            if self.tracer.download:
+                capacity = self.env.link.capacity_at(now)
+                self.tracer.emit(DownloadStarted(now, self.segment.segment_index, self.short, self.remaining_bytes,
+                                                 now + (self.remaining_bytes / capacity if capacity > 0 else infinity)))
+            self.running = True
+            self.process.interrupt("wake up")
+
+    def pause(self):
+        if self.running:
+            if self.in_flight and not self.flow.active:
+                # the request finished in this instant, before the process took note of it
+                self.finish_request()
+            elif self.in_flight:
+                remaining = self.env.link.stop(self.flow)
+                self.in_flight = False
+                transferred = self.request_remaining - remaining
+                self.correct_record(transferred)
+                self.remaining_bytes -= transferred
+                self.request_remaining = remaining
+            if self.tracer.download:
+                self.tracer.emit(DownloadPaused(self.env.now, self.segment.segment_index, self.short,
+                                                self.remaining_bytes))
+            self.running = False
+            self.running_time += self.env.now - self.download_start
+            self.process.interrupt("sleep")
+
+
+class PooledDownloadManager(DownloadManager):
+    download_class = LinkDownload
+
+    def __init__(self, env, bandwidth_manager, buffer, tracer=None, profiler=None, connections: int = 1,
+                 connection_overhead: float = 0, connection_rate: float = infinity, multiplex: bool = False,
+                 preemption: str = "never", tile_requests: int = None, request_delay: float = 0,
+                 pipelining: int = 1):
+        if connections < 1:
+            raise ValueError("a connection pool needs at least one connection: %s" % connections)
+        if preemption not in preemption_policies:
+            raise ValueError("unknown preemption policy: %s" % preemption)
+        self.preemption = preemption
+        # tile_requests: tiles per request of a TileDownload, None requests whole segments,
+        # request_delay: seconds from a request to its first byte, pipelining: requests of a download in flight
+        if tile_requests is not None and tile_requests < 1 or pipelining < 1:
+            raise ValueError("tile_requests and pipelining must be at least 1: %s, %s" % (tile_requests, pipelining))
+        self.tile_requests = tile_requests
+        self.request_delay = request_delay
+        self.pipelining = pipelining
+        if tile_requests is not None or request_delay > 0:
+            self.download_class = TileDownload
+        self.connection_overhead = connection_overhead
+        self.multiplex = multiplex
+        # the downloads read the link and the rate limit of their flows from env
+        if multiplex:
+            env.link = SharedLink(limited_bandwidth(bandwidth_manager, connection_rate), env)
+            env.max_rate = infinity
+            self.idle_connections = None
+            self.connection = Connection()
+        else:
+            env.link = SharedLink(bandwidth_manager, env)
+            env.max_rate = connection_rate
+            self.idle_connections = [Connection() for _ in range(0, connections)]
+        self.free = connections
+        # download -> process of its transfer, while the download holds a connection
+        self.transfers = {}
+        # downloads whose transfer is interrupted but did not end yet, they are not preempted twice
+        self.preempted = set()
+        # seconds from queueing to the first start of the transfer and to its end, per class (short = True)
+        self.queueing_delays = {True: [], False: []}
+        self.latencies = {True: [], False: []}
+        self.preemptions = 0
+        super(PooledDownloadManager, self).__init__(env, bandwidth_manager, buffer, tracer, profiler)
+
+    def download(self):
+        if self.tracer.manager:
+            self.tracer.emit(ManagerStarted(self.env.now))
+        while not self.terminated:
+            while self.free > 0 and self.download_short.__len__() + self.download_long.__len__() > 0:
+                queue = self.download_short if self.download_short.__len__() > 0 else self.download_long
+                self.free -= 1
+                download = queue.pop(0)
+                self.transfers[download] = self.env.process(self.transfer(download))
+            if self.free == 0 and self.download_short.__len__() > 0 and self.preemption != "never":
+                self.preempt(self.download_short[0])
+            try:
+                yield self.sleep_event
+            except simpy.Interrupt:
+                pass
+        if self.tracer.manager:
+            self.tracer.emit(ManagerTerminated(self.env.now))
+
+    def transfer(self, download):
+        connection = self.connection if self.multiplex else self.idle_connections.pop()
+        if connection.opened is None:
+            connection.opened = self.env.timeout(self.connection_overhead)
+        # downloads on a connection that is still opening wait for it
+        if not connection.opened.processed:
+            yield connection.opened
+        if not download.started:
+            download.started = True
+            self.queueing_delays[download.short].append(self.env.now - download.queue_time)
+        download.start()
+        try:
+            yield download.process
+            self.latencies[download.short].append(self.env.now - download.queue_time)
+        except simpy.Interrupt:
+            self.preempted.discard(download)
+            if download.preemptible():
+                # resumed before the other long downloads
+                download.pause()
+                self.download_long.insert(0, download)
+                self.preemptions += 1
+            else:
+                # finished in the same instant
+                yield download.process
+                self.latencies[download.short].append(self.env.now - download.queue_time)
+        del self.transfers[download]
+        if not self.multiplex:
+            self.idle_connections.append(connection)
+        self.free += 1
+        if self.process.is_alive:
+            self.process.interrupt("connection free")
+
+    # interrupts the running long transfer with the most remaining bytes if the policy lets short take its connection
+    def preempt(self, short):
+        victim = None
+        for download in self.transfers:
+            if not download.short and download.preemptible() and download not in self.preempted \
+                    and (victim is None or download.remaining() > victim.remaining()):
+                victim = download
+        if victim is None:
+            return
+        if self.preemption == "deadline":
+            # short gets the fair share of a connection, now or when the first transfer finishes, and its first byte
+            # arrives request_delay after that, the rates of the transfers now are 0 while they wait for a request
+            share = min(self.env.link.capacity_at(self.env.now) / self.transfers.__len__(), self.env.max_rate)
+            remaining = min(download.remaining() for download in self.transfers)
+            wait = remaining / share if share > 0 else infinity
+            transfer_time = self.request_delay + (short.remaining_bytes / share if share > 0 else infinity)
+            if self.env.now + wait + transfer_time <= self.env.segment_deadline(short.segment.segment_index):
+                return
+        self.transfers[victim].interrupt("preempted")
+        self.preempted.add(victim)
+
+    # mean queueing delay and latency of the short and long downloads, None without downloads of the class
+    def delay_metrics(self) -> dict:
+        metrics = {}
+        for short, name in ((True, "short"), (False, "long")):
+            for kind, delays in (("queueing_delay", self.queueing_delays[short]), ("latency", self.latencies[short])):
+                mean = float(sum(delays) / delays.__len__()) if delays.__len__() > 0 else None
+                metrics["%s_%s" % (name, kind)] = mean
+        metrics["preemptions"] = self.preemptions
+        metrics["late_tiles"] = self.buffer.late_tiles
+        return metrics
@@ -0,0 +1,63 @@
+from collections import defaultdict
+from time import perf_counter
+
+
+class Profiler:
+    # counts calls and wall time of wrapped functions per component
+    # seconds include nested components (e.g. buffer level queries inside adaption decisions),
+    # own_seconds do not, so own_seconds of "run" is the time spent in SimPy and the process generators
+    def __init__(self):
+        self.calls = defaultdict(int)
+        self.seconds = defaultdict(float)
+        self.own_seconds = defaultdict(float)
+        # time spent in nested components, per wrapped call that is running
+        self.stack = []
+
+    def wrap(self, component: str, function):
+        def wrapper(*args, **kwargs):
+            self.stack.append(0.0)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                nested = self.stack.pop()
+                self.calls[component] += 1
+                self.seconds[component] += elapsed
+                self.own_seconds[component] += elapsed - nested
+                if self.stack.__len__() > 0:
+                    self.stack[-1] += elapsed
+        return wrapper
+
+    # replaces the methods of obj with wrapped versions, only obj is affected, not its class, obj should not be used by
+    # other runs: their calls would be counted too, and every instrument adds a wrapper
+    def instrument(self, obj, component: str, *methods):
+        for method in methods:
+            setattr(obj, method, self.wrap(component, getattr(obj, method)))
+
+    # component -> {"calls", "seconds", "own_seconds"}
+    def report(self) -> dict:
+        return {component: {"calls": self.calls[component],
+                            "seconds": self.seconds[component],
+                            "own_seconds": self.own_seconds[component]} for component in self.calls}
+
+
+def merge_reports(reports) -> dict:
+    merged = {}
+    for report in reports:
+        for component, values in report.items():
+            if component not in merged:
+                merged[component] = {"calls": 0, "seconds": 0.0, "own_seconds": 0.0}
+            for key in merged[component]:
+                merged[component][key] += values[key]
+    return merged
+
+
+def format_report(report: dict) -> str:
+    total = sum(values["own_seconds"] for values in report.values())
+    lines = ["%-14s %10s %12s %12s %7s" % ("component", "calls", "seconds", "own seconds", "own %")]
+    for component, values in sorted(report.items(), key=lambda item: -item[1]["own_seconds"]):
+        lines.append("%-14s %10d %12.4f %12.4f %6.1f%%" % (component, values["calls"], values["seconds"],
+                                                          values["own_seconds"],
+                                                          100 * values["own_seconds"] / total if total > 0 else 0))
+    return "\n".join(lines)
@@ -1,12 +1,21 @@
+from array import array
+
+
 class Segment:
+    __slots__ = ("segment_index", "representation", "duration", "tiles", "tile_qualities", "size")
+
     # segment_index: which segment of the video
-    # tiles: list, with byte size per tile
-    def __init__(self, segment_index: int, representation: int, duration: float, tiles: list, tile_qualities: list):
+    # tiles: byte size per tile, stored as array of double
+    # tile_qualities: quality per tile, stored as array of signed char
+    # both also accept the raw bytes of such an array (e.g. numpy float64 / int8 tobytes())
+    def __init__(self, segment_index: int, representation: int, duration: float, tiles, tile_qualities):
         self.segment_index = segment_index
         self.representation = representation
         self.duration = duration
-        self.tiles = tiles
-        self.tile_qualities = tile_qualities
+        self.tiles = array("d", tiles)
+        self.tile_qualities = array("b", tile_qualities)
+        # byte size of the segment, summed in tile order like sum(tiles)
+        self.size = sum(self.tiles)
 
     def __len__(self):
-        return sum(self.tiles)
+        return self.size
@@ -0,0 +1,123 @@
+from multiprocessing import shared_memory
+
+import numpy
+
+from seminar.bandwidth import BandwidthManager, IndexedBandwidthManager
+
+# dataset tables and bandwidth traces published once into shared memory for the worker processes of a sweep
+#
+# The publishing process replaces them in the configurations by small references (SharedArray, SharedBandwidth),
+# so a task only pickles its parameters. A worker attaches every block once and passes read only views of it to
+# SimEnv, no worker holds a copy. The publisher unlinks the blocks when it closes.
+# Workers have to be started after the first block is published: creating it starts the resource tracker of the
+# publisher, which forked or spawned workers then share. A worker started before has its own tracker, that unlinks
+# the blocks it attached when the worker exits.
+
+# SimEnv arguments that are published
+shared_parameters = ["segment_sizes", "deadlines", "accum_viewport", "viewport"]
+
+# shared memory blocks attached by this process: name -> SharedMemory
+attached = {}
+
+
+def attach(name: str) -> shared_memory.SharedMemory:
+    block = attached.get(name)
+    if block is None:
+        # workers share the resource tracker of the publisher, their registration is the publisher's one
+        block = shared_memory.SharedMemory(name)
+        attached[name] = block
+    return block
+
+
+class SharedArray:
+    # reference to a numpy array in shared memory, pickles as its block name, dtype and shape
+    def __init__(self, name: str, dtype: str, shape: tuple):
+        self.name = name
+        self.dtype = dtype
+        self.shape = shape
+
+    def view(self) -> numpy.ndarray:
+        array = numpy.ndarray(self.shape, dtype=self.dtype, buffer=attach(self.name).buf)
+        array.flags.writeable = False
+        return array
+
+
+class SharedBandwidth:
+    # reference to the index of a BandwidthManager in shared memory
+    def __init__(self, starts: SharedArray, rates: SharedArray, cumulative_bytes: SharedArray):
+        self.starts = starts
+        self.rates = rates
+        self.cumulative_bytes = cumulative_bytes
+
+    # a manager over float memoryviews of the index, they index to Python floats like the lists of BandwidthManager
+    def manager(self) -> IndexedBandwidthManager:
+        return IndexedBandwidthManager(memoryview(self.starts.view()), memoryview(self.rates.view()),
+                                       memoryview(self.cumulative_bytes.view()))
+
+
+class SharedTables:
+    # the publisher: every distinct table is published once, however many configurations use it
+    def __init__(self):
+        self.blocks = []
+        # id of a published value -> (value, reference), the value is kept so its id is not reused
+        self.published = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def publish_array(self, values) -> SharedArray:
+        array = numpy.ascontiguousarray(values)
+        if array.dtype.kind not in "biuf":
+            raise TypeError("only numeric tables can be shared, not %s" % array.dtype)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.blocks.append(block)
+        attached[block.name] = block
+        numpy.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        return SharedArray(block.name, array.dtype.str, array.shape)
+
+    # bandwidth_trace: list of (time, bandwidth) or BandwidthManager, its index is published as doubles
+    def publish_bandwidth(self, bandwidth_trace) -> SharedBandwidth:
+        manager = bandwidth_trace
+        if not isinstance(manager, BandwidthManager):
+            manager = BandwidthManager(bandwidth_trace)
+        return SharedBandwidth(*[self.publish_array(numpy.asarray(values, dtype=float)) for values in
+                                 (manager.starts, manager.rates, manager.cumulative_bytes)])
+
+    def reference(self, value, bandwidth: bool):
+        entry = self.published.get(id(value))
+        if entry is None:
+            entry = (value, self.publish_bandwidth(value) if bandwidth else self.publish_array(value))
+            self.published[id(value)] = entry
+        return entry[1]
+
+    # config with the dataset tables and the bandwidth trace replaced by references
+    def share_config(self, config: dict) -> dict:
+        shared = dict(config)
+        for parameter in shared_parameters:
+            if parameter in shared:
+                shared[parameter] = self.reference(shared[parameter], False)
+        if "bandwidth_trace" in shared:
+            shared["bandwidth_trace"] = self.reference(shared["bandwidth_trace"], True)
+        return shared
+
+    def close(self):
+        for block in self.blocks:
+            attached.pop(block.name, None)
+            block.close()
+            block.unlink()
+        self.blocks = []
+        self.published = {}
+
+
+# config with the references of share_config replaced by views of the shared memory, other configs unchanged
+def resolve_config(config: dict) -> dict:
+    resolved = dict(config)
+    for parameter, value in config.items():
+        if isinstance(value, SharedArray):
+            resolved[parameter] = value.view()
+        elif isinstance(value, SharedBandwidth):
+            resolved[parameter] = value.manager()
+    return resolved
@@ -1,27 +1,39 @@
+from bisect import bisect_left
+from collections import OrderedDict
+from copy import copy
+
+import numpy
 import simpy
 from seminar.bandwidth import BandwidthManager
 from seminar.segment import Segment
 from seminar.adaption import Name, DualAdaption
-from seminar.buffer import Buffer
+from seminar.allocation import knapsack_allocation
+from seminar.buffer import Buffer, BufferTrack, DownloadHistory, ArrayBuffer, ramp_levels
+from seminar.trace import Tracer, TextSink, DownloadQueued, DownloadStarted, DownloadPaused, DownloadFinished, \
+    SegmentMoved, PlaybackStarted, PlaybackFinished, StallBegin, StallEnd, AdaptionDecision, ManagerStarted, \
+    ManagerTerminated
+from seminar.profiling import Profiler
+from seminar.throughput import ThroughputEstimator
 
 import seminar.values
 
+# SimEnv without a tracer prints every trace record if verbose
 verbose = True
 
 
-def simprint(env: simpy.Environment, msg: str):
-    if verbose:
-        print("%f: %s" % (env.now, msg))
-
-
 class Download:
-    def __init__(self, env: simpy.Environment, segment: Segment, bandwidth_manager: BandwidthManager, short: bool):
+    def __init__(self, env: simpy.Environment, segment: Segment, bandwidth_manager: BandwidthManager, short: bool,
+                 history: DownloadHistory = None, tracer: Tracer = None):
         self.env = env
         self.segment = segment
         self.bandwidth_manager = bandwidth_manager
         self.short = short
+        self.history = history
+        self.tracer = tracer if tracer is not None else Tracer()
 
         self.hist = []
+        # indices of the hist entries in history
+        self.records = []
 
         self.download_start = 0
         self.download_time = 0
@@ -30,8 +42,12 @@ class Download:
         self.running_time = 0
         self.queue_time = env.now
 
-        self.sleep_event = env.event()
-        self.process = env.process(self.download())
+        self.process = self.create_process()
+
+    # the process that waits for the transfer, start and pause interrupt it
+    def create_process(self):
+        self.sleep_event = self.env.event()
+        return self.env.process(self.download())
 
     def download(self):
         done = False
@@ -44,9 +60,16 @@ class Download:
                     yield self.sleep_event
             except simpy.Interrupt:
                 pass
+        self.complete()
+
+    def complete(self):
         self.running = False
         self.running_time += self.env.now - self.download_start
         self.remaining_bytes = 0
+        if self.history is not None:
+            self.history.download_finished(self)
+        if self.tracer.download:
+            self.tracer.emit(DownloadFinished(self.env.now, self.segment.segment_index, self.short))
 
     def progress(self, time):
         downloaded = 0
@@ -61,6 +84,14 @@ class Download:
     def finished(self):
         return self.remaining_bytes == 0
 
+    # the segment can be played
+    def ready(self):
+        return self.finished()
+
+    # bitmask of the tiles that arrived, bit t for tile t
+    def arrived_tiles(self) -> int:
+        return (1 << self.segment.tiles.__len__()) - 1 if self.finished() else 0
+
     def average_bandwidth(self):
         return (self.segment.__len__() - self.remaining_bytes) / self.running_time
 
@@ -69,18 +100,27 @@ class Download:
             self.download_start = self.env.now
             self.download_time = self.bandwidth_manager.get_download_time(self.env.now, self.remaining_bytes)
             self.hist.append((self.remaining_bytes, self.download_start, self.download_start + self.download_time))
+            if self.history is not None:
+                self.records.append(self.history.record(self, *self.hist[-1]))
+            if self.tracer.download:
+                self.tracer.emit(DownloadStarted(self.env.now, self.segment.segment_index, self.short,
+                                                 self.remaining_bytes, self.download_start + self.download_time))
             self.running = True
             self.process.interrupt("wake up")
 
     def pause(self):
         if self.running:
-            simprint(self.env, "paused: %d" % self.segment.segment_index)
             if self.download_start < self.env.now:
                 average_bandwidth = self.bandwidth_manager.get_average_bandwidth(self.download_start, self.env.now)
                 self.remaining_bytes -= average_bandwidth * (self.env.now - self.download_start)
                 assert self.remaining_bytes >= 0
                 hist = self.hist[-1]
                 self.hist[-1] = (hist[0] - self.remaining_bytes, hist[1], self.env.now)
+                if self.history is not None:
+                    self.history.update(self.records[-1], self.hist[-1][0], self.env.now)
+            if self.tracer.download:
+                self.tracer.emit(DownloadPaused(self.env.now, self.segment.segment_index, self.short,
+                                                self.remaining_bytes))
             self.running = False
             self.running_time += self.env.now - self.download_start
             self.process.interrupt("sleep")
@@ -88,14 +128,24 @@ class Download:
 
 class DualBuffer:
     def __init__(self):
-        self.short_segments = {}
-        self.long_segments = {}
+        # transfer records of all downloads, short_segments and long_segments keep running totals over them
+        self.history = DownloadHistory()
+        self.short_segments = BufferTrack(self.history)
+        self.long_segments = BufferTrack(self.history)
         self.playback = []
+        self.playback_starts = ArrayBuffer()
+        self.playback_finishes = ArrayBuffer()
+        self.playback_durations = ArrayBuffer()
+        # played[i] = seconds played by the first i playbacks
+        self.played = ArrayBuffer()
+        self.played.append(0)
 
         # watched segments, short > long
         self.watched = []
         # combines short and long segment, if both are completely downloaded
         self.super_watched = []
+        # tiles that had not arrived when their segment started playing
+        self.late_tiles = 0
 
     def download_short_segment(self, segment: Segment, download: Download):
         self.short_segments[segment.segment_index] = (segment, download)
@@ -104,72 +154,103 @@ class DualBuffer:
         self.long_segments[segment.segment_index] = (segment, download)
 
     def playback_level(self, time):
-        playback_level = 0
-        for (playback_start, playback_finish, segment_duration) in self.playback:
-            if playback_start < time:
-                if playback_finish < time:
-                    playback_level += segment_duration
-                else:
-                    playback_level += segment_duration * (
-                            (time - playback_start) / (playback_finish - playback_start))
-        return playback_level
+        # playbacks do not overlap, only the last one started before time can be running
+        i = bisect_left(self.playback_starts.data, time, 0, self.playback_starts.__len__())
+        if i == 0:
+            return 0
+        playback_start, playback_finish, segment_duration = self.playback[i - 1]
+        if playback_finish < time:
+            return self.played[i - 1] + segment_duration
+        return self.played[i - 1] + segment_duration * (
+                (time - playback_start) / (playback_finish - playback_start))
 
     def buffer_level(self, time):
-        buffer_level = 0
-        add = 6
-        for segment, download in self.long_segments.values():
-            if segment.segment_index == 0:
-                add = 0
-            if download.queue_time < time:
-                buffer_level += segment.duration * download.progress(time)
-        buffer_level += add
-        return buffer_level - self.playback_level(time)
+        # the long buffer starts with 6 seconds, unless it downloads the first segment itself
+        add = 0 if 0 in self.long_segments else 6
+        return self.long_segments.level(time) + add - self.playback_level(time)
 
     def buffer_level_short(self, time):
-        buffer_level = 0
-        for segment, download in self.short_segments.values():
-            if download.queue_time < time:
-                buffer_level += segment.duration * download.progress(time)
         # print("buffer ", time, buffer_level, self.playback_level(time))
-        return buffer_level - self.playback_level(time)
+        return self.short_segments.level(time) - self.playback_level(time)
+
+    # playback_level, buffer_level and buffer_level_short for an array of times
+
+    def playback_level_many(self, times) -> numpy.ndarray:
+        times = numpy.asarray(times, dtype=float)
+        finishes = self.playback_finishes.view()
+        return ramp_levels(times, self.playback_starts.view(), finishes, self.playback_durations.view(), finishes,
+                           self.played.view().__getitem__)
+
+    def buffer_level_many(self, times) -> numpy.ndarray:
+        times = numpy.asarray(times, dtype=float)
+        add = 0 if 0 in self.long_segments else 6
+        return self.long_segments.level_many(times) + add - self.playback_level_many(times)
+
+    def buffer_level_short_many(self, times) -> numpy.ndarray:
+        times = numpy.asarray(times, dtype=float)
+        return self.short_segments.level_many(times) - self.playback_level_many(times)
+
+    # rows of (time, buffer_level, buffer_level_short, playback_level)
+    def buffer_trace(self, times) -> numpy.ndarray:
+        times = numpy.asarray(times, dtype=float)
+        return numpy.column_stack((times, self.buffer_level_many(times), self.buffer_level_short_many(times),
+                                   self.playback_level_many(times)))
+
+    # segment index is in the short or the long buffer, downloaded or not
+    def queued(self, index):
+        return index in self.short_segments or index in self.long_segments
 
     def playback_available(self, index):
-        return (index in self.short_segments and self.short_segments[index][1].finished()) or (
-                index in self.long_segments and self.long_segments[index][1].finished())
+        return (index in self.short_segments and self.short_segments[index][1].ready()) or (
+                index in self.long_segments and self.long_segments[index][1].ready())
 
     def playback_start_next(self, time, index) -> (Segment, float):
-        if index in self.short_segments and self.short_segments[index][1].finished():
+        if index in self.short_segments and self.short_segments[index][1].ready():
             segment, download = self.short_segments[index]
         else:
             segment, download = self.long_segments[index]
             if index not in self.short_segments:
                 self.short_segments[index] = (segment, download)
         self.watched.append((time, segment, download))
+        self.late_tiles += segment.tiles.__len__() - download.arrived_tiles().bit_count()
         if index in self.short_segments and index in self.long_segments and self.short_segments[index][1].finished() and self.long_segments[index][1].finished():
             tmp = [short_tiles if short_tiles > long_tiles else long_tiles for short_tiles, long_tiles in zip(self.short_segments[index][0].tile_qualities, self.long_segments[index][0].tile_qualities)]
             self.super_watched.append(tmp)
         else:
             self.super_watched.append(segment.tile_qualities)
         tmp = (time, time + segment.duration, segment.duration)
+        self.playback_starts.append(tmp[0])
+        self.playback_finishes.append(tmp[1])
+        self.playback_durations.append(tmp[2])
+        self.played.append(self.played[self.played.__len__() - 1] + tmp[2])
         self.playback.append(tmp)
         return segment, segment.duration
 
 
 class DownloadManager:
-    def __init__(self, env: simpy.Environment, bandwidth_manager: BandwidthManager, buffer: DualBuffer):
+    download_class = Download
+
+    def __init__(self, env: simpy.Environment, bandwidth_manager: BandwidthManager, buffer: DualBuffer,
+                 tracer: Tracer = None, profiler: Profiler = None):
         self.env = env
         self.bandwidth_manager = bandwidth_manager
         self.buffer = buffer
+        self.tracer = tracer if tracer is not None else Tracer()
+        self.profiler = profiler
 
         self.terminated = False
         self.download_short = []
         self.download_long = []
 
+        self.process = self.create_process()
+
+    def create_process(self):
         self.sleep_event = self.env.event()
-        self.process = env.process(self.download())
+        return self.env.process(self.download())
 
     def download(self):
-        simprint(self.env, "Download Manager started")
+        if self.tracer.manager:
+            self.tracer.emit(ManagerStarted(self.env.now))
         while not self.terminated:
             try:
                 if self.download_short.__len__() > 0:
@@ -184,10 +265,15 @@ class DownloadManager:
                     yield self.sleep_event
             except simpy.Interrupt:
                 pass
-        simprint(self.env, "Download Manager terminated")
+        if self.tracer.manager:
+            self.tracer.emit(ManagerTerminated(self.env.now))
 
     def queue_download(self, segment: Segment, short: bool) -> simpy.Process:
-        download = Download(self.env, segment, self.bandwidth_manager, short)
+        download = self.download_class(self.env, segment, self.bandwidth_manager, short, self.buffer.history, self.tracer)
+        if self.profiler is not None:
+            self.profiler.instrument(download, "download", "start", "pause")
+        if self.tracer.download:
+            self.tracer.emit(DownloadQueued(self.env.now, segment.segment_index, segment.representation, short))
         if short:
             self.buffer.download_short_segment(segment, download)
             self.download_short.append(download)
@@ -205,16 +291,14 @@ class DownloadManager:
         self.process.interrupt("terminated")
 
 
-class SimEnv(simpy.Environment):
-    def __init__(self, short_factor, threshold, start_representation, foo,
-                 bandwidth_trace, segment_count, segment_sizes, deadlines, accum_viewport, viewport):
-        super(SimEnv, self).__init__()
-
-        self.short_factor = short_factor
-        self.q_threshold = threshold
-        self.starting_representation = start_representation
-        self.foo = foo
-
+class SegmentTables:
+    # dataset tables, segment builders and adaption parameters of a session, shared by SimEnv and seminar.fluid
+    # allocation: how the byte budget of a viewport weighted segment is split over its tiles,
+    # "greedy" per tile by its viewport share, "knapsack" for the highest viewport weighted quality
+    def __init__(self, segment_count, segment_sizes, deadlines, accum_viewport, viewport, allocation: str = "greedy"):
+        if allocation not in ("greedy", "knapsack"):
+            raise ValueError("unknown allocation: %s" % allocation)
+        self.allocation = allocation
         self.segment_count = segment_count
         self.segment_sizes = segment_sizes
         self.deadlines = deadlines
@@ -225,6 +309,28 @@ class SimEnv(simpy.Environment):
         self.segment_duration = 2
         self.tile_count_short = 12
 
+        # dataset tables, tile_sizes[i][q] = byte size of one tile of segment i in quality q,
+        # viewport_tiles[i][t] = tile t of segment i is in the viewport,
+        # normalized_accum_viewport[i][t] = share of tile t in the accumulated viewport of segment i
+        self.tile_sizes = numpy.asarray(segment_sizes, dtype=float) / self.tile_count
+        self.viewport_tiles = numpy.asarray(viewport) == 1
+        accum_viewport_table = numpy.asarray(accum_viewport, dtype=float)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            self.normalized_accum_viewport = accum_viewport_table / accum_viewport_table.sum(axis=1, keepdims=True)
+        # suffix_min_tile_sizes[i][q] = min(tile_sizes[i][q:]), non decreasing in q, so the highest quality below a
+        # budget is found with searchsorted even if the quality ladder of a segment is not sorted
+        self.suffix_min_tile_sizes = numpy.minimum.accumulate(self.tile_sizes[:, ::-1], axis=1)[:, ::-1]
+        # accum_viewport_allocation[r][i][t] = quality of tile t of segment i for representation r,
+        # see precompute_accum_viewport_allocation
+        self.accum_viewport_allocation = None
+        # (mode, index, representation) -> Segment, least recently used first
+        self.segment_cache = OrderedDict()
+        self.segment_cache_size = 1024
+        self.segment_builders = {"accum_viewport": self.build_accum_viewport_segment,
+                                 "knapsack": self.build_knapsack_segment,
+                                 "even": self.build_even_segment,
+                                 "viewport": self.build_viewport_segment}
+
         # average byte / second per quality
         self.byte_rates = [0] * segment_sizes[0].__len__()
         for segment_size_per_quality in segment_sizes:
@@ -237,32 +343,184 @@ class SimEnv(simpy.Environment):
         self.short_byte_rates = [byte_rate * (self.tile_count_short / self.tile_count) + byte_rate_0 for byte_rate in
                                  self.byte_rates]
 
-        self.bandwidth_manager = BandwidthManager(bandwidth_trace)
+        # parameters of DualAdaption.get for the short and the long pipeline
+        self.short_param = {"r": self.short_byte_rates,
+                            "r_max": self.short_byte_rates.__len__() - 1,
+                            "r_min": 0,
+                            "b_min": 2,
+                            "b_low": 3,
+                            "b_high": 5}
+        self.long_param = {"r": self.byte_rates,
+                           "r_max": self.byte_rates.__len__() - 1,
+                           "r_min": 0,
+                           "b_min": 5,
+                           "b_low": 20,
+                           "b_high": 50}
+
+    def get_segment_duration(self, index):
+        return self.deadlines[index + 1] - self.deadlines[index]
+
+    # segments are built once per (mode, index, representation) and shared, they are never modified
+    def cached_segment(self, mode: str, representation, index) -> Segment:
+        key = (mode, index, representation)
+        segment = self.segment_cache.get(key)
+        if segment is None:
+            segment = self.segment_builders[mode](representation, index)
+            self.segment_cache[key] = segment
+            if self.segment_cache.__len__() > self.segment_cache_size:
+                self.segment_cache.popitem(last=False)
+        else:
+            self.segment_cache.move_to_end(key)
+        return segment
+
+    def get_accum_viewport_segment(self, representation, index):
+        if self.allocation == "knapsack":
+            return self.cached_segment("knapsack", representation, index)
+        return self.cached_segment("accum_viewport", representation, index)
+
+    def get_even_segment(self, representation, index):
+        return self.cached_segment("even", representation, index)
+
+    def get_segment(self, representation, index) -> Segment:
+        return self.cached_segment("viewport", representation, index)
+
+    # quality per tile: the highest quality whose tile size is below the tile's share of the accumulated viewport
+    # times the byte budget of representation, 0 if there is none
+    # index None allocates all segments at once, shape (segments, tiles)
+    def allocate_accum_viewport(self, representation, index=None) -> numpy.ndarray:
+        max_bytes = self.byte_rates[representation] * self.segment_duration
+        if index is None:
+            segment_count = min(self.normalized_accum_viewport.shape[0], self.suffix_min_tile_sizes.shape[0])
+            budgets = self.normalized_accum_viewport[:segment_count] * max_bytes
+            # searchsorted of every row, qualities whose suffix minimum is below the budget
+            counts = (self.suffix_min_tile_sizes[:segment_count, None, :] < budgets[:, :, None]).sum(axis=2)
+        else:
+            budgets = self.normalized_accum_viewport[index] * max_bytes
+            counts = numpy.searchsorted(self.suffix_min_tile_sizes[index], budgets, side="left")
+            # a segment without accumulated viewport has no budget
+            counts[numpy.isnan(budgets)] = 0
+        return numpy.maximum(counts - 1, 0)
+
+    # allocation table of all representations and segments, get_accum_viewport_segment then only looks it up
+    def precompute_accum_viewport_allocation(self):
+        self.accum_viewport_allocation = numpy.stack(
+            [self.allocate_accum_viewport(representation) for representation in range(0, self.byte_rates.__len__())])
+
+    # every tile in the highest quality that fits its share of the accumulated viewport
+    def build_accum_viewport_segment(self, representation, index):
+        if self.accum_viewport_allocation is not None and index < self.accum_viewport_allocation.shape[1]:
+            tile_qualities = self.accum_viewport_allocation[representation, index]
+        else:
+            tile_qualities = self.allocate_accum_viewport(representation, index)
+        tiles = self.tile_sizes[index][tile_qualities]
+        return Segment(index, representation, self.get_segment_duration(index), tiles.tobytes(),
+                       tile_qualities.astype(numpy.int8).tobytes())
+
+    # tile qualities with the highest accumulated viewport weighted quality within the byte budget of representation
+    def build_knapsack_segment(self, representation, index):
+        max_bytes = self.byte_rates[representation] * self.segment_duration
+        weights = self.normalized_accum_viewport[index]
+        tile_qualities = knapsack_allocation(numpy.nan_to_num(weights), self.tile_sizes[index], max_bytes)
+        tiles = self.tile_sizes[index][tile_qualities]
+        return Segment(index, representation, self.get_segment_duration(index), tiles.tobytes(),
+                       tile_qualities.astype(numpy.int8).tobytes())
+
+    # every tile in representation
+    def build_even_segment(self, representation, index):
+        tiles = numpy.full(self.viewport_tiles.shape[1], self.tile_sizes[index, representation])
+        tile_qualities = numpy.full(self.viewport_tiles.shape[1], representation, dtype=numpy.int8)
+        return Segment(index, representation, self.get_segment_duration(index), tiles.tobytes(),
+                       tile_qualities.tobytes())
+
+    # viewport tiles in representation, all others in the lowest quality
+    def build_viewport_segment(self, representation, index):
+        in_viewport = self.viewport_tiles[index]
+        tiles = numpy.where(in_viewport, self.tile_sizes[index, representation], self.tile_sizes[index, 0])
+        tile_qualities = numpy.where(in_viewport, representation, 0).astype(numpy.int8)
+        return Segment(index, representation, self.get_segment_duration(index), tiles.tobytes(),
+                       tile_qualities.tobytes())
+
+
+class SimEnv(simpy.Environment, SegmentTables):
+    # download manager without a connection pool, subclasses swap it (seminar.link)
+    download_manager_class = DownloadManager
+
+    def __init__(self, short_factor, threshold, start_representation, foo,
+                 bandwidth_trace, segment_count, segment_sizes, deadlines, accum_viewport, viewport,
+                 tracer: Tracer = None, profiler: Profiler = None, allocation: str = "greedy",
+                 throughput: str = "oracle", connections: int = None,
+                 connection_overhead: float = 0, connection_rate: float = float("inf"), multiplex: bool = False,
+                 preemption: str = None, tile_requests: int = None, request_delay: float = 0, pipelining: int = 1):
+        super(SimEnv, self).__init__()
+
+        if tracer is None:
+            tracer = Tracer(TextSink()) if verbose else Tracer()
+        self.tracer = tracer
+
+        self.short_factor = short_factor
+        self.q_threshold = threshold
+        self.starting_representation = start_representation
+        # foo: long segments weighted by the accumulated viewport instead of even quality, allocation: see SegmentTables
+        self.foo = foo
+        # connections: None serves the short downloads, otherwise the long ones by the DownloadManager, a number
+        # transfers that many downloads at once over a connection pool, see seminar.pool
+        # preemption: policy of seminar.pool for short downloads that find every connection busy,
+        # tile_requests, request_delay, pipelining: segments are downloaded with requests for groups of tiles, the
+        # viewport tiles first (seminar.pool.TileDownload), each imply a pool of one connection if connections is None
+        if (preemption is not None or tile_requests is not None or request_delay > 0) and connections is None:
+            connections = 1
+        self.connections = connections
+
+        SegmentTables.__init__(self, segment_count, segment_sizes, deadlines, accum_viewport, viewport, allocation)
+
+        # bandwidth_trace: list of (time[s], bandwidth[B/s]) or a BandwidthManager, e.g. of a trace file read with
+        # StreamedBandwidthManager
+        if isinstance(bandwidth_trace, BandwidthManager):
+            # a profiler wraps the methods of a copy for this run, the manager may be shared with other runs
+            self.bandwidth_manager = bandwidth_trace if profiler is None else copy(bandwidth_trace)
+        else:
+            self.bandwidth_manager = BandwidthManager(bandwidth_trace)
         self.buffer = DualBuffer()
-        short_param = {"r": self.short_byte_rates,
-                       "r_max": self.short_byte_rates.__len__() - 1,
-                       "r_min": 0,
-                       "b_min": 2,
-                       "b_low": 3,
-                       "b_high": 5}
-        long_param = {"r": self.byte_rates,
-                      "r_max": self.byte_rates.__len__() - 1,
-                      "r_min": 0,
-                      "b_min": 5,
-                      "b_low": 20,
-                      "b_high": 50}
-        self.adaption = DualAdaption(self.bandwidth_manager, self.buffer, self.short_factor, short_param, long_param)
+        # throughput: "oracle" lets the adaption average the bandwidth trace, otherwise the kind of
+        # ThroughputEstimator that measures the completed downloads
+        self.throughput_estimator = None
+        if throughput != "oracle":
+            self.throughput_estimator = ThroughputEstimator(throughput)
+            self.buffer.history.listeners.append(self.throughput_estimator.add_download)
+        self.adaption = DualAdaption(self.bandwidth_manager, self.buffer, self.short_factor, self.short_param,
+                                     self.long_param, self.throughput_estimator)
 
         self.playback_position = 0
         self.playback_start_time = 0
         self.playback_finish_time = 0
         self.playback_stalled = False
         self.playback_sleep_event = self.event()
+        # list of (start, end) of every stall, the first one at playback position 0 is the startup delay
+        self.stalls = []
+        self.stall_start = None
 
         self.download_short_index = 0
         self.download_long_index = 0
 
-        self.download_manager = DownloadManager(self, self.bandwidth_manager, self.buffer)
+        if connections is not None:
+            from seminar.pool import PooledDownloadManager
+            self.download_manager = PooledDownloadManager(self, self.bandwidth_manager, self.buffer, self.tracer,
+                                                          profiler, connections, connection_overhead,
+                                                          connection_rate, multiplex, preemption or "never",
+                                                          tile_requests, request_delay, pipelining)
+        else:
+            self.download_manager = self.download_manager_class(self, self.bandwidth_manager, self.buffer, self.tracer,
+                                                                profiler)
+
+        # opt-in: wraps the hot paths of this run, only objects of this run, without a profiler nothing is wrapped
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.instrument(self.bandwidth_manager, "bandwidth", "get_download_time", "get_average_bandwidth")
+            profiler.instrument(self.buffer, "buffer_level", "buffer_level", "buffer_level_short",
+                                "buffer_level_many", "buffer_level_short_many")
+            profiler.instrument(self.adaption, "adaption", "get_short", "get_long")
+            profiler.instrument(self, "segment", "get_segment", "get_even_segment", "get_accum_viewport_segment")
+            profiler.instrument(self, "run", "run")
 
         self.init_process = self.process(self.init_simulation())
         self.download_short_process = self.timeout(0)
@@ -282,154 +540,124 @@ class SimEnv(simpy.Environment):
         yield self.download_short_process & self.download_long_process
         self.download_manager.terminate()
 
-    def get_segment_duration(self, index):
-        return self.deadlines[index + 1] - self.deadlines[index]
-
     def playback(self):
         while self.playback_position < self.segment_count:
-            if self.buffer.playback_available(self.playback_position):
-                segment, playback_duration = self.buffer.playback_start_next(self.now, self.playback_position)
-                self.playback_start_time = self.now
-                self.playback_finish_time = self.now + playback_duration
-                simprint(self, "watching: %d" % self.playback_position)
+            playback_duration = self.playback_next()
+            if playback_duration is not None:
                 yield self.timeout(playback_duration)
                 self.playback_position += 1
             else:
                 try:
-                    simprint(self, "%d: stalling -> no segment available" % self.playback_position)
-                    self.playback_stalled = True
                     yield self.playback_sleep_event
                 except simpy.Interrupt:
-                    simprint(self, "segment available")
-        simprint(self, "video completed")
+                    pass
+        if self.tracer.playback:
+            self.tracer.emit(PlaybackFinished(self.now))
+
+    # starts the playback of the segment at playback_position and returns its duration,
+    # None if it is not available yet, the playback is stalled until wake_playback
+    def playback_next(self):
+        if self.buffer.playback_available(self.playback_position):
+            if self.stall_start is not None:
+                if self.tracer.stall:
+                    self.tracer.emit(StallEnd(self.now, self.playback_position, self.now - self.stall_start))
+                self.stalls.append((self.stall_start, self.now))
+                self.stall_start = None
+            segment, playback_duration = self.buffer.playback_start_next(self.now, self.playback_position)
+            self.playback_start_time = self.now
+            self.playback_finish_time = self.now + playback_duration
+            if self.tracer.playback:
+                self.tracer.emit(PlaybackStarted(self.now, self.playback_position, self.buffer.watched[-1][2].short))
+            return playback_duration
+        self.playback_stalled = True
+        if self.stall_start is None:
+            if self.tracer.stall:
+                self.tracer.emit(StallBegin(self.now, self.playback_position))
+            self.stall_start = self.now
+        return None
 
     def download_short(self):
         last_download_index = 0
-        simprint(self, "(short) queued download segment: %d" % self.download_short_index)
         segment = self.get_segment(self.starting_representation, self.download_short_index)
         yield self.download_manager.queue_download(segment, True)
         self.wake_playback()
-        simprint(self, "(short) download finished: %d" % self.download_short_index)
 
         while self.download_short_index < self.segment_count - 1:
-            representation, delay = self.adaption.get_short(last_download_index, self.now)
-            if self.download_short_index <= self.playback_position:
-                self.download_short_index = self.playback_position + 1
-            else:
-                self.download_short_index += 1
-            segment = self.get_segment(representation, self.download_short_index)
-            if self.download_short_index in self.buffer.long_segments and (representation == 0 or self.segment_quality_dif(segment, self.buffer.long_segments[self.download_short_index][0]) < self.q_threshold):
-                yield self.timeout(delay)
-                self.buffer.short_segments[self.download_short_index] = self.buffer.long_segments[self.download_short_index]
-                simprint(self, "(short) moved segment: %d from long to short" % self.download_short_index)
+            planned = self.next_short(last_download_index)
+            if planned is None:
+                break
+            segment, delay, move = planned
+            yield self.timeout(delay)
+            if move:
+                self.move_long_to_short()
                 # yield self.timeout(self.segment_duration / 2)
             else:
-                yield self.timeout(delay)
-                simprint(self, "(short) queued download segment: %d; representation %d" % (
-                    self.download_short_index, representation))
                 yield self.download_manager.queue_download(segment, True)
                 last_download_index = self.download_short_index
-                simprint(self, "(short) download finished: %d" % self.download_short_index)
             self.wake_playback()
 
+    # adaption decision for the next short segment: (segment, delay before it, move), None if the playback passed
+    # the last segment
+    # move: the long segment is good enough and is moved to the short buffer instead of downloading segment
+    def next_short(self, last_download_index) -> (Segment, float, bool):
+        representation, delay = self.adaption.get_short(last_download_index, self.now)
+        # played segments are skipped, the one at playback_position only if it is downloaded or queued already: it
+        # can play before its short download finished (seminar.pool.TileDownload) and then stall on its successor
+        self.download_short_index = max(self.download_short_index + 1, self.playback_position)
+        if self.download_short_index == self.playback_position and self.buffer.queued(self.playback_position):
+            self.download_short_index += 1
+        if self.download_short_index == self.segment_count:
+            return None
+        if self.tracer.adaption:
+            self.tracer.emit(AdaptionDecision(self.now, True, self.download_short_index, representation, delay,
+                                              self.adaption.short[-1][1]))
+        segment = self.get_segment(representation, self.download_short_index)
+        move = self.download_short_index in self.buffer.long_segments and (representation == 0 or self.segment_quality_dif(segment, self.buffer.long_segments[self.download_short_index][0]) < self.q_threshold)
+        return segment, delay, move
+
+    def move_long_to_short(self):
+        self.buffer.short_segments[self.download_short_index] = self.buffer.long_segments[self.download_short_index]
+        if self.tracer.download:
+            self.tracer.emit(SegmentMoved(self.now, self.download_short_index))
+
     def download_long(self):
-        simprint(self, "(long) queued download segment: %d" % self.download_long_index)
         segment = self.get_segment(self.starting_representation, self.download_long_index)
         yield self.download_manager.queue_download(segment, False)
         self.wake_playback()
-        simprint(self, "(long) download finished: %d" % self.download_long_index)
 
         while self.download_long_index < self.segment_count - 1:
-            representation, delay = self.adaption.get_long(self.download_long_index, self.now)
-            if self.download_long_index <= self.download_short_index:
-                self.download_long_index = self.download_short_index + 1
-                if self.download_long_index == self.segment_count:
-                    break
-            else:
-                self.download_long_index += 1
-            if self.foo:
-                segment = self.get_accum_viewport_segment(representation, self.download_long_index)
-            else:
-                segment = self.get_even_segment(representation, self.download_long_index)
+            planned = self.next_long()
+            if planned is None:
+                break
+            segment, delay = planned
             yield self.timeout(delay)
-            simprint(self, "(long) queued download segment: %d; representation %d" % (
-                self.download_long_index, representation))
             yield self.download_manager.queue_download(segment, False)
-            simprint(self, "(long) download finished: %d" % self.download_long_index)
             self.wake_playback()
 
-    def download(self):
-        starting_representation = 3
-        # always download first segment in lowest quality:
-        simprint(self, "starting download segment: %d" % 0)
-        segment = self.get_segment(starting_representation, 0)
-        download_time = self.bandwidth_manager.get_download_time(self.now, segment.__len__())
-        self.buffer_short.download_started(self.now, self.now + download_time, segment)
-        self.buffer.download_started(self.now, self.now + download_time, segment)
-        last_segment_throughput = (self.now, self.now + download_time)
-        self.wake_playback()
-        yield self.timeout(download_time)
-        simprint(self, "finished download segment: %d, representation: %d" % (0, starting_representation))
-        download_index_short = 1
-        download_index_long = 1
-
-        while download_index_short < self.segment_count:
-            if download_index_short < self.playback_position:
-                download_index_short = self.playback_position
-                if download_index_long < download_index_short:
-                    download_index_long = download_index_short
-            if self.buffer.buffer_level(self.now) < self.threshold_short:
-                representation, delay = self.adaption_short.get()
-                segment = self.get_segment(representation, download_index_short)
-                download_time = self.bandwidth_manager.get_download_time(self.now, segment.__len__())
-                self.buffer_short.download_started(self.now, self.now + download_time, segment)
-                self.buffer.download_started(self.now, self.now + download_time, segment)
-                self.wake_playback()
-                yield self.timeout(download_time)
-                last_segment_throughput = download_time / segment.__len__()
-                download_index_short += 1
-                download_index_long = download_index_short
-                print("downloaded buffer < threshold %d" % (download_index_short - 1))
-            else:
-                if self.buffer_short.buffer_level(self.now) < self.threshold_short:
-                    simprint(self, "%f kkk" % self.buffer_short.buffer_level(self.now))
-                    if self.buffer_short.buffer_level(self.now) > self.adaption_short.b_min:
-                        representation, delay = self.adaption_short.get()
-                        segment = self.get_segment(representation, download_index_short)
-                        if self.segment_quality_dif(segment, self.buffer.get_segment(download_index_short)) > 1.5:
-                            download_time = self.bandwidth_manager.get_download_time(self.now, segment.__len__())
-                            self.buffer_short.download_started(self.now, self.now + download_time, segment)
-                            self.wake_playback()
-                            yield self.timeout(download_time)
-                            last_segment_throughput = download_time / segment.__len__()
-                            print("downloaded short %d" % (download_index_short))
-                        else:
-                            segment = self.buffer.get_segment(download_index_short)
-                            download_time = last_segment_throughput * segment.__len__()
-                            self.buffer_short.download_started(self.now - download_time, self.now, segment)
-                            print("put long into short %d" % (download_index_short))
-                            self.wake_playback()
-                    else:
-                        segment = self.buffer.get_segment(download_index_short)
-                        download_time = last_segment_throughput * segment.__len__()
-                        self.buffer_short.download_started(self.now - download_time, self.now, segment)
-                        print("put long into short %d" % (download_index_short))
-                        self.wake_playback()
-                    simprint(self, "%f xxx" % self.buffer_short.buffer_level(self.now))
-                    download_index_short += 1
-                else:
-                    if download_index_long < self.segment_count:
-                        representation, delay = self.adaption.get()
-                        yield self.timeout(delay)
-                        segment = self.get_accum_viewport_segment(representation, download_index_long)
-                        download_time = self.bandwidth_manager.get_download_time(self.now, segment.__len__())
-                        self.buffer.download_started(self.now, self.now + download_time, segment)
-                        yield self.timeout(download_time)
-                        last_segment_throughput = download_time / segment.__len__()
-                        download_index_long += 1
-                        print("downloaded long %d" % (download_index_long - 1))
-                    else:
-                        yield self.timeout((self.buffer_short.buffer_level(self.now) - self.threshold_short) * 1.1)
+    # adaption decision for the next long segment: (segment, delay before it), None if the short downloads
+    # already reached the last segment
+    def next_long(self) -> (Segment, float):
+        representation, delay = self.adaption.get_long(self.download_long_index, self.now)
+        if self.download_long_index <= self.download_short_index:
+            self.download_long_index = self.download_short_index + 1
+            if self.download_long_index == self.segment_count:
+                return None
+        else:
+            self.download_long_index += 1
+        if self.tracer.adaption:
+            self.tracer.emit(AdaptionDecision(self.now, False, self.download_long_index, representation, delay,
+                                              self.adaption.long[-1][1]))
+        if self.foo:
+            segment = self.get_accum_viewport_segment(representation, self.download_long_index)
+        else:
+            segment = self.get_even_segment(representation, self.download_long_index)
+        return segment, delay
+
+    # time when the playback reaches segment index if it does not stall, now if it is stalled or already there
+    def segment_deadline(self, index) -> float:
+        if self.playback_stalled or index <= self.playback_position:
+            return self.now
+        return self.playback_finish_time + self.deadlines[index] - self.deadlines[self.playback_position + 1]
 
     def wake_playback(self):
         if self.playback_stalled:
@@ -446,72 +674,35 @@ class SimEnv(simpy.Environment):
                 quality += tile_short - tile_long
         return quality / count
 
-    def get_accum_viewport_segment(self, representation, index):
-        max_bytes = self.byte_rates[representation] * self.segment_duration
-        segment_sizes = self.segment_sizes[index]
-        segment_viewport = self.accum_viewport[index]
-        accum_tile_sum = sum(segment_viewport)
-        normalized_segment_viewport = [tile / accum_tile_sum for tile in segment_viewport]
-        tile_qualities = []
-        tiles = []
-        for tile in normalized_segment_viewport:
-            max_tile_byte = tile * max_bytes
-            foo = tiles.__len__()
-            for i, quality in reversed(list(enumerate(segment_sizes))):
-                if max_tile_byte > quality / self.tile_count:
-                    tile_qualities.append(i)
-                    tiles.append(quality / self.tile_count)
-                    break
-            if foo == tiles.__len__():
-                tile_qualities.append(0)
-                tiles.append(segment_sizes[0] / self.tile_count)
-        return Segment(index, representation, self.get_segment_duration(index), tiles, tile_qualities)
-
-    def get_even_segment(self, representation, index):
-        segment_sizes = self.segment_sizes[index]
-        segment_viewport = self.viewport[index]
-        tile_qualities = []
-        tiles = []
-        for tile in segment_viewport:
-            tile_qualities.append(representation)
-            tiles.append(segment_sizes[representation] / self.tile_count)
-        return Segment(index, representation, self.get_segment_duration(index), tiles, tile_qualities)
-
-    def get_segment(self, representation, index) -> Segment:
-        segment_sizes = self.segment_sizes[index]
-        segment_viewport = self.viewport[index]
-        tile_qualities = []
-        tiles = []
-        for tile in segment_viewport:
-            if tile == 1:
-                tile_qualities.append(representation)
-                tiles.append(segment_sizes[representation] / self.tile_count)
-            else:
-                # tiles.append(segment_sizes[representation] / self.tile_count)
-                tile_qualities.append(0)
-                tiles.append(segment_sizes[0] / self.tile_count)
-        return Segment(index, representation, self.get_segment_duration(index), tiles, tile_qualities)
-
-
-# 781250 B/s , 6 MBit/s
-# 6250000 B/s, 50 MBit/s
-# 250000 B/s, 2 MBit/s
-bandwidth = 781250
-bandwidth_trace = [(i, bandwidth - ((781250 * 5 / 6) * (i / 200))) for i in range(0, 200)]
-bandwidth_trace = [(0, bandwidth), (70, 0), (85, bandwidth / 2)]
-print(bandwidth_trace)
-sim = SimEnv(0, 1.5, 0, False,
-             bandwidth_trace,
-             77,
-             seminar.values.segment_sizes2,
-             seminar.values.deadlines2,
-             seminar.values.accum_viewport,
-             seminar.values.example_viewport)
-sim.run()
-
-print(sim.adaption.short)
-print(sim.adaption.long)
-print(["short" if download.short else "long" for time, segment, download in sim.buffer.watched])
+    # summary of a finished session, a stall still open at its end counts until now
+    def metrics(self) -> dict:
+        stalls = self.stalls if self.stall_start is None else self.stalls + [(self.stall_start, self.now)]
+        stalls = [(start, end) for (start, end) in stalls if end > start]
+        startup_delay = 0
+        if stalls.__len__() > 0 and stalls[0][0] == 0:
+            startup_delay = stalls[0][1]
+            stalls = stalls[1:]
+        representations = [segment.representation for time, segment, download in self.buffer.watched]
+        switches = sum(1 for r_1, r_2 in zip(representations, representations[1:]) if r_1 != r_2)
+        tile_qualities = [quality for tiles in self.buffer.super_watched for quality in tiles]
+        metrics = {"duration": self.now,
+                   "startup_delay": startup_delay,
+                   "stall_count": stalls.__len__(),
+                   "stall_duration": sum(end - start for (start, end) in stalls),
+                   "average_tile_quality": sum(tile_qualities) / tile_qualities.__len__() if tile_qualities else -1,
+                   "viewport_quality": get_super(self.viewport, self.buffer.super_watched),
+                   "switches": switches,
+                   "short_segments": sum(1 for time, segment, download in self.buffer.watched if download.short)}
+        if self.connections is not None:
+            metrics.update(self.download_manager.delay_metrics())
+        return metrics
+
+
+def export_buffer_trace(sim: SimEnv, file, steps: int = 1000):
+    # csv of the buffer levels sampled at steps times over the whole session
+    times = numpy.linspace(0, sim.now, steps, endpoint=True)
+    numpy.savetxt(file, sim.buffer.buffer_trace(times), delimiter=",",
+                  header="time,buffer_level,buffer_level_short,playback_level", comments="")
 
 
 def get_segment_viewport_quality(viewport, buffer: dict):
@@ -539,7 +730,27 @@ def get_super(viewport, segments_tiles: list):
     return quality / count
 
 
-print(get_segment_viewport_quality(sim.viewport[4:], sim.buffer.long_segments))
-print(get_segment_viewport_quality(sim.viewport[1:], sim.buffer.short_segments))
-print(get_super(sim.viewport[1:], sim.buffer.super_watched))
-
+if __name__ == "__main__":
+    # 781250 B/s , 6 MBit/s
+    # 6250000 B/s, 50 MBit/s
+    # 250000 B/s, 2 MBit/s
+    bandwidth = 781250
+    bandwidth_trace = [(i, bandwidth - ((781250 * 5 / 6) * (i / 200))) for i in range(0, 200)]
+    bandwidth_trace = [(0, bandwidth), (70, 0), (85, bandwidth / 2)]
+    print(bandwidth_trace)
+    sim = SimEnv(0, 1.5, 0, False,
+                 bandwidth_trace,
+                 77,
+                 seminar.values.segment_sizes2,
+                 seminar.values.deadlines2,
+                 seminar.values.accum_viewport,
+                 seminar.values.example_viewport)
+    sim.run()
+
+    print(sim.adaption.short)
+    print(sim.adaption.long)
+    print(["short" if download.short else "long" for time, segment, download in sim.buffer.watched])
+
+    print(get_segment_viewport_quality(sim.viewport[4:], sim.buffer.long_segments))
+    print(get_segment_viewport_quality(sim.viewport[1:], sim.buffer.short_segments))
+    print(get_super(sim.viewport[1:], sim.buffer.super_watched))
@@ -0,0 +1,113 @@
+import csv
+import itertools
+from multiprocessing import Pool
+
+import seminar.simulation
+from seminar.cache import ResultCache
+from seminar.fluid import FluidSim
+from seminar.profiling import Profiler
+from seminar.shared import SharedTables, resolve_config
+from seminar.simulation import SimEnv
+
+# constructor arguments of SimEnv, in order
+sim_parameters = ["short_factor", "threshold", "start_representation", "foo", "bandwidth_trace", "segment_count",
+                  "segment_sizes", "deadlines", "accum_viewport", "viewport"]
+# keyword arguments of SimEnv that a grid may leave out, engine picks the simulator: "simpy" for SimEnv (default),
+# "fluid" for FluidSim
+optional_sim_parameters = ["allocation", "throughput", "engine", "connections", "connection_overhead",
+                           "connection_rate", "multiplex", "preemption", "tile_requests", "request_delay", "pipelining"]
+
+
+# grid: SimEnv argument -> list of values or dict of name -> value, every combination is one run
+# returns list of (labels, config), labels names the chosen value of every argument for the result table
+def expand_grid(grid: dict) -> list:
+    for parameter in grid:
+        if parameter not in sim_parameters and parameter not in optional_sim_parameters:
+            raise ValueError("unknown SimEnv argument: %s" % parameter)
+    parameters = sim_parameters + [parameter for parameter in optional_sim_parameters if parameter in grid]
+    options = []
+    for parameter in parameters:
+        values = grid[parameter]
+        if isinstance(values, dict):
+            options.append(list(values.items()))
+        else:
+            options.append([(value if isinstance(value, (bool, int, float, str)) else i, value)
+                            for i, value in enumerate(values)])
+    runs = []
+    for combination in itertools.product(*options):
+        labels = {parameter: label for parameter, (label, value) in zip(parameters, combination)}
+        config = {parameter: value for parameter, (label, value) in zip(parameters, combination)}
+        runs.append((labels, config))
+    return runs
+
+
+# metrics of one run, with profile=True also the report of a Profiler under "profile"
+# engine "fluid" runs the approximate FluidSim instead of SimEnv, it is not profiled
+def run_config(config: dict, profile: bool = False) -> dict:
+    config = resolve_config(config)
+    profiler = Profiler() if profile else None
+    engine = config.pop("engine", "simpy")
+    if engine == "fluid":
+        sim = FluidSim(**config)
+    elif engine == "simpy":
+        sim = SimEnv(profiler=profiler, **config)
+    else:
+        raise ValueError("unknown engine: %s" % engine)
+    sim.run()
+    metrics = sim.metrics()
+    if profile:
+        metrics["profile"] = profiler.report()
+    return metrics
+
+
+def run_task(task):
+    index, config, profile = task
+    return index, run_config(config, profile)
+
+
+def init_worker():
+    seminar.simulation.verbose = False
+
+
+# runs every combination of grid in processes worker processes (None = one per core)
+# returns one row per run: the labels of its arguments and the metrics of SimEnv.metrics,
+# with profile=True the profiling report of the run under "profile" (see profiling.merge_reports)
+# cache: runs whose metrics it holds are skipped, the others are stored in it, profiled runs are never cached
+# shared: the dataset tables and bandwidth traces are published once into shared memory instead of being pickled
+# with every task, see seminar.shared
+def sweep(grid: dict, processes: int = None, chunksize: int = 1, profile: bool = False,
+          cache: ResultCache = None, shared: bool = False) -> list:
+    runs = expand_grid(grid)
+    metrics = [None] * runs.__len__()
+    keys = [None] * runs.__len__()
+    if cache is not None and not profile:
+        for index, (labels, config) in enumerate(runs):
+            keys[index] = cache.key(config)
+            metrics[index] = cache.get(keys[index])
+    tasks = [(index, config, profile) for index, (labels, config) in enumerate(runs) if metrics[index] is None]
+    if tasks.__len__() > 0:
+        with SharedTables() as tables:
+            if shared:
+                tasks = [(index, tables.share_config(config), profile) for index, config, profile in tasks]
+            # the workers are started after publishing, so they inherit the resource tracker that owns the blocks
+            with Pool(processes, initializer=init_worker) as pool:
+                for index, run_metrics in pool.imap_unordered(run_task, tasks, chunksize):
+                    metrics[index] = run_metrics
+                    if keys[index] is not None:
+                        cache.put(keys[index], run_metrics)
+    if cache is not None:
+        cache.evict()
+    rows = []
+    for (labels, config), run_metrics in zip(runs, metrics):
+        row = dict(labels)
+        row.update(run_metrics)
+        rows.append(row)
+    return rows
+
+
+def write_results(rows: list, file):
+    with open(file, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=[key for key in rows[0].keys() if key != "profile"],
+                                extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
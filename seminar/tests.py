@@ -9,9 +9,211 @@ print(bandwidth_manager.get_average_bandwidth(0, 70) == bandwidth)
 print(bandwidth_manager.get_average_bandwidth(65, 75) == bandwidth / 2)
 print(bandwidth_manager.get_average_bandwidth(70, 85) == 0)
 print(bandwidth_manager.get_average_bandwidth(80, 90) == bandwidth / 4)
+# an empty interval has the bandwidth at its time
+print(bandwidth_manager.get_average_bandwidth(0, 0) == bandwidth)
+print(bandwidth_manager.get_average_bandwidth(75, 75) == 0)
 
 print(bandwidth_manager.get_download_time(0, bandwidth * 5) == 5)
 print(bandwidth_manager.get_download_time(65, bandwidth * 5) == 5)
 print(bandwidth_manager.get_download_time(66, bandwidth * 5) == 21)
 print(bandwidth_manager.get_download_time(80, bandwidth * 5) == 15)
 print(bandwidth_manager.get_download_time(500, bandwidth * 5) == 10)
+
+import seminar.simulation
+import seminar.values
+from seminar.simulation import SimEnv
+
+seminar.simulation.verbose = False
+
+# every session plays all segments, also if a segment plays before its short download finished
+for options in ({}, {"connections": 2}, {"preemption": "always"}, {"tile_requests": 1, "request_delay": 0.05},
+                {"tile_requests": 4, "request_delay": 0.05, "pipelining": 4}):
+    for trace in (bandwidth_trace, [(0, bandwidth / 3)]):
+        for short_factor in (0, 0.5, 1):
+            sim = SimEnv(short_factor, 1.5, 0, True, trace, 77, seminar.values.segment_sizes2,
+                         seminar.values.deadlines2, seminar.values.accum_viewport, seminar.values.example_viewport,
+                         **options)
+            sim.run()
+            print(sim.buffer.watched.__len__() == 77 and sim.stall_start is None)
+
+from seminar.sweep import sweep
+
+# tables in shared memory give the results of pickled tables, also with several workers
+grid = {"short_factor": [0, 0.5], "threshold": [1.5], "start_representation": [0], "foo": [True],
+        "bandwidth_trace": {"outage": bandwidth_trace, "low": [(0, bandwidth / 3)]}, "segment_count": [77],
+        "segment_sizes": [seminar.values.segment_sizes2], "deadlines": [seminar.values.deadlines2],
+        "accum_viewport": [seminar.values.accum_viewport], "viewport": [seminar.values.example_viewport]}
+print(sweep(grid, processes=2, shared=True) == sweep(grid, processes=1))
+
+
+import random
+
+from seminar.batch import BatchSim
+from seminar.fluid import FluidSim
+
+# every session of a batch has the results of FluidSim with its trace
+generator = random.Random(5)
+traces = [[(i, 0 if generator.random() < 0.2 else generator.uniform(0.2, 2) * bandwidth) for i in range(0, 300)]
+          for session in range(0, 20)]
+for short_factor in (0, 0.5, 1):
+    batch = BatchSim(short_factor, 1.5, 0, True, traces, 77, seminar.values.segment_sizes2, seminar.values.deadlines2,
+                     seminar.values.accum_viewport, seminar.values.example_viewport)
+    batch.run()
+    batch_metrics = batch.metrics()
+    same = True
+    for session, trace in enumerate(traces):
+        fluid = FluidSim(short_factor, 1.5, 0, True, trace, 77, seminar.values.segment_sizes2,
+                         seminar.values.deadlines2, seminar.values.accum_viewport, seminar.values.example_viewport)
+        fluid.run()
+        for metric, value in fluid.metrics().items():
+            same = same and batch_metrics[metric][session] == value
+    print(same)
+
+from seminar.link import SharedLink
+
+
+# max-min fair rates of flows with max_rates on capacity, filled from the slowest flow up
+def water_filling(capacity: float, max_rates: list) -> list:
+    rates = [0] * max_rates.__len__()
+    left = capacity
+    order = sorted(range(0, max_rates.__len__()), key=lambda i: max_rates[i])
+    for k, i in enumerate(order):
+        rates[i] = min(max_rates[i], left / (order.__len__() - k))
+        left -= rates[i]
+    return rates
+
+
+# finish time of every flow (start, byte_size, max_rate), all rates recomputed at every start, finish and change of
+# the capacity
+def reference_finish_times(capacity: list, flows: list) -> list:
+    finish_times = [None] * flows.__len__()
+    remaining = {}
+    starts = sorted(range(0, flows.__len__()), key=lambda i: flows[i][0])
+    time = 0
+    while starts.__len__() > 0 or remaining.__len__() > 0:
+        rate = [r for t, r in capacity if t <= time][-1]
+        active = list(remaining)
+        rates = water_filling(rate, [flows[i][2] for i in active])
+        events = [flows[starts[0]][0]] if starts.__len__() > 0 else []
+        events += [t for t, r in capacity if t > time][:1]
+        events += [time + remaining[i] / r for i, r in zip(active, rates) if r > 0]
+        now = min(events)
+        for i, r in zip(active, rates):
+            if r > 0 and time + remaining[i] / r == now:
+                finish_times[i] = now
+                del remaining[i]
+            else:
+                remaining[i] -= r * (now - time)
+        time = now
+        while starts.__len__() > 0 and flows[starts[0]][0] == time:
+            remaining[starts[0]] = flows[starts[0]][1]
+            starts.pop(0)
+    return finish_times
+
+
+def start_flow(link: SharedLink, start: float, byte_size: float, max_rate: float, finish_times: list, i: int):
+    yield link.env.timeout(start)
+    flow = link.start(byte_size, max_rate)
+    yield flow.event
+    finish_times[i] = link.env.now
+
+
+# SharedLink gives the finish times of recomputing the max-min fair rates of all flows at every event
+generator = random.Random(11)
+for scenario in range(0, 10):
+    capacity = [(t, generator.choice((0, generator.uniform(1e5, 1e6)))) for t in range(0, 40, 5)] + [(40, 5e5)]
+    flows = [(generator.uniform(0, 30), generator.uniform(1e4, 1e6),
+              generator.choice((float("inf"), generator.uniform(2e4, 3e5)))) for i in range(0, 12)]
+    link = SharedLink(capacity)
+    finish_times = [None] * flows.__len__()
+    for i, (start, byte_size, max_rate) in enumerate(flows):
+        link.env.process(start_flow(link, start, byte_size, max_rate, finish_times, i))
+    link.run()
+    print(all(abs(finish_time - expected) < 1e-9 for finish_time, expected in
+              zip(finish_times, reference_finish_times(capacity, flows))))
+
+import os
+import tempfile
+
+from seminar.trace_files import read_csv, read_delivery_log
+
+with tempfile.TemporaryDirectory() as directory:
+    # delivery log with several packets per millisecond and seconds without deliveries
+    generator = random.Random(13)
+    times = sorted(generator.choice((generator.randrange(0, 4000), generator.randrange(7000, 9000)))
+                   for i in range(0, 500))
+    path = os.path.join(directory, "delivery.log")
+    with open(path, "w") as f:
+        f.write("".join("%d\n" % time for time in times))
+    counts = [0] * (times[-1] // 1000 + 1)
+    for time in times:
+        counts[time // 1000] += 1
+    expected = [(i, count * 1500) for i, count in enumerate(counts)]
+    # blocks that end within a line and blocks of several seconds give the samples of the whole file
+    for block_size in (1, 2, 3, 7, 64, 1000, 1 << 20):
+        print(list(read_delivery_log(path, block_size=block_size)) == expected)
+
+    # the header, comments and empty rows are skipped
+    path = os.path.join(directory, "trace.csv")
+    with open(path, "w") as f:
+        f.write("time,bandwidth\n# Mbit/s\n0,1\n\n1.5,2.5\n# end\n")
+    print(list(read_csv(path, bandwidth_scale=125000)) == [(0, 125000), (1.5, 312500)])
+
+from seminar.cache import ResultCache
+from seminar.dataset import Dataset, save_dataset, load_dataset
+
+with tempfile.TemporaryDirectory() as directory:
+    cache = ResultCache(os.path.join(directory, "cache"), max_bytes=2000)
+    dataset = Dataset(seminar.values.segment_sizes2, seminar.values.deadlines2, seminar.values.accum_viewport,
+                      seminar.values.example_viewport)
+    save_dataset(os.path.join(directory, "sizes2"), dataset)
+    parameters = ["segment_count", "segment_sizes", "deadlines", "accum_viewport", "viewport"]
+    config = {"short_factor": 0.5, "threshold": 1.5, "start_representation": 0, "foo": True,
+              "bandwidth_trace": bandwidth_trace}
+    config.update(zip(parameters, dataset.arguments()))
+    mapped_config = dict(config)
+    mapped_config.update(zip(parameters, load_dataset(os.path.join(directory, "sizes2")).arguments()))
+    # a memory mapped dataset is the same run as the lists of seminar.values, other arguments are another run
+    print(cache.key(mapped_config) == cache.key(config))
+    print(cache.key(dict(config, short_factor=0.25)) != cache.key(config) and
+          cache.key(dict(config, bandwidth_trace=[(0, bandwidth)])) != cache.key(config))
+    cache.put(cache.key(config), {"duration": 154.0})
+    print(cache.get(cache.key(config)) == {"duration": 154.0} and
+          cache.get(cache.key(dict(config, short_factor=0.25))) is None)
+
+    # evict keeps the entries within max_bytes and removes the temporary files of unfinished writes
+    for i in range(0, 100):
+        cache.put(cache.key(dict(config, threshold=i)), {"duration": i})
+    path = cache.path(cache.key(dict(config, threshold=1000)))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path + ".1.tmp", "w").close()
+    cache.evict()
+    files = [os.path.join(root, name) for root, directories, names in os.walk(cache.directory) for name in names]
+    print(0 < sum(os.path.getsize(path) for path in files) <= cache.max_bytes and
+          not any(path.endswith(".tmp") for path in files))
+
+import numpy
+
+from seminar.allocation import knapsack_allocation
+from seminar.simulation import SegmentTables
+
+# the knapsack allocation keeps the byte budget of a segment, unless not even every tile in the lowest quality fits,
+# and has at least the accumulated viewport weighted quality of the greedy allocation wherever that fits the budget
+# (it can exceed it, the tiles without a quality below their share still take the lowest quality)
+for segment_sizes, deadlines in ((seminar.values.segment_sizes, seminar.values.deadlines),
+                                 (seminar.values.segment_sizes2, seminar.values.deadlines2)):
+    tables = SegmentTables(77, segment_sizes, deadlines, seminar.values.accum_viewport,
+                           seminar.values.example_viewport)
+    valid = True
+    for index in range(0, 77):
+        weights = numpy.nan_to_num(tables.normalized_accum_viewport[index])
+        tile_sizes = tables.tile_sizes[index]
+        for representation in range(0, tables.byte_rates.__len__()):
+            budget = tables.byte_rates[representation] * tables.segment_duration
+            qualities = knapsack_allocation(weights, tile_sizes, budget)
+            greedy = tables.allocate_accum_viewport(representation, index)
+            fits = tile_sizes[qualities].sum() <= budget or not qualities.any()
+            better = tile_sizes[greedy].sum() > budget or \
+                (weights * qualities).sum() >= (weights * greedy).sum() - 1e-12
+            valid = valid and fits and better
+    print(valid)
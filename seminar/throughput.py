@@ -0,0 +1,64 @@
+from collections import deque
+
+
+class ThroughputEstimator:
+    # online throughput estimate [B/s] from completed downloads, O(1) per add and query
+    # kind: "mean" = bytes / seconds of the last window downloads,
+    #       "harmonic" = harmonic mean of the throughput of the last window downloads,
+    #       "ewma" = exponentially weighted moving average of the download throughput with weight alpha
+    kinds = ("mean", "harmonic", "ewma")
+
+    def __init__(self, kind: str = "mean", window: int = 5, alpha: float = 0.3):
+        if kind not in self.kinds:
+            raise ValueError("unknown throughput estimator: %s" % kind)
+        self.kind = kind
+        self.window = window
+        self.alpha = alpha
+
+        # (bytes, seconds) of the last window downloads
+        self.samples = deque()
+        self.window_bytes = 0
+        self.window_seconds = 0
+        # sum of seconds / bytes, the inverse throughputs
+        self.window_inverse = 0
+        self.ewma = 0
+        # throughput of the last download
+        self.last = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, byte_size: float, seconds: float):
+        if seconds <= 0 or byte_size <= 0:
+            return
+        throughput = byte_size / seconds
+        self.samples.append((byte_size, seconds))
+        self.window_bytes += byte_size
+        self.window_seconds += seconds
+        self.window_inverse += seconds / byte_size
+        if self.samples.__len__() > self.window:
+            old_bytes, old_seconds = self.samples.popleft()
+            self.window_bytes -= old_bytes
+            self.window_seconds -= old_seconds
+            self.window_inverse -= old_seconds / old_bytes
+        self.ewma = throughput if self.count == 0 else self.alpha * throughput + (1 - self.alpha) * self.ewma
+        self.last = throughput
+        self.count += 1
+
+    # listener of DownloadHistory, called when a download is finished
+    def add_download(self, download):
+        self.add(download.segment.__len__(), download.running_time)
+
+    def mean(self) -> float:
+        return self.window_bytes / self.window_seconds
+
+    def harmonic_mean(self) -> float:
+        return self.samples.__len__() / self.window_inverse
+
+    def estimate(self) -> float:
+        if self.kind == "mean":
+            return self.mean()
+        elif self.kind == "harmonic":
+            return self.harmonic_mean()
+        return self.ewma
@@ -0,0 +1,136 @@
+import json
+from collections import deque, namedtuple
+
+
+# trace records, every record type belongs to one category that can be enabled on its own
+
+class DownloadQueued(namedtuple("DownloadQueued", "time segment_index representation short")):
+    __slots__ = ()
+    category = "download"
+
+
+class DownloadStarted(namedtuple("DownloadStarted", "time segment_index short byte_size expected_end")):
+    __slots__ = ()
+    category = "download"
+
+
+class DownloadPaused(namedtuple("DownloadPaused", "time segment_index short remaining_bytes")):
+    __slots__ = ()
+    category = "download"
+
+
+class DownloadFinished(namedtuple("DownloadFinished", "time segment_index short")):
+    __slots__ = ()
+    category = "download"
+
+
+class SegmentMoved(namedtuple("SegmentMoved", "time segment_index")):
+    __slots__ = ()
+    category = "download"
+
+
+class PlaybackStarted(namedtuple("PlaybackStarted", "time segment_index short")):
+    __slots__ = ()
+    category = "playback"
+
+
+class PlaybackFinished(namedtuple("PlaybackFinished", "time")):
+    __slots__ = ()
+    category = "playback"
+
+
+class StallBegin(namedtuple("StallBegin", "time playback_position")):
+    __slots__ = ()
+    category = "stall"
+
+
+class StallEnd(namedtuple("StallEnd", "time playback_position duration")):
+    __slots__ = ()
+    category = "stall"
+
+
+class AdaptionDecision(namedtuple("AdaptionDecision", "time short segment_index representation delay buffer_level")):
+    __slots__ = ()
+    category = "adaption"
+
+
+class ManagerStarted(namedtuple("ManagerStarted", "time")):
+    __slots__ = ()
+    category = "manager"
+
+
+class ManagerTerminated(namedtuple("ManagerTerminated", "time")):
+    __slots__ = ()
+    category = "manager"
+
+
+categories = ("download", "playback", "stall", "adaption", "manager")
+
+
+class Tracer:
+    # call sites check the category flag before building a record:
+    #     if tracer.download:
+    #         tracer.emit(DownloadQueued(...))
+    # so a disabled category costs one attribute lookup
+    def __init__(self, sink=None, enabled=categories):
+        self.sink = sink
+        for category in categories:
+            setattr(self, category, sink is not None and category in enabled)
+
+    def emit(self, record):
+        self.sink.write(record)
+
+
+class RingBufferSink:
+    # keeps the last capacity records in memory, all of them if capacity is None
+    def __init__(self, capacity: int = None):
+        self.records = deque(maxlen=capacity)
+
+    def write(self, record):
+        self.records.append(record)
+
+    def close(self):
+        pass
+
+
+class JsonlSink:
+    # one json object per record, the record type is stored as "type"
+    def __init__(self, file):
+        self.file = open(file, "w")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, record):
+        line = record._asdict()
+        line["type"] = type(record).__name__
+        self.file.write(json.dumps(line))
+        self.file.write("\n")
+
+    def close(self):
+        self.file.close()
+
+
+class TextSink:
+    # human readable lines on stdout
+    def write(self, record):
+        print("%f: %s %s" % (record.time, type(record).__name__,
+                             " ".join("%s=%s" % item for item in record._asdict().items() if item[0] != "time")))
+
+    def close(self):
+        pass
+
+
+def read_jsonl(file) -> list:
+    records = {record_type.__name__: record_type for record_type in
+               (DownloadQueued, DownloadStarted, DownloadPaused, DownloadFinished, SegmentMoved, PlaybackStarted,
+                PlaybackFinished, StallBegin, StallEnd, AdaptionDecision, ManagerStarted, ManagerTerminated)}
+    trace = []
+    with open(file) as f:
+        for line in f:
+            fields = json.loads(line)
+            trace.append(records[fields.pop("type")](**fields))
+    return trace
@@ -0,0 +1,73 @@
+import csv
+import gzip
+
+import numpy
+
+from seminar.bandwidth import StreamedBandwidthManager
+
+# readers of bandwidth trace files, every reader yields the samples (time[s], bandwidth[B/s]) one at a time,
+# so StreamedBandwidthManager builds the index of traces of any size with memory for the index only
+# files ending in .gz are read compressed
+
+
+def open_text(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="")
+    return open(path, newline="")
+
+
+# csv with one sample per row, rows that are not numbers (a header) and rows starting with # are skipped
+# time_scale, bandwidth_scale: factors to seconds and bytes per second, e.g. 0.001 for milliseconds, 125000 for MBit/s
+def read_csv(path: str, time_column: int = 0, bandwidth_column: int = 1, time_scale: float = 1,
+             bandwidth_scale: float = 1, delimiter: str = ","):
+    with open_text(path) as f:
+        for row in csv.reader(f, delimiter=delimiter):
+            if row.__len__() == 0 or row[0].startswith("#"):
+                continue
+            try:
+                time = float(row[time_column])
+                bandwidth = float(row[bandwidth_column])
+            except (ValueError, IndexError):
+                continue
+            yield time * time_scale, bandwidth * bandwidth_scale
+
+
+# delivery log like the traces of Mahimahi: one line per delivery opportunity of packet_size bytes with its time in
+# milliseconds, several lines of the same millisecond are several packets
+# yields the average bandwidth of every interval seconds from time 0 on, also of intervals without deliveries,
+# the file is parsed in blocks of block_size characters with numpy, the last interval lasts until the log ends
+def read_delivery_log(path: str, interval: float = 1, packet_size: int = 1500, block_size: int = 1 << 20):
+    # first interval not yielded yet and its packets of the blocks before
+    interval_index = 0
+    packets = 0
+    with open_text(path) as f:
+        rest = ""
+        while True:
+            block = f.read(block_size)
+            text = rest + block
+            if block.__len__() > 0:
+                # the last line may continue in the next block
+                cut = text.rfind("\n") + 1
+                text, rest = text[:cut], text[cut:]
+            indices = (numpy.array(text.split(), dtype=float) / 1000 / interval).astype(numpy.int64)
+            if indices.__len__() > 0:
+                if indices[0] < interval_index or numpy.any(indices[1:] < indices[:-1]):
+                    raise ValueError("delivery log not sorted by time: %s" % path)
+                counts = numpy.bincount(indices - interval_index).tolist()
+                counts[0] += packets
+                for count in counts[:-1]:
+                    yield interval_index * interval, count * packet_size / interval
+                    interval_index += 1
+                packets = counts[-1]
+            if block.__len__() == 0:
+                break
+    yield interval_index * interval, packets * packet_size / interval
+
+
+def load_csv(path: str, merge: bool = True, **kwargs) -> StreamedBandwidthManager:
+    return StreamedBandwidthManager(read_csv(path, **kwargs), merge)
+
+
+def load_delivery_log(path: str, interval: float = 1, packet_size: int = 1500,
+                      merge: bool = True) -> StreamedBandwidthManager:
+    return StreamedBandwidthManager(read_delivery_log(path, interval, packet_size), merge)
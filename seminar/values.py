@@ -1,478 +1,62 @@
-deadlines = [0,
-             5.33866700000000,
-             10.6773330000000,
-             16.0160000000000,
-             21.3546670000000,
-             26.6933330000000,
-             32.0320000000000,
-             37.3373000000000,
-             42.6759670000000,
-             48.0146330000000,
-             53.3533000000000,
-             58.6919670000000,
-             64.0306330000000,
-             69.3359330000000,
-             74.6746000000000,
-             80.0132670000000,
-             85.3519330000000,
-             90.6906000000000,
-             96.0292670000000,
-             101.334567000000,
-             106.673233000000,
-             112.011900000000,
-             117.350567000000,
-             122.689233000000,
-             128.027900000000,
-             133.333200000000,
-             138.671867000000,
-             144.010533000000,
-             149.349200000000,
-             154.687867000000,
-             160.026533000000,
-             165.365200000000,
-             170.670500000000,
-             176.009167000000,
-             181.347833000000,
-             186.686500000000,
-             192.025167000000,
-             197.363833000000,
-             202.669133000000,
-             208.007800000000,
-             213.346467000000,
-             218.685133000000,
-             224.023800000000,
-             229.362467000000,
-             234.667767000000,
-             240.006433000000,
-             245.345100000000,
-             250.683767000000,
-             256.022433000000,
-             261.361100000000,
-             266.666400000000,
-             272.005067000000,
-             277.343733000000,
-             282.682400000000,
-             288.021067000000,
-             293.359733000000,
-             298.665033000000,
-             304.003700000000,
-             309.342367000000,
-             314.681033000000,
-             320.019700000000,
-             325.358367000000,
-             330.697033000000,
-             336.002333000000,
-             341.341000000000,
-             346.679667000000,
-             352.018333000000,
-             357.357000000000,
-             362.695667000000,
-             368.000967000000,
-             373.339633000000,
-             378.678300000000,
-             384.016967000000,
-             389.355633000000,
-             394.694300000000,
-             399.999600000000,
-             405.338267000000,
-             410.66]
+import marshal
+import os
+import sys
 
-deadlines2 = [2 * i for i in range(0, deadlines.__len__())]
+# the bundled datasets of seminar.values_data, loaded on the first access of one of them, so importing seminar.values
+# (and with it seminar.simulation) does not build them
+# the loaded lists are cached with marshal in __pycache__ next to values_data.py, keyed by its modification time and
+# size: loading the cache is faster than running the module, and every later process (e.g. sweep workers) reuses it
 
-# segment_sizes[i] = list of byte size of segment i for all qualities, sorted by quality
-# size of one tile: segment_sizes[i][j] / tile_count
-segment_sizes = [[95259, 97947, 105036, 105254, 115267, 135335, 179695, 211355],
-                 [87427, 88630, 89251, 91098, 95886, 104870, 117069, 144971],
-                 [156330, 247989, 505567, 859283, 1636852, 2957676, 6990889, 9341448],
-                 [155328, 244459, 501146, 850129, 1613205, 2953401, 6977658, 14704927],
-                 [156811, 245750, 501294, 848176, 1612678, 2952203, 6973910, 14721263],
-                 [155947, 242193, 501282, 848870, 1614133, 2955951, 6985070, 14716489],
-                 [154471, 242116, 499892, 843229, 1603853, 2944915, 6933773, 14654326],
-                 [154706, 245486, 502247, 851939, 1621363, 2963519, 7001274, 14722659],
-                 [157221, 245448, 498702, 853097, 1622101, 2961825, 7017664, 14705420],
-                 [155326, 244410, 507146, 851625, 1616621, 2957596, 6990427, 14702406],
-                 [155819, 244149, 313087, 692292, 1229685, 2089728, 4806255, 7117984],
-                 [156216, 246530, 346146, 758374, 1337078, 2390793, 5329180, 7792703],
-                 [155203, 241034, 355892, 728837, 1339973, 2409352, 5164361, 6870128],
-                 [155709, 245668, 497917, 851131, 1601126, 2972820, 7026743, 12153797],
-                 [155171, 244324, 509099, 853630, 1644075, 2981842, 6941977, 12192864],
-                 [154966, 246873, 480029, 854776, 1631587, 2971170, 7042620, 11910825],
-                 [153993, 241066, 503379, 853453, 1602783, 2971114, 7021208, 11361211],
-                 [157380, 246402, 502929, 852256, 1640410, 2971145, 7020532, 12003224],
-                 [151927, 242425, 502259, 850878, 1619309, 2967455, 7079085, 10388398],
-                 [158041, 243512, 502797, 852377, 1623703, 2973897, 7033967, 11521862],
-                 [155911, 242127, 502994, 853291, 1625206, 2979730, 6925812, 10345016],
-                 [154950, 241019, 496187, 851584, 1622307, 2914708, 7023001, 12888600],
-                 [156424, 247515, 508325, 850955, 1620062, 3013953, 7093935, 12198879],
-                 [155684, 245426, 501269, 847944, 1612931, 2936646, 7007486, 12749550],
-                 [154918, 242464, 498891, 852820, 1596808, 2937139, 6983934, 10873779],
-                 [155637, 244852, 498608, 849895, 1613885, 3023156, 6886228, 14328177],
-                 [155547, 243162, 511424, 836580, 1630522, 2904025, 7044929, 14483688],
-                 [154944, 242440, 493346, 851958, 1624660, 3035195, 7013058, 14765691],
-                 [156527, 245139, 501105, 850491, 1647679, 2947376, 6884479, 14288679],
-                 [154505, 244894, 504820, 858226, 1629901, 2996977, 7173876, 14936743],
-                 [155392, 246414, 507546, 859177, 1619767, 2912876, 7032192, 14992466],
-                 [156385, 245564, 507430, 862204, 1607711, 3005996, 6950346, 14624514],
-                 [156475, 246083, 503861, 837233, 1623764, 2983729, 6978193, 14700274],
-                 [154421, 242525, 497041, 867645, 1630568, 2921978, 6905494, 14847222],
-                 [156558, 247232, 510217, 853323, 1623540, 3008203, 7133363, 14154060],
-                 [152306, 245103, 502234, 851090, 1620962, 2970957, 6991183, 11473259],
-                 [158972, 242863, 492540, 833293, 1619106, 2964207, 6896877, 14694951],
-                 [153771, 248419, 510752, 865633, 1614887, 2976078, 6983828, 14658743],
-                 [155973, 241024, 501704, 851315, 1613170, 2964860, 7060330, 14915823],
-                 [154558, 242692, 503220, 850729, 1619102, 2975340, 6876023, 14460664],
-                 [156141, 242059, 502526, 856555, 1628678, 2929861, 7098757, 14998429],
-                 [155336, 244764, 503121, 852775, 1621289, 3011006, 6906603, 12395931],
-                 [155750, 244607, 495553, 840465, 1597636, 2978064, 7096219, 12658973],
-                 [153710, 240294, 502061, 843081, 1607396, 2901624, 6855355, 9647445],
-                 [157426, 247276, 505390, 851446, 1619136, 3017869, 7118034, 12343488],
-                 [151521, 247565, 487352, 828669, 1569038, 2794723, 6607945, 10661771],
-                 [158669, 240240, 522587, 894752, 1653851, 3057121, 7379461, 14982641],
-                 [153065, 251536, 501640, 851164, 1665721, 3072490, 7077603, 14892197],
-                 [158175, 240827, 504403, 852025, 1622197, 2964917, 6890640, 10396875],
-                 [154085, 241069, 501982, 838780, 1621371, 2922524, 7110561, 11874770],
-                 [154429, 246806, 506085, 856717, 1604231, 2977379, 6969371, 9196050],
-                 [156767, 246401, 494626, 858891, 1603196, 2985273, 6973372, 12227176],
-                 [154094, 245701, 509439, 850909, 1642398, 2951676, 7001611, 11347551],
-                 [157378, 244825, 504564, 854365, 1627053, 2975943, 7040998, 12126306],
-                 [154575, 240965, 499611, 847354, 1614676, 2963098, 7018405, 10672546],
-                 [151993, 243728, 503974, 852264, 1584734, 2971778, 6985225, 12303912],
-                 [157839, 247229, 503122, 853041, 1655736, 2969605, 6859584, 11350891],
-                 [156552, 244776, 494135, 837419, 1619811, 2970165, 7044983, 12513810],
-                 [154935, 241933, 512428, 867984, 1623765, 2976576, 7119618, 11354296],
-                 [156041, 241909, 501033, 846118, 1606892, 2946812, 6937483, 14385444],
-                 [153148, 240755, 484520, 821425, 1556970, 2849516, 6829030, 14182439],
-                 [157725, 249365, 517705, 878678, 1679032, 3079626, 7248985, 15377717],
-                 [154978, 237881, 483890, 818785, 1557551, 2838939, 6791613, 14393750],
-                 [156861, 245177, 509385, 878835, 1637807, 3017597, 7010342, 14842544],
-                 [154491, 249808, 511235, 848356, 1617975, 3011343, 6977615, 14690571],
-                 [155772, 240696, 492860, 830943, 1649700, 2944890, 6968067, 14684634],
-                 [153183, 240935, 509171, 872883, 1590999, 2960542, 6983719, 14708410],
-                 [158295, 249090, 504777, 855645, 1660222, 3003267, 7037797, 14824267],
-                 [152958, 240925, 502685, 849476, 1617228, 2973193, 7108033, 12105462],
-                 [154066, 242814, 487849, 851627, 1616536, 2968111, 6454515, 9139919],
-                 [159344, 243934, 498390, 844946, 1610291, 2937031, 6587223, 9145710],
-                 [153037, 241010, 504558, 853442, 1621165, 2981327, 6857603, 11790045],
-                 [157367, 248337, 501053, 853755, 1626230, 2969766, 7039836, 12676317],
-                 [153441, 236852, 483356, 815024, 1541843, 2886782, 6960865, 14359845],
-                 [152816, 245593, 524660, 891291, 1675519, 3034892, 7003348, 15018596],
-                 [157498, 245628, 508846, 865825, 1668603, 2985826, 7169299, 15173273],
-                 [159957, 228922, 257823, 411333, 773683, 1559328, 3226277, 4801061]]
+names = ["deadlines", "deadlines2", "segment_sizes", "factor", "segment_sizes2", "accum_viewport", "example_viewport"]
 
-factor = 2 / deadlines[1]
-segment_sizes2 = [[int(quality * factor) for quality in segment] for segment in segment_sizes]
-print(segment_sizes2)
+source = os.path.join(os.path.dirname(os.path.abspath(__file__)), "values_data.py")
+cache = os.path.join(os.path.dirname(source), "__pycache__", "values_data.%s.marshal" % sys.implementation.cache_tag)
 
-accum_viewport = [
-    [0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 2, 1, 0, 2, 2, 3, 12, 14, 18, 25, 28, 24, 11, 11, 14, 18, 25, 34, 34, 31, 16, 15, 13,
-     17, 25, 34, 34, 30, 15, 13, 4, 6, 11, 17, 15, 13, 6, 5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 2, 3, 2, 3, 2, 3, 2, 2, 8, 14, 20, 32, 31, 25, 14, 9, 10, 16, 23, 41, 41, 36, 21, 15, 8,
-     14, 22, 40, 40, 35, 20, 14, 2, 5, 9, 21, 22, 20, 10, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 1, 1, 1, 1, 0, 1, 2, 2, 6, 4, 5, 3, 1, 8, 10, 19, 27, 31, 31, 17, 11, 10, 13, 23, 41, 45, 47, 22, 14, 9,
-     13, 23, 39, 43, 44, 20, 14, 5, 5, 6, 18, 19, 20, 11, 8, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [1, 1, 1, 1, 2, 2, 2, 1, 1, 1, 1, 6, 8, 9, 5, 3, 5, 5, 10, 30, 33, 31, 17, 7, 8, 9, 16, 45, 46, 46, 19, 10, 8, 8,
-     16, 41, 43, 45, 19, 10, 5, 7, 10, 26, 27, 28, 7, 7, 2, 2, 2, 1, 1, 2, 1, 2, 0, 0, 0, 0, 0, 0, 0, 0],
-    [2, 1, 2, 3, 4, 3, 3, 3, 2, 2, 3, 6, 6, 6, 3, 3, 5, 10, 15, 30, 33, 29, 15, 8, 6, 11, 19, 45, 47, 46, 16, 7, 5, 10,
-     19, 40, 43, 41, 15, 6, 2, 4, 9, 24, 25, 26, 6, 1, 0, 0, 2, 3, 3, 4, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [1, 2, 2, 3, 3, 2, 1, 2, 2, 4, 6, 9, 8, 4, 2, 3, 6, 11, 17, 32, 29, 24, 13, 9, 8, 11, 18, 41, 40, 35, 15, 10, 7, 10,
-     18, 39, 39, 34, 14, 9, 3, 7, 8, 20, 20, 19, 6, 4, 0, 2, 2, 3, 3, 2, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0],
-    [2, 4, 3, 4, 4, 4, 2, 3, 5, 7, 8, 11, 10, 8, 5, 3, 8, 11, 18, 28, 29, 25, 15, 9, 11, 12, 23, 40, 37, 36, 18, 10, 10,
-     11, 20, 34, 35, 35, 17, 9, 6, 6, 9, 18, 16, 18, 8, 5, 2, 2, 2, 3, 2, 2, 2, 2, 1, 1, 1, 1, 0, 0, 0, 1],
-    [2, 4, 4, 4, 4, 4, 2, 1, 3, 7, 7, 7, 9, 7, 6, 4, 11, 14, 16, 24, 28, 25, 17, 10, 11, 15, 20, 36, 40, 33, 20, 13, 13,
-     14, 18, 32, 35, 30, 20, 14, 6, 8, 11, 17, 20, 16, 9, 9, 2, 2, 2, 3, 4, 3, 3, 3, 1, 1, 0, 0, 0, 1, 1, 2],
-    [3, 4, 4, 5, 4, 2, 3, 3, 5, 6, 7, 9, 8, 9, 8, 6, 13, 13, 17, 24, 24, 23, 17, 13, 14, 13, 23, 35, 35, 33, 18, 15, 14,
-     13, 20, 32, 32, 31, 14, 12, 8, 6, 10, 18, 16, 16, 6, 7, 3, 2, 3, 4, 2, 2, 2, 2, 0, 0, 0, 0, 0, 1, 1, 1],
-    [2, 3, 1, 2, 1, 2, 3, 3, 5, 6, 5, 6, 6, 7, 7, 8, 16, 16, 20, 23, 23, 22, 18, 18, 17, 20, 25, 36, 36, 32, 21, 20, 16,
-     17, 23, 34, 34, 29, 19, 18, 5, 7, 8, 18, 16, 14, 10, 8, 0, 2, 2, 4, 2, 3, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [2, 2, 0, 0, 0, 1, 1, 3, 5, 5, 4, 5, 5, 5, 6, 6, 16, 17, 23, 28, 27, 21, 13, 16, 18, 21, 29, 39, 36, 30, 15, 19, 17,
-     18, 28, 38, 35, 28, 13, 19, 7, 9, 14, 22, 20, 17, 6, 9, 0, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1],
-    [3, 2, 1, 0, 0, 2, 2, 2, 5, 4, 4, 4, 7, 7, 6, 5, 14, 14, 25, 31, 33, 21, 10, 14, 16, 17, 31, 42, 43, 28, 13, 16, 14,
-     15, 29, 42, 39, 25, 8, 12, 7, 9, 12, 21, 18, 13, 5, 4, 0, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 0, 1, 1, 1, 0],
-    [1, 0, 1, 1, 1, 1, 1, 1, 6, 3, 5, 4, 6, 4, 6, 5, 12, 11, 26, 33, 35, 23, 14, 11, 13, 15, 33, 43, 46, 30, 17, 12, 11,
-     15, 32, 42, 43, 30, 17, 11, 5, 7, 12, 17, 18, 13, 8, 6, 1, 1, 1, 1, 1, 2, 3, 3, 1, 1, 1, 1, 1, 2, 2, 2],
-    [1, 1, 1, 1, 2, 2, 2, 1, 5, 4, 4, 5, 6, 5, 7, 5, 13, 10, 22, 34, 36, 27, 17, 13, 13, 10, 26, 40, 43, 34, 21, 14, 10,
-     9, 26, 39, 41, 33, 15, 11, 4, 3, 10, 16, 18, 16, 7, 5, 1, 1, 3, 3, 5, 5, 3, 2, 0, 1, 1, 2, 2, 3, 2, 2],
-    [1, 1, 1, 1, 1, 1, 1, 0, 5, 4, 6, 6, 7, 9, 9, 8, 11, 12, 23, 30, 38, 31, 24, 16, 11, 14, 27, 35, 43, 33, 25, 16, 9,
-     12, 24, 34, 41, 30, 22, 13, 2, 5, 11, 16, 18, 12, 7, 5, 0, 1, 2, 5, 4, 4, 2, 2, 0, 0, 1, 3, 3, 3, 1, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 5, 4, 7, 7, 7, 6, 6, 6, 16, 11, 19, 31, 35, 32, 26, 17, 17, 15, 23, 36, 40, 33, 28, 17, 14,
-     13, 20, 33, 38, 32, 26, 15, 4, 7, 10, 12, 13, 7, 7, 4, 0, 2, 3, 4, 4, 4, 3, 1, 0, 0, 1, 2, 3, 3, 2, 0],
-    [2, 0, 1, 1, 1, 0, 2, 2, 5, 1, 3, 4, 4, 3, 4, 4, 12, 10, 21, 32, 38, 29, 23, 16, 13, 14, 28, 40, 44, 33, 27, 18, 9,
-     14, 26, 39, 42, 32, 24, 15, 3, 8, 12, 14, 12, 10, 6, 5, 0, 4, 6, 6, 3, 2, 1, 1, 0, 0, 1, 1, 1, 1, 0, 0],
-    [2, 0, 2, 2, 2, 2, 3, 3, 6, 3, 2, 4, 5, 6, 7, 7, 15, 9, 22, 32, 33, 26, 21, 18, 14, 11, 27, 39, 40, 32, 22, 18, 12,
-     12, 27, 41, 40, 31, 18, 16, 2, 5, 11, 15, 14, 10, 5, 5, 0, 2, 3, 4, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [2, 2, 2, 3, 3, 2, 1, 2, 6, 4, 3, 5, 5, 4, 4, 5, 15, 11, 18, 27, 30, 25, 19, 16, 16, 16, 25, 36, 38, 29, 21, 18, 15,
-     17, 25, 34, 35, 26, 20, 18, 5, 11, 15, 18, 15, 8, 6, 6, 1, 2, 3, 3, 2, 1, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0],
-    [3, 3, 3, 3, 3, 3, 2, 3, 4, 4, 7, 5, 6, 5, 1, 3, 11, 11, 17, 27, 25, 23, 19, 15, 16, 16, 24, 35, 30, 28, 21, 19, 18,
-     17, 25, 36, 30, 28, 23, 20, 10, 11, 16, 18, 13, 11, 7, 10, 3, 3, 5, 4, 2, 3, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0],
-    [3, 3, 3, 1, 3, 3, 3, 1, 4, 4, 4, 4, 5, 5, 5, 4, 12, 13, 14, 16, 21, 24, 19, 17, 20, 20, 22, 26, 30, 33, 25, 23, 22,
-     20, 24, 27, 31, 32, 27, 25, 13, 11, 14, 14, 15, 13, 13, 12, 4, 3, 5, 3, 5, 3, 5, 4, 1, 1, 1, 0, 0, 0, 1, 1],
-    [4, 4, 3, 2, 2, 3, 4, 3, 7, 6, 5, 5, 3, 5, 6, 6, 21, 18, 15, 19, 18, 27, 24, 20, 26, 25, 23, 30, 28, 33, 28, 23, 22,
-     23, 22, 28, 29, 30, 26, 21, 11, 12, 13, 14, 17, 14, 14, 9, 2, 3, 4, 3, 4, 3, 3, 2, 1, 1, 1, 0, 1, 1, 2, 1],
-    [3, 3, 1, 1, 1, 2, 2, 3, 6, 6, 5, 4, 4, 6, 5, 6, 17, 20, 20, 20, 26, 27, 24, 20, 16, 22, 26, 31, 33, 30, 23, 17, 17,
-     21, 25, 31, 34, 30, 24, 17, 7, 12, 16, 20, 17, 12, 7, 3, 3, 3, 4, 3, 2, 1, 1, 1, 2, 2, 2, 0, 1, 1, 1, 1],
-    [2, 2, 1, 3, 4, 4, 3, 4, 7, 7, 6, 5, 7, 6, 5, 9, 16, 22, 21, 24, 30, 27, 24, 20, 16, 22, 27, 34, 37, 31, 27, 18, 17,
-     21, 26, 32, 34, 28, 25, 16, 5, 8, 12, 17, 17, 13, 8, 2, 2, 2, 1, 0, 1, 2, 2, 1, 2, 2, 1, 0, 0, 0, 0, 1],
-    [3, 3, 2, 4, 3, 4, 2, 4, 8, 7, 6, 7, 6, 7, 6, 8, 20, 16, 16, 23, 23, 24, 18, 17, 21, 18, 22, 34, 35, 34, 23, 19, 16,
-     14, 20, 31, 32, 32, 21, 15, 3, 5, 11, 15, 16, 13, 8, 4, 1, 1, 3, 2, 3, 1, 1, 0, 1, 1, 1, 0, 0, 0, 0, 0],
-    [3, 4, 3, 2, 1, 3, 3, 4, 7, 6, 10, 9, 7, 5, 5, 6, 17, 14, 13, 23, 23, 24, 17, 18, 19, 16, 19, 35, 33, 31, 21, 18,
-     15, 15, 18, 34, 32, 30, 19, 15, 5, 8, 12, 21, 19, 18, 9, 3, 1, 1, 3, 3, 3, 3, 1, 0, 1, 1, 1, 1, 0, 0, 0, 0],
-    [4, 4, 3, 2, 2, 2, 3, 3, 8, 7, 6, 8, 9, 8, 7, 7, 17, 16, 16, 24, 24, 23, 14, 17, 19, 20, 25, 33, 32, 30, 18, 18, 16,
-     16, 23, 32, 32, 29, 16, 16, 8, 11, 17, 19, 17, 14, 7, 5, 1, 1, 3, 3, 2, 1, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0],
-    [4, 3, 1, 2, 3, 4, 4, 4, 10, 8, 5, 9, 10, 10, 7, 9, 19, 15, 19, 26, 27, 26, 18, 19, 22, 19, 27, 34, 38, 32, 19, 20,
-     17, 15, 24, 29, 32, 26, 14, 15, 9, 9, 14, 15, 17, 11, 7, 6, 0, 0, 3, 5, 5, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [5, 4, 3, 3, 3, 3, 4, 4, 10, 10, 9, 15, 12, 11, 10, 9, 19, 18, 19, 29, 30, 26, 18, 18, 22, 21, 22, 31, 31, 27, 20,
-     19, 14, 17, 20, 28, 27, 25, 13, 12, 7, 9, 12, 14, 14, 11, 6, 3, 0, 2, 3, 4, 4, 3, 0, 0, 0, 1, 1, 1, 1, 1, 0, 0],
-    [4, 3, 1, 2, 3, 3, 3, 5, 9, 8, 11, 13, 17, 15, 13, 13, 16, 16, 18, 30, 31, 30, 18, 18, 18, 17, 23, 35, 36, 35, 21,
-     19, 13, 12, 14, 28, 27, 29, 12, 12, 7, 6, 6, 8, 9, 9, 4, 6, 1, 2, 1, 3, 4, 4, 1, 1, 0, 1, 1, 1, 1, 0, 0, 0],
-    [4, 5, 4, 4, 3, 3, 3, 3, 10, 9, 9, 10, 13, 15, 14, 11, 18, 16, 20, 31, 35, 32, 22, 20, 19, 19, 23, 34, 37, 34, 24,
-     21, 17, 17, 17, 30, 32, 29, 20, 17, 6, 9, 8, 12, 10, 9, 5, 4, 2, 2, 0, 1, 2, 2, 2, 2, 1, 1, 0, 0, 0, 0, 0, 1],
-    [4, 6, 7, 7, 5, 6, 2, 3, 8, 6, 8, 9, 8, 12, 10, 10, 14, 15, 19, 27, 26, 30, 20, 19, 15, 17, 23, 34, 33, 35, 24, 20,
-     13, 14, 18, 31, 32, 34, 22, 17, 5, 8, 8, 11, 10, 11, 7, 5, 2, 1, 1, 1, 2, 2, 2, 2, 1, 1, 0, 0, 0, 0, 0, 1],
-    [3, 4, 5, 6, 4, 5, 3, 4, 7, 7, 9, 10, 10, 9, 8, 8, 10, 13, 19, 28, 34, 29, 19, 17, 10, 13, 19, 31, 39, 37, 25, 21,
-     9, 12, 16, 27, 36, 33, 22, 18, 4, 4, 5, 11, 13, 14, 9, 8, 2, 1, 1, 2, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0],
-    [5, 5, 4, 6, 5, 5, 1, 4, 5, 6, 8, 11, 12, 10, 8, 6, 11, 10, 18, 28, 32, 32, 20, 12, 11, 10, 19, 31, 36, 40, 28, 16,
-     11, 8, 15, 26, 30, 36, 25, 16, 5, 5, 6, 13, 15, 17, 13, 8, 1, 0, 0, 0, 1, 3, 3, 2, 1, 0, 0, 0, 0, 1, 1, 1],
-    [4, 5, 5, 5, 4, 3, 3, 3, 8, 9, 9, 15, 12, 10, 7, 4, 11, 13, 16, 27, 27, 29, 19, 11, 16, 17, 18, 30, 37, 37, 27, 18,
-     13, 11, 14, 22, 31, 31, 25, 17, 6, 5, 6, 12, 19, 16, 14, 10, 0, 0, 2, 2, 3, 2, 2, 1, 0, 0, 1, 1, 1, 1, 1, 1],
-    [2, 3, 3, 4, 4, 3, 2, 1, 4, 6, 7, 12, 12, 11, 9, 4, 15, 16, 18, 25, 26, 26, 19, 15, 17, 19, 20, 28, 31, 30, 23, 19,
-     15, 14, 16, 23, 29, 28, 21, 18, 9, 10, 10, 11, 13, 10, 9, 8, 1, 1, 2, 3, 4, 2, 1, 0, 0, 0, 1, 1, 1, 0, 0, 0],
-    [2, 2, 5, 5, 5, 5, 3, 2, 4, 7, 11, 11, 11, 11, 5, 3, 14, 18, 24, 26, 32, 29, 18, 13, 21, 25, 25, 27, 34, 30, 22, 19,
-     19, 21, 21, 22, 30, 26, 21, 17, 8, 8, 6, 7, 10, 7, 8, 8, 1, 2, 2, 3, 3, 2, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [5, 4, 5, 5, 4, 4, 5, 5, 9, 7, 11, 15, 15, 11, 10, 6, 20, 18, 22, 30, 29, 25, 20, 14, 22, 21, 22, 31, 33, 28, 22,
-     16, 18, 17, 18, 25, 28, 22, 16, 12, 11, 9, 7, 6, 7, 4, 5, 7, 0, 0, 0, 1, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [5, 3, 3, 3, 3, 3, 4, 4, 13, 10, 14, 14, 17, 12, 14, 10, 23, 17, 21, 25, 31, 28, 25, 21, 23, 18, 22, 26, 32, 29, 28,
-     23, 16, 12, 14, 18, 22, 21, 19, 17, 8, 8, 6, 7, 6, 5, 6, 7, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [2, 1, 2, 3, 3, 3, 4, 3, 15, 9, 13, 16, 19, 19, 17, 12, 22, 13, 18, 26, 29, 34, 30, 24, 25, 16, 17, 25, 29, 34, 32,
-     25, 18, 12, 8, 17, 19, 23, 22, 22, 5, 4, 2, 5, 6, 4, 5, 4, 1, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [4, 3, 4, 3, 5, 3, 5, 4, 10, 9, 10, 14, 18, 16, 16, 11, 20, 18, 14, 23, 30, 29, 27, 27, 20, 19, 16, 25, 31, 31, 27,
-     26, 15, 13, 8, 16, 18, 20, 16, 22, 8, 4, 3, 4, 3, 4, 5, 8, 2, 1, 0, 0, 0, 1, 1, 2, 0, 0, 0, 0, 0, 0, 0, 0],
-    [3, 2, 3, 3, 6, 6, 7, 4, 10, 10, 8, 11, 17, 16, 16, 15, 18, 17, 13, 23, 29, 30, 23, 24, 19, 19, 14, 25, 31, 31, 21,
-     25, 16, 16, 11, 18, 18, 20, 13, 17, 5, 5, 3, 5, 6, 5, 2, 6, 1, 1, 0, 1, 1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [3, 2, 4, 4, 7, 7, 8, 6, 10, 9, 8, 13, 16, 17, 13, 14, 21, 16, 13, 23, 29, 30, 23, 24, 23, 20, 15, 24, 28, 28, 20,
-     24, 15, 15, 13, 18, 21, 19, 14, 14, 8, 9, 8, 8, 9, 6, 3, 7, 1, 2, 1, 2, 1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [5, 3, 5, 6, 7, 7, 7, 7, 11, 9, 9, 12, 12, 15, 14, 13, 23, 18, 17, 26, 26, 26, 25, 25, 26, 22, 17, 26, 26, 24, 28,
-     24, 16, 15, 12, 20, 20, 17, 18, 15, 8, 10, 7, 10, 11, 8, 6, 5, 2, 2, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [4, 4, 6, 8, 8, 7, 4, 4, 12, 7, 7, 12, 15, 15, 13, 13, 21, 14, 16, 23, 25, 22, 24, 23, 20, 15, 15, 24, 28, 25, 26,
-     22, 14, 12, 12, 20, 22, 19, 18, 17, 4, 3, 4, 9, 11, 9, 6, 5, 1, 1, 1, 2, 1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [5, 4, 6, 7, 8, 7, 7, 5, 10, 6, 10, 12, 16, 14, 15, 11, 17, 14, 20, 24, 30, 26, 26, 20, 19, 14, 18, 26, 31, 30, 29,
-     23, 15, 12, 17, 22, 24, 21, 19, 15, 6, 3, 6, 10, 10, 11, 9, 5, 1, 1, 2, 3, 2, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [7, 6, 7, 7, 6, 5, 4, 4, 14, 8, 11, 12, 16, 14, 16, 12, 18, 17, 21, 25, 31, 25, 24, 19, 20, 17, 20, 26, 31, 27, 25,
-     20, 18, 16, 15, 18, 22, 20, 20, 18, 10, 8, 7, 8, 6, 6, 7, 8, 3, 3, 3, 1, 1, 1, 2, 3, 1, 1, 0, 0, 0, 0, 0, 1],
-    [7, 5, 6, 7, 7, 7, 6, 4, 13, 10, 15, 15, 15, 10, 14, 7, 17, 16, 24, 27, 31, 22, 21, 14, 19, 15, 23, 27, 31, 23, 21,
-     19, 17, 15, 18, 17, 19, 16, 14, 18, 11, 8, 8, 5, 3, 5, 6, 11, 3, 2, 2, 1, 0, 2, 3, 4, 1, 1, 1, 1, 0, 1, 1, 2],
-    [5, 4, 6, 5, 7, 6, 7, 4, 8, 8, 13, 17, 20, 15, 11, 6, 15, 13, 24, 31, 34, 25, 20, 12, 20, 15, 23, 30, 31, 24, 22,
-     17, 15, 12, 18, 22, 21, 17, 15, 14, 11, 10, 8, 8, 7, 8, 8, 11, 1, 3, 3, 2, 1, 3, 3, 2, 0, 1, 1, 1, 1, 2, 2, 1],
-    [3, 3, 4, 6, 9, 8, 6, 6, 9, 7, 12, 18, 21, 15, 9, 10, 13, 10, 21, 29, 30, 23, 15, 13, 24, 18, 21, 30, 30, 26, 19,
-     21, 20, 14, 16, 22, 22, 17, 16, 19, 12, 10, 6, 9, 9, 11, 10, 14, 3, 2, 1, 2, 4, 4, 3, 4, 1, 0, 0, 0, 1, 1, 1, 1],
-    [4, 5, 4, 9, 10, 9, 5, 4, 6, 7, 6, 13, 17, 13, 10, 6, 13, 14, 14, 23, 30, 21, 19, 16, 18, 18, 15, 25, 30, 23, 21,
-     22, 16, 17, 13, 17, 22, 17, 19, 20, 13, 10, 5, 8, 8, 9, 13, 16, 6, 5, 2, 2, 2, 3, 5, 7, 0, 0, 0, 1, 2, 2, 2, 1],
-    [4, 5, 5, 6, 8, 7, 7, 4, 8, 4, 10, 14, 18, 17, 14, 9, 10, 5, 17, 24, 28, 26, 20, 13, 15, 10, 21, 26, 29, 28, 22, 19,
-     14, 12, 16, 18, 19, 20, 20, 20, 8, 9, 7, 7, 9, 8, 11, 11, 5, 5, 0, 1, 3, 3, 6, 7, 0, 0, 0, 0, 2, 3, 3, 2],
-    [2, 3, 4, 7, 7, 5, 4, 2, 7, 5, 8, 14, 16, 15, 14, 8, 10, 8, 15, 24, 30, 26, 23, 17, 18, 10, 19, 27, 32, 28, 26, 22,
-     15, 9, 16, 21, 24, 20, 20, 19, 11, 7, 7, 10, 10, 12, 11, 12, 4, 2, 1, 3, 3, 4, 4, 6, 0, 0, 0, 0, 0, 1, 1, 1],
-    [1, 3, 3, 5, 5, 6, 4, 4, 4, 6, 8, 11, 13, 16, 12, 11, 9, 8, 17, 23, 26, 24, 19, 17, 17, 12, 20, 25, 27, 26, 25, 23,
-     16, 11, 16, 19, 20, 16, 16, 19, 12, 10, 9, 9, 7, 8, 8, 11, 5, 5, 2, 3, 3, 4, 2, 5, 1, 0, 0, 0, 0, 1, 1, 1],
-    [1, 3, 3, 5, 4, 6, 4, 3, 7, 7, 7, 10, 14, 16, 16, 11, 11, 11, 17, 24, 27, 24, 20, 16, 18, 18, 21, 27, 32, 26, 23,
-     20, 16, 15, 19, 21, 22, 16, 12, 15, 13, 14, 12, 10, 10, 7, 7, 11, 7, 7, 7, 3, 3, 3, 2, 6, 2, 2, 1, 1, 1, 1, 1, 2],
-    [0, 3, 3, 4, 4, 4, 3, 2, 8, 10, 8, 17, 18, 16, 15, 12, 15, 18, 16, 30, 31, 28, 20, 19, 18, 21, 19, 32, 32, 29, 20,
-     18, 15, 18, 19, 24, 21, 19, 8, 11, 9, 11, 11, 10, 8, 8, 4, 5, 4, 6, 6, 5, 3, 3, 2, 2, 1, 1, 1, 2, 2, 2, 1, 1],
-    [1, 1, 1, 2, 4, 7, 6, 4, 8, 7, 10, 19, 20, 22, 15, 13, 18, 17, 15, 29, 29, 29, 21, 22, 19, 17, 16, 31, 32, 31, 22,
-     24, 13, 14, 15, 23, 22, 17, 14, 15, 6, 8, 8, 7, 7, 6, 5, 7, 3, 4, 4, 4, 4, 3, 3, 3, 0, 1, 1, 1, 1, 1, 0, 0],
-    [3, 0, 0, 2, 4, 6, 7, 5, 12, 4, 8, 17, 19, 21, 17, 17, 20, 9, 13, 30, 32, 33, 25, 22, 20, 10, 14, 29, 30, 30, 24,
-     22, 19, 10, 11, 18, 20, 19, 19, 18, 6, 4, 4, 8, 8, 10, 7, 6, 4, 3, 3, 2, 2, 2, 3, 3, 2, 2, 2, 2, 0, 0, 0, 0],
-    [2, 2, 3, 4, 5, 4, 5, 3, 11, 8, 10, 16, 20, 17, 15, 12, 19, 12, 19, 27, 32, 29, 22, 20, 20, 10, 19, 30, 35, 33, 23,
-     21, 13, 6, 14, 20, 23, 26, 17, 14, 7, 4, 5, 6, 7, 9, 9, 8, 3, 3, 3, 1, 2, 1, 2, 1, 0, 1, 1, 1, 0, 0, 0, 0],
-    [3, 3, 2, 4, 4, 5, 4, 5, 13, 8, 12, 18, 16, 12, 11, 13, 16, 11, 20, 32, 31, 25, 17, 17, 18, 10, 21, 32, 32, 31, 24,
-     22, 12, 6, 15, 20, 23, 25, 19, 16, 7, 3, 6, 7, 10, 14, 11, 8, 3, 2, 4, 3, 3, 3, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0],
-    [4, 5, 4, 6, 5, 7, 5, 5, 8, 8, 11, 17, 18, 14, 10, 7, 11, 10, 19, 29, 34, 25, 15, 11, 13, 10, 18, 32, 36, 32, 22,
-     16, 9, 9, 12, 22, 25, 25, 18, 14, 6, 6, 3, 8, 7, 12, 10, 8, 2, 2, 1, 1, 2, 2, 3, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [4, 3, 4, 5, 5, 4, 4, 4, 7, 4, 12, 19, 20, 16, 10, 6, 12, 10, 20, 33, 34, 27, 19, 12, 11, 12, 22, 36, 36, 29, 20,
-     12, 11, 12, 14, 23, 22, 20, 16, 12, 6, 9, 6, 9, 7, 11, 8, 8, 3, 4, 3, 1, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1],
-    [4, 2, 2, 4, 5, 5, 4, 5, 9, 6, 14, 20, 22, 17, 8, 9, 12, 8, 21, 33, 34, 27, 14, 12, 15, 11, 23, 36, 37, 31, 20, 14,
-     13, 9, 17, 22, 22, 18, 16, 11, 7, 7, 6, 5, 7, 8, 9, 6, 4, 5, 4, 1, 1, 1, 2, 2, 1, 1, 0, 0, 0, 0, 0, 1],
-    [4, 4, 4, 6, 8, 6, 5, 4, 9, 6, 9, 18, 19, 14, 11, 8, 12, 9, 16, 31, 34, 26, 16, 13, 12, 9, 19, 31, 35, 28, 19, 14,
-     11, 10, 17, 22, 28, 22, 15, 11, 6, 5, 7, 6, 12, 10, 10, 5, 3, 3, 3, 1, 3, 2, 2, 1, 0, 0, 1, 1, 1, 0, 0, 0],
-    [5, 5, 4, 7, 8, 7, 6, 6, 11, 8, 6, 12, 17, 15, 15, 14, 15, 13, 14, 29, 32, 30, 22, 19, 15, 15, 16, 28, 35, 32, 25,
-     22, 10, 11, 14, 21, 25, 24, 18, 15, 5, 6, 8, 8, 12, 11, 10, 9, 2, 3, 3, 3, 3, 3, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0],
-    [5, 4, 4, 7, 8, 8, 7, 5, 9, 8, 10, 11, 12, 14, 12, 12, 11, 13, 20, 24, 26, 26, 21, 19, 13, 12, 19, 28, 29, 30, 24,
-     22, 10, 10, 13, 24, 23, 21, 18, 16, 8, 6, 5, 11, 10, 11, 11, 10, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1],
-    [4, 5, 5, 6, 7, 7, 5, 5, 10, 10, 9, 10, 10, 11, 10, 11, 14, 15, 20, 24, 26, 24, 17, 16, 16, 14, 21, 30, 29, 29, 21,
-     21, 12, 12, 16, 24, 23, 25, 16, 16, 7, 5, 4, 12, 10, 14, 9, 11, 3, 3, 2, 4, 2, 3, 3, 3, 1, 0, 0, 0, 0, 1, 1, 1],
-    [5, 6, 5, 5, 5, 6, 5, 5, 9, 10, 11, 9, 8, 10, 10, 10, 16, 14, 23, 25, 25, 26, 19, 17, 19, 15, 23, 29, 26, 30, 21,
-     20, 15, 12, 17, 24, 24, 28, 19, 17, 8, 6, 4, 9, 8, 12, 10, 11, 2, 3, 2, 3, 2, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0],
-    [4, 4, 5, 5, 5, 4, 4, 3, 10, 10, 13, 15, 13, 10, 8, 7, 19, 17, 21, 27, 26, 27, 18, 16, 23, 20, 23, 29, 27, 28, 21,
-     18, 18, 16, 18, 23, 24, 26, 22, 16, 8, 10, 9, 11, 8, 9, 10, 9, 0, 3, 4, 4, 3, 1, 1, 0, 0, 1, 1, 1, 0, 0, 0, 0],
-    [4, 4, 5, 3, 4, 5, 4, 3, 9, 8, 13, 14, 13, 11, 8, 6, 17, 18, 20, 25, 23, 23, 21, 16, 20, 21, 23, 28, 27, 24, 23, 19,
-     16, 17, 20, 25, 25, 22, 21, 18, 7, 9, 9, 10, 10, 8, 6, 6, 0, 2, 3, 3, 3, 2, 2, 0, 1, 1, 1, 1, 1, 1, 1, 1],
-    [6, 4, 4, 4, 5, 5, 6, 6, 8, 8, 7, 10, 11, 11, 9, 9, 14, 14, 18, 22, 26, 26, 20, 17, 17, 17, 22, 24, 29, 28, 20, 16,
-     13, 15, 20, 21, 24, 24, 17, 12, 6, 8, 9, 7, 9, 8, 5, 3, 1, 1, 1, 2, 2, 2, 2, 1, 1, 1, 1, 0, 1, 1, 1, 0],
-    [8, 6, 3, 1, 5, 4, 8, 8, 9, 8, 6, 10, 15, 12, 12, 10, 15, 14, 19, 23, 30, 27, 24, 16, 15, 15, 24, 31, 31, 28, 21,
-     11, 12, 12, 22, 27, 27, 24, 18, 9, 5, 6, 8, 14, 12, 12, 8, 4, 2, 3, 3, 3, 2, 2, 2, 1, 1, 1, 1, 2, 2, 2, 1, 0],
-    [6, 4, 1, 2, 6, 6, 9, 6, 8, 5, 8, 12, 16, 14, 10, 7, 16, 14, 23, 28, 32, 24, 15, 11, 15, 13, 28, 33, 38, 30, 14, 8,
-     14, 13, 23, 25, 28, 21, 11, 8, 6, 6, 10, 12, 12, 10, 5, 5, 2, 2, 2, 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 1, 0, 0],
-    [6, 4, 4, 1, 5, 6, 7, 5, 7, 7, 12, 14, 18, 13, 9, 7, 17, 14, 22, 27, 32, 23, 18, 15, 16, 15, 24, 30, 36, 24, 21, 17,
-     14, 13, 20, 21, 26, 18, 18, 14, 8, 7, 10, 8, 12, 8, 10, 9, 3, 3, 1, 0, 1, 1, 1, 3, 1, 1, 1, 0, 0, 0, 0, 1],
-    [2, 3, 5, 5, 7, 6, 4, 2, 5, 6, 9, 14, 16, 13, 11, 6, 17, 16, 20, 27, 29, 26, 23, 20, 18, 17, 18, 28, 34, 29, 25, 22,
-     17, 16, 16, 21, 26, 24, 20, 21, 9, 9, 6, 9, 13, 12, 10, 10, 2, 2, 2, 1, 1, 1, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0],
-    [4, 4, 7, 6, 8, 5, 6, 2, 6, 5, 7, 11, 15, 13, 14, 11, 18, 15, 14, 21, 25, 26, 23, 21, 18, 16, 13, 22, 25, 27, 21,
-     22, 18, 15, 11, 16, 18, 22, 18, 18, 6, 6, 4, 6, 8, 9, 7, 6, 4, 4, 4, 2, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [5, 4, 8, 6, 9, 7, 7, 4, 10, 6, 8, 11, 13, 15, 15, 12, 17, 15, 16, 21, 26, 27, 25, 22, 20, 15, 14, 22, 26, 28, 26,
-     24, 13, 13, 11, 17, 22, 22, 19, 15, 5, 6, 6, 10, 9, 9, 7, 4, 4, 4, 3, 3, 2, 1, 2, 2, 0, 1, 1, 1, 0, 0, 0, 0]]
 
-example_viewport = [
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1,
-     0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0,
-     0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0,
-     0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0,
-     0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0,
-     1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0,
-     1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0,
-     1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1,
-     1, 1, 0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1,
-     1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1,
-     1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 0,
-     1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0,
-     0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1,
-     0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1,
-     1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1,
-     1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1,
-     1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1,
-     1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1,
-     1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0,
-     1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0,
-     1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0,
-     0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0,
-     0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0,
-     1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0,
-     1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0,
-     1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0,
-     0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0,
-     0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1, 0,
-     0, 0, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0,
-     0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1,
-     0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1,
-     0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1,
-     0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1,
-     0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1,
-     0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1, 0,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0,
-     0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0,
-     1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1,
-     1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1,
-     1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0,
-     1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0,
-     0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1,
-     1, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1,
-     1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1,
-     1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1,
-     1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1,
-     1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1,
-     1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1,
-     1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1,
-     1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1,
-     1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1,
-     1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1,
-     1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0,
-     1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1, 0, 0,
-     0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0,
-     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1,
-     1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]]
+def source_key() -> list:
+    status = os.stat(source)
+    return [status.st_mtime_ns, status.st_size]
+
+
+def read_cache(key: list):
+    try:
+        with open(cache, "rb") as f:
+            cached_key, values = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return values if cached_key == key else None
+
+
+def write_cache(key: list, values: dict):
+    # written to a file of this process and renamed, so concurrent processes never read a partial cache
+    temporary = "%s.%d" % (cache, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        with open(temporary, "wb") as f:
+            marshal.dump((key, values), f)
+        os.replace(temporary, cache)
+    except OSError:
+        # read only installation, the next process runs values_data again
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def load() -> dict:
+    key = source_key()
+    values = read_cache(key)
+    if values is None:
+        import seminar.values_data
+        values = {name: getattr(seminar.values_data, name) for name in names}
+        write_cache(key, values)
+    return values
+
+
+def __getattr__(name: str):
+    if name not in names:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals().update(load())
+    return globals()[name]
+
+
+def __dir__():
+    return list(globals()) + names